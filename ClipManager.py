@@ -4,9 +4,103 @@ Manages ClipSlot, Clip and Scene functionality
 Based on Live Object Model: ClipSlot, Clip, Scene
 """
 
+import functools
+import math
+import os
+import struct
+from itertools import islice
+
 from .consts import *
 from .MIDIUtils import SysExEncoder, ColorUtils, ColorEncoder
 
+# Lookup table: 8-bit color channel -> clamped 7-bit MIDI value (halve + clamp fused)
+_RGB_TO_MIDI = bytes(min(127, i >> 1) for i in range(256))
+
+# Fixed-layout payload packers (one C-level call per send)
+_PAY_2B = struct.Struct('BB')
+_PAY_3B = struct.Struct('BBB')
+_PAY_4B = struct.Struct('BBBB')
+
+# Incoming MIDI clip payload decoders (16-bit times are big-endian byte pairs)
+_MIDI_ADD_STRUCT = struct.Struct('>BBBBHH')        # track, scene, pitch, vel, start_ms, dur_ms
+_MIDI_ADD_SHORT_STRUCT = struct.Struct('>BBBBH')   # same, without duration
+_MIDI_REMOVE_STRUCT = struct.Struct('>BBHH')       # track, scene, start_ms, end_ms
+
+# Outgoing note record: pitch, start hi/lo, duration hi/lo, velocity (7-bit each)
+_NOTE_PACK = struct.Struct('6B')
+
+# 14-bit value -> (MSB, LSB) pair, stored as consecutive bytes at offset value * 2
+_SPLIT14 = bytes(b for i in range(16384) for b in ((i >> 7) & 0x7F, i & 0x7F))
+
+# Cached clip kinds (resolved once per clip slot content)
+_CLIP_KIND_AUDIO = 0
+_CLIP_KIND_MIDI = 1
+_CLIP_KIND_UNKNOWN = 2
+
+# Clip capability bits (which optional properties the clip exposes)
+_CAP_LOOPING = 0x01
+_CAP_MUTED = 0x02
+_CAP_LOOP_START = 0x04
+_CAP_LOOP_END = 0x08
+_CAP_LENGTH = 0x10
+_CAP_WARPING = 0x20       # audio clips only
+_CAP_START_MARKER = 0x40  # audio clips only
+_CAP_END_MARKER = 0x80    # audio clips only
+_CAP_ATTRS = (
+    (_CAP_LOOPING, 'looping'),
+    (_CAP_MUTED, 'muted'),
+    (_CAP_LOOP_START, 'loop_start'),
+    (_CAP_LOOP_END, 'loop_end'),
+    (_CAP_LENGTH, 'length'),
+)
+_CAP_AUDIO_ATTRS = (
+    (_CAP_WARPING, 'warping'),
+    (_CAP_START_MARKER, 'start_marker'),
+    (_CAP_END_MARKER, 'end_marker'),
+)
+
+
+def _split_beats(value):
+    """Split a beat position into 7-bit (beats, fraction/127) bytes with one modf call"""
+    frac, whole = math.modf(value)
+    return int(whole) & 0x7F, int(frac * 127.0) & 0x7F
+
+
+@functools.lru_cache(maxsize=256)
+def _live_color_to_rgb_cached(live_color):
+    """ColorUtils.live_color_to_rgb memoized by raw Live color (sets use a small palette)"""
+    return ColorUtils.live_color_to_rgb(live_color)
+
+
+# Marks a slot whose last complete-state send was an empty slot
+_EMPTY_SLOT = object()
+
+
+class ClipSnapshot:
+    """Plain copy of a clip's properties, read once from the Live API (None = not available)"""
+    __slots__ = ('name', 'looping', 'muted', 'loop_start', 'loop_end', 'length',
+                 'is_audio', 'warping', 'start_marker', 'end_marker')
+
+    def __init__(self, clip=None, is_audio=False, caps=0):
+        if clip is not None:
+            self.fill(clip, is_audio, caps)
+
+    def fill(self, clip, is_audio, caps):
+        """(Re)read the clip's properties allowed by caps (_CAP_* bits) and return self"""
+        self.name = clip.name
+        self.looping = clip.looping if caps & _CAP_LOOPING else None
+        self.muted = clip.muted if caps & _CAP_MUTED else None
+        self.loop_start = clip.loop_start if caps & _CAP_LOOP_START else None
+        self.loop_end = clip.loop_end if caps & _CAP_LOOP_END else None
+        self.length = clip.length if caps & _CAP_LENGTH else None
+        self.is_audio = is_audio
+        # Audio clip specific properties (bits are never set for non-audio clips)
+        self.warping = clip.warping if caps & _CAP_WARPING else None
+        self.start_marker = clip.start_marker if caps & _CAP_START_MARKER else None
+        self.end_marker = clip.end_marker if caps & _CAP_END_MARKER else None
+        return self
+
+
 class ClipManager:
     """
     Manages all Clip and Scene level listeners and handlers
@@ -18,8 +112,18 @@ class ClipManager:
         self.song = control_surface.song()
         self._clip_listeners = {}  # (track_idx, scene_idx): [listeners]
         self._scene_listeners = {}  # scene_idx: [listeners]
+        self._song_listeners = []   # [(listener_type, func)] on song tracks/scenes (cache invalidation)
+        self._clip_slot_sources = {}  # (track_idx, scene_idx): clip slot obj the listeners are on
+        self._scene_sources = {}      # scene_idx: scene obj the listeners are on
         self._clip_content_sources = {}  # (track_idx, scene_idx): clip obj
         self._clip_sample_sources = {}   # (track_idx, scene_idx): sample obj
+        self._clip_kinds = {}            # (track_idx, scene_idx): (clip obj, _CLIP_KIND_*), monitored slots only
+        self._clip_caps = {}             # (track_idx, scene_idx): (clip obj, _CAP_* bitmask), monitored slots only
+        self._last_sent_clip = {}        # (track_idx, scene_idx): ClipSnapshot or _EMPTY_SLOT
+        self._snapshot_spares = {}       # (track_idx, scene_idx): reusable ClipSnapshot
+        self._last_sent_scene = {}       # scene_idx: (name, color_rgb, is_triggered)
+        self._monitored_region = None    # (track_start, track_end, scene_start, scene_end) last ensured
+        self._has_clip_slots = set()     # (track_idx, scene_idx) of monitored slots holding a clip
         self._is_active = False
         self._track_last_playing = {}
 
@@ -33,6 +137,26 @@ class ClipManager:
         self._position_values = {}     # (track_idx, scene_idx): current_position
         self._position_last_sent = {}  # (track_idx, scene_idx): timestamp_ms
         self._position_interval_ms = 50 # 20Hz update rate (similar to metering)
+
+        # Deferred listener sends, drained once per Live scheduler tick
+        self._dirty_clips = set()   # (track_idx, scene_idx) needing state + pad update
+        self._dirty_scenes = set()  # scene_idx needing scene state
+
+        # Grid send coalescing (at most one grid frame per display tick)
+        self._grid_dirty = False
+        self._grid_pending_window = (None, None)  # (track_start, scene_start)
+        self._last_grid_frame = None  # packed colors of the last grid frame sent
+
+        # Reused encode buffer for CMD_MIDI_NOTES responses (grown on demand)
+        self._notes_buffer = bytearray(3 + _NOTE_PACK.size * 10)
+
+        # Incoming MIDI clip commands: command -> (handler, minimum payload length)
+        self._midi_dispatch = {
+            CMD_MIDI_NOTE_ADD: (self._handle_midi_note_add, 6),
+            CMD_MIDI_NOTE_REMOVE: (self._handle_midi_note_remove, 6),
+            CMD_MIDI_CLIP_QUANTIZE: (self._handle_midi_clip_quantize, 3),
+            CMD_MIDI_NOTES: (self._handle_midi_notes_request, 2),
+        }
     
     def setup_listeners(self, max_tracks=8, max_scenes=8):
         """Setup clip and scene listeners"""
@@ -51,6 +175,15 @@ class ClipManager:
             for scene_idx in range(min(max_scenes, len(self.song.scenes))):
                 self._setup_single_scene_listeners(scene_idx)
             
+            # Track/scene list changes invalidate the cached slot and scene objects (even while disconnected)
+            tracks_listener = lambda: self._on_song_structure_changed()
+            self.song.add_tracks_listener(tracks_listener)
+            self._song_listeners.append(('tracks', tracks_listener))
+            
+            scenes_listener = lambda: self._on_song_structure_changed()
+            self.song.add_scenes_listener(scenes_listener)
+            self._song_listeners.append(('scenes', scenes_listener))
+            
             self._is_active = True
             self.c_surface.log_message(f"✅ Clip listeners setup for {len(self._clip_listeners)} clips, {len(self._scene_listeners)} scenes")
             
@@ -104,10 +237,14 @@ class ClipManager:
 
             # === CLIP LISTENERS (if clip exists) ===
             if clip_slot.has_clip:
+                self._has_clip_slots.add(clip_key)
                 self._setup_clip_content_listeners(track_idx, scene_idx, clip_slot.clip, listeners)
+            else:
+                self._has_clip_slots.discard(clip_key)
             
             # Store all listeners for this clip
             self._clip_listeners[clip_key] = listeners
+            self._clip_slot_sources[clip_key] = clip_slot
             
         except Exception as e:
             self.c_surface.log_message(f"❌ Error setting up clip T{track_idx}S{scene_idx} listeners: {e}")
@@ -118,6 +255,9 @@ class ClipManager:
             clip_key = (track_idx, scene_idx)
             self._clip_content_sources[clip_key] = clip
             self._clip_sample_sources.pop(clip_key, None)
+            self._clip_kinds.pop(clip_key, None)
+            self._clip_caps.pop(clip_key, None)
+            is_audio = self._clip_kind(track_idx, scene_idx, clip) == _CLIP_KIND_AUDIO
             # Clip name
             name_listener = lambda t_idx=track_idx, s_idx=scene_idx: self._on_clip_name_changed(t_idx, s_idx)
             clip.add_name_listener(name_listener)
@@ -143,11 +283,11 @@ class ClipManager:
             # Warping (for audio clips only)
             # Note: warping property exists but add_warping_listener does not exist in Live API
             # We track warping state through periodic checks or other clip listeners
-            if self._is_audio_clip(clip) and hasattr(clip, 'warping'):
+            if is_audio and hasattr(clip, 'warping'):
                 self.c_surface.log_message(f"ℹ️ Warping property available for T{track_idx}S{scene_idx}: {clip.warping}")
             
             # Sample class listeners (for audio clips with samples)
-            if self._is_audio_clip(clip) and hasattr(clip, 'sample') and clip.sample:
+            if is_audio and hasattr(clip, 'sample') and clip.sample:
                 self._clip_sample_sources[clip_key] = clip.sample
                 self._setup_sample_listeners(track_idx, scene_idx, clip.sample, listeners)
             
@@ -243,6 +383,7 @@ class ClipManager:
             
             # Store all listeners for this scene
             self._scene_listeners[scene_idx] = listeners
+            self._scene_sources[scene_idx] = scene
             
         except Exception as e:
             self.c_surface.log_message(f"❌ Error setting up scene S{scene_idx} listeners: {e}")
@@ -378,15 +519,68 @@ class ClipManager:
         self._clip_listeners[clip_key] = remaining_listeners
         self._clip_content_sources.pop(clip_key, None)
         self._clip_sample_sources.pop(clip_key, None)
+        self._clip_kinds.pop(clip_key, None)
+        self._clip_caps.pop(clip_key, None)
         self._position_values.pop(clip_key, None)
         self._position_last_sent.pop(clip_key, None)
     
+    def _remove_single_clip_listeners(self, track_idx, scene_idx):
+        """Remove all listeners for one slot from the objects they were added to"""
+        clip_key = (track_idx, scene_idx)
+        self._teardown_clip_content_listeners(track_idx, scene_idx)
+
+        slot_removers = {
+            'has_clip': 'remove_has_clip_listener',
+            'playing_status': 'remove_playing_status_listener',
+            'fired_slot': 'remove_fired_slot_listener',
+            'has_stop_button': 'remove_has_stop_button_listener',
+            'is_recording': 'remove_is_recording_listener',
+        }
+        clip_slot = self._clip_slot_sources.pop(clip_key, None)
+        for listener_type, listener_func in self._clip_listeners.pop(clip_key, ()):
+            remover = getattr(clip_slot, slot_removers.get(listener_type, ''), None)
+            if remover:
+                try:
+                    remover(listener_func)
+                except Exception:
+                    pass  # Ignore if already removed
+
+        self._has_clip_slots.discard(clip_key)
+        self._last_sent_clip.pop(clip_key, None)
+        self._snapshot_spares.pop(clip_key, None)
+        self._dirty_clips.discard(clip_key)
+
+    def _remove_single_scene_listeners(self, scene_idx):
+        """Remove all listeners for one scene from the scene they were added to"""
+        scene = self._scene_sources.pop(scene_idx, None)
+        for listener_type, listener_func in self._scene_listeners.pop(scene_idx, ()):
+            remover = getattr(scene, f"remove_{listener_type}_listener", None)
+            if remover:
+                try:
+                    remover(listener_func)
+                except Exception:
+                    pass  # Ignore if already removed
+
+        self._last_sent_scene.pop(scene_idx, None)
+        self._dirty_scenes.discard(scene_idx)
+
     def cleanup_listeners(self):
         """Remove all clip and scene listeners"""
         if not self._is_active:
             return
             
         try:
+            # Clean up song tracks/scenes listeners
+            for listener_type, listener_func in self._song_listeners:
+                try:
+                    if listener_type == 'tracks':
+                        self.song.remove_tracks_listener(listener_func)
+                    elif listener_type == 'scenes':
+                        self.song.remove_scenes_listener(listener_func)
+                except:
+                    pass  # Ignore if already removed
+            self._song_listeners = []
+            
             # Clean up clip listeners
             for (track_idx, scene_idx), listeners in self._clip_listeners.items():
                 if (track_idx < len(self.song.tracks) and 
@@ -452,8 +646,20 @@ class ClipManager:
                             pass  # Ignore if already removed
             
             self._clip_listeners = {}
+            self._clip_slot_sources = {}
+            self._scene_sources = {}
             self._clip_content_sources = {}
             self._clip_sample_sources = {}
+            self._clip_kinds = {}
+            self._clip_caps = {}
+            self._last_sent_clip = {}
+            self._snapshot_spares = {}
+            self._last_sent_scene = {}
+            self._last_grid_frame = None
+            self._monitored_region = None
+            self._has_clip_slots.clear()
+            self._dirty_clips.clear()
+            self._dirty_scenes.clear()
             self._scene_listeners = {}
             self._is_active = False
             self.c_surface.log_message("✅ Clip and scene listeners cleaned up")
@@ -471,14 +677,25 @@ class ClipManager:
     
     def _on_clip_has_clip_changed(self, track_idx, scene_idx):
         """Clip added or removed from slot"""
+        # Keep the has_clip cache in sync for _clip_exists (even while disconnected)
+        clip_key = (track_idx, scene_idx)
+        if self._clip_exists_live(track_idx, scene_idx):
+            self._has_clip_slots.add(clip_key)
+        else:
+            self._has_clip_slots.discard(clip_key)
+        # The slot's clip was added/replaced/removed: its kind and capabilities must be re-probed
+        self._clip_kinds.pop(clip_key, None)
+        self._clip_caps.pop(clip_key, None)
+
         if self.c_surface._is_connected:
-            self.c_surface.log_message(f"🎵 Clip slot T{track_idx}S{scene_idx} has_clip changed")
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"🎵 Clip slot T{track_idx}S{scene_idx} has_clip changed")
             
             # Re-setup listeners if clip was added
             if (track_idx < len(self.song.tracks) and 
                 scene_idx < len(self.song.scenes)):
                 
-                clip_slot = self.song.tracks[track_idx].clip_slots[scene_idx]
+                clip_slot = self._clip_slot(track_idx, scene_idx)
                 clip_key = (track_idx, scene_idx)
 
                 if clip_key not in self._clip_listeners:
@@ -495,21 +712,20 @@ class ClipManager:
                 else:
                     # Clip removed, push empty name to clear label
                     self._send_clip_name(track_idx, scene_idx, "")
-            self._send_clip_state(track_idx, scene_idx)
-            self._send_single_pad_update(track_idx, scene_idx)
+            self._mark_clip_dirty(track_idx, scene_idx)
     
     def _on_clip_playing_changed(self, track_idx, scene_idx):
         """Clip playing status changed"""
         if self.c_surface._is_connected:
-            self.c_surface.log_message(f"▶️ Clip T{track_idx}S{scene_idx} playing status changed")
-            self._send_clip_state(track_idx, scene_idx)
-            self._send_single_pad_update(track_idx, scene_idx)
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"▶️ Clip T{track_idx}S{scene_idx} playing status changed")
+            self._mark_clip_dirty(track_idx, scene_idx)
     
     def _on_clip_fired_changed(self, track_idx, scene_idx):
         """Handle clip fired/queued status change"""
         try:
             if self._is_valid_position(track_idx, scene_idx):
-                clip_slot = self.song.tracks[track_idx].clip_slots[scene_idx]
+                clip_slot = self._clip_slot(track_idx, scene_idx)
                 is_fired = getattr(clip_slot, 'is_fired', False)
                 
                 # Send clip queued state to hardware
@@ -525,7 +741,7 @@ class ClipManager:
         """Handle stop button availability change"""
         try:
             if self._is_valid_position(track_idx, scene_idx):
-                clip_slot = self.song.tracks[track_idx].clip_slots[scene_idx]
+                clip_slot = self._clip_slot(track_idx, scene_idx)
                 has_stop_button = getattr(clip_slot, 'has_stop_button', False)
                 
                 # Send stop button state to hardware
@@ -539,69 +755,78 @@ class ClipManager:
     def _on_clip_name_changed(self, track_idx, scene_idx):
         """Clip name changed"""
         if self.c_surface._is_connected and self._clip_exists(track_idx, scene_idx):
-            clip = self.song.tracks[track_idx].clip_slots[scene_idx].clip
-            self.c_surface.log_message(f"📝 Clip T{track_idx}S{scene_idx} name: '{clip.name}'")
+            clip = self._clip_slot(track_idx, scene_idx).clip
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"📝 Clip T{track_idx}S{scene_idx} name: '{clip.name}'")
             self._send_clip_name(track_idx, scene_idx, clip.name)
     
     def _on_clip_color_changed(self, track_idx, scene_idx):
         """Clip color changed"""
         if self.c_surface._is_connected and self._clip_exists(track_idx, scene_idx):
-            clip = self.song.tracks[track_idx].clip_slots[scene_idx].clip
-            color_rgb = ColorUtils.live_color_to_rgb(clip.color)
-            self.c_surface.log_message(f"🎨 Clip T{track_idx}S{scene_idx} color: {color_rgb}")
+            clip = self._clip_slot(track_idx, scene_idx).clip
+            color_rgb = _live_color_to_rgb_cached(clip.color)
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"🎨 Clip T{track_idx}S{scene_idx} color: {color_rgb}")
             self._send_clip_state(track_idx, scene_idx)  # Send full state with new color
             self._send_single_pad_update(track_idx, scene_idx)
     
     def _on_clip_loop_changed(self, track_idx, scene_idx):
         """Clip loop state changed"""
         if self.c_surface._is_connected and self._clip_exists(track_idx, scene_idx):
-            clip = self.song.tracks[track_idx].clip_slots[scene_idx].clip
-            loop_state = clip.looping if hasattr(clip, 'looping') else False
-            self.c_surface.log_message(f"🔄 Clip T{track_idx}S{scene_idx} loop: {loop_state}")
+            clip = self._clip_slot(track_idx, scene_idx).clip
+            loop_state = getattr(clip, 'looping', False)
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"🔄 Clip T{track_idx}S{scene_idx} loop: {loop_state}")
             self._send_clip_loop_state(track_idx, scene_idx, loop_state)
     
     def _on_clip_muted_changed(self, track_idx, scene_idx):
         """Clip muted state changed"""
         if self.c_surface._is_connected and self._clip_exists(track_idx, scene_idx):
-            clip = self.song.tracks[track_idx].clip_slots[scene_idx].clip
-            muted_state = clip.muted if hasattr(clip, 'muted') else False
-            self.c_surface.log_message(f"🔇 Clip T{track_idx}S{scene_idx} muted: {muted_state}")
+            clip = self._clip_slot(track_idx, scene_idx).clip
+            muted_state = getattr(clip, 'muted', False)
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"🔇 Clip T{track_idx}S{scene_idx} muted: {muted_state}")
             self._send_clip_muted_state(track_idx, scene_idx, muted_state)
     
     def _on_clip_warp_changed(self, track_idx, scene_idx):
         """Clip warp state changed"""
         if self.c_surface._is_connected and self._clip_exists(track_idx, scene_idx):
-            clip = self.song.tracks[track_idx].clip_slots[scene_idx].clip
+            clip = self._clip_slot(track_idx, scene_idx).clip
             # Only check warping for audio clips
             warp_state = False
-            if self._is_audio_clip(clip) and hasattr(clip, 'warping'):
+            if (self._clip_kind(track_idx, scene_idx, clip) == _CLIP_KIND_AUDIO and
+                    hasattr(clip, 'warping')):
                 warp_state = clip.warping
-            self.c_surface.log_message(f"🌊 Clip T{track_idx}S{scene_idx} warp: {warp_state}")
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"🌊 Clip T{track_idx}S{scene_idx} warp: {warp_state}")
             self._send_clip_warp_state(track_idx, scene_idx, warp_state)
     
     def _on_clip_start_marker_changed(self, track_idx, scene_idx):
         """Clip start marker changed"""
         if self.c_surface._is_connected and self._clip_exists(track_idx, scene_idx):
-            clip = self.song.tracks[track_idx].clip_slots[scene_idx].clip
-            start_marker = clip.start_marker if hasattr(clip, 'start_marker') else 0.0
-            self.c_surface.log_message(f"⏪ Clip T{track_idx}S{scene_idx} start: {start_marker:.2f}")
+            clip = self._clip_slot(track_idx, scene_idx).clip
+            start_marker = getattr(clip, 'start_marker', 0.0)
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"⏪ Clip T{track_idx}S{scene_idx} start: {start_marker:.2f}")
             self._send_clip_start_marker(track_idx, scene_idx, start_marker)
     
     def _on_clip_end_marker_changed(self, track_idx, scene_idx):
         """Clip end marker changed"""
         if self.c_surface._is_connected and self._clip_exists(track_idx, scene_idx):
-            clip = self.song.tracks[track_idx].clip_slots[scene_idx].clip
-            end_marker = clip.end_marker if hasattr(clip, 'end_marker') else 0.0
-            self.c_surface.log_message(f"⏩ Clip T{track_idx}S{scene_idx} end: {end_marker:.2f}")
+            clip = self._clip_slot(track_idx, scene_idx).clip
+            end_marker = getattr(clip, 'end_marker', 0.0)
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"⏩ Clip T{track_idx}S{scene_idx} end: {end_marker:.2f}")
             self._send_clip_end_marker(track_idx, scene_idx, end_marker)
 
     def _on_clip_recording_changed(self, track_idx, scene_idx):
         """ClipSlot recording state changed (critical for visual feedback)"""
         if self.c_surface._is_connected:
             try:
-                clip_slot = self.song.tracks[track_idx].clip_slots[scene_idx]
-                is_recording = clip_slot.is_recording if hasattr(clip_slot, 'is_recording') else False
-                self.c_surface.log_message(f"⏺️ Clip T{track_idx}S{scene_idx} recording: {is_recording}")
+                clip_slot = self._clip_slot(track_idx, scene_idx)
+                is_recording = getattr(clip_slot, 'is_recording', False)
+                if LOG_LISTENER_EVENTS:
+                    self.c_surface.log_message(f"⏺️ Clip T{track_idx}S{scene_idx} recording: {is_recording}")
                 self._send_clip_recording_state(track_idx, scene_idx, is_recording)
             except Exception as e:
                 self.c_surface.log_message(f"❌ Error in recording handler T{track_idx}S{scene_idx}: {e}")
@@ -609,25 +834,28 @@ class ClipManager:
     def _on_clip_loop_start_changed(self, track_idx, scene_idx):
         """Clip loop start position changed"""
         if self.c_surface._is_connected and self._clip_exists(track_idx, scene_idx):
-            clip = self.song.tracks[track_idx].clip_slots[scene_idx].clip
-            loop_start = clip.loop_start if hasattr(clip, 'loop_start') else 0.0
-            self.c_surface.log_message(f"🔁 Clip T{track_idx}S{scene_idx} loop start: {loop_start:.2f}")
+            clip = self._clip_slot(track_idx, scene_idx).clip
+            loop_start = getattr(clip, 'loop_start', 0.0)
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"🔁 Clip T{track_idx}S{scene_idx} loop start: {loop_start:.2f}")
             self._send_clip_loop_start(track_idx, scene_idx, loop_start)
 
     def _on_clip_loop_end_changed(self, track_idx, scene_idx):
         """Clip loop end position changed"""
         if self.c_surface._is_connected and self._clip_exists(track_idx, scene_idx):
-            clip = self.song.tracks[track_idx].clip_slots[scene_idx].clip
-            loop_end = clip.loop_end if hasattr(clip, 'loop_end') else 0.0
-            self.c_surface.log_message(f"🔁 Clip T{track_idx}S{scene_idx} loop end: {loop_end:.2f}")
+            clip = self._clip_slot(track_idx, scene_idx).clip
+            loop_end = getattr(clip, 'loop_end', 0.0)
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"🔁 Clip T{track_idx}S{scene_idx} loop end: {loop_end:.2f}")
             self._send_clip_loop_end(track_idx, scene_idx, loop_end)
 
     def _on_clip_length_changed(self, track_idx, scene_idx):
         """Clip length changed"""
         if self.c_surface._is_connected and self._clip_exists(track_idx, scene_idx):
-            clip = self.song.tracks[track_idx].clip_slots[scene_idx].clip
-            length = clip.length if hasattr(clip, 'length') else 0.0
-            self.c_surface.log_message(f"📏 Clip T{track_idx}S{scene_idx} length: {length:.2f} beats")
+            clip = self._clip_slot(track_idx, scene_idx).clip
+            length = getattr(clip, 'length', 0.0)
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"📏 Clip T{track_idx}S{scene_idx} length: {length:.2f} beats")
             self._send_clip_length(track_idx, scene_idx, length)
 
     def _on_clip_playing_position_changed(self, track_idx, scene_idx):
@@ -637,11 +865,11 @@ class ClipManager:
 
         try:
             import time
-            clip = self.song.tracks[track_idx].clip_slots[scene_idx].clip
+            clip = self._clip_slot(track_idx, scene_idx).clip
             current_time_ms = int(time.time() * 1000)
 
             # Get current playing position (0.0 to clip.length)
-            position = clip.playing_position if hasattr(clip, 'playing_position') else 0.0
+            position = getattr(clip, 'playing_position', 0.0)
 
             clip_key = (track_idx, scene_idx)
             if clip_key not in self._position_values:
@@ -669,61 +897,68 @@ class ClipManager:
     def _on_sample_name_changed(self, track_idx, scene_idx):
         """Sample name changed"""
         if self.c_surface._is_connected and self._clip_exists(track_idx, scene_idx):
-            clip = self.song.tracks[track_idx].clip_slots[scene_idx].clip
+            clip = self._clip_slot(track_idx, scene_idx).clip
             if hasattr(clip, 'sample') and clip.sample:
                 sample_name = clip.sample.name if hasattr(clip.sample, 'name') else 'Unknown'
-                self.c_surface.log_message(f"🎵 Sample T{track_idx}S{scene_idx} name: '{sample_name}'")
+                if LOG_LISTENER_EVENTS:
+                    self.c_surface.log_message(f"🎵 Sample T{track_idx}S{scene_idx} name: '{sample_name}'")
                 self._send_sample_info(track_idx, scene_idx, clip.sample)
     
     def _on_sample_file_changed(self, track_idx, scene_idx):
         """Sample file path changed"""
         if self.c_surface._is_connected and self._clip_exists(track_idx, scene_idx):
-            clip = self.song.tracks[track_idx].clip_slots[scene_idx].clip
+            clip = self._clip_slot(track_idx, scene_idx).clip
             if hasattr(clip, 'sample') and clip.sample:
                 file_path = getattr(clip.sample, 'file_path', '')
-                self.c_surface.log_message(f"📁 Sample T{track_idx}S{scene_idx} file: '{file_path}'")
+                if LOG_LISTENER_EVENTS:
+                    self.c_surface.log_message(f"📁 Sample T{track_idx}S{scene_idx} file: '{file_path}'")
                 self._send_sample_info(track_idx, scene_idx, clip.sample)
     
     def _on_sample_length_changed(self, track_idx, scene_idx):
         """Sample length changed"""
         if self.c_surface._is_connected and self._clip_exists(track_idx, scene_idx):
-            clip = self.song.tracks[track_idx].clip_slots[scene_idx].clip
+            clip = self._clip_slot(track_idx, scene_idx).clip
             if hasattr(clip, 'sample') and clip.sample:
                 length = getattr(clip.sample, 'length', 0.0)
-                self.c_surface.log_message(f"⏱️ Sample T{track_idx}S{scene_idx} length: {length:.2f}")
+                if LOG_LISTENER_EVENTS:
+                    self.c_surface.log_message(f"⏱️ Sample T{track_idx}S{scene_idx} length: {length:.2f}")
                 self._send_sample_length(track_idx, scene_idx, length)
     
     def _on_sample_gain_changed(self, track_idx, scene_idx):
         """Sample gain changed"""
         if self.c_surface._is_connected and self._clip_exists(track_idx, scene_idx):
-            clip = self.song.tracks[track_idx].clip_slots[scene_idx].clip
+            clip = self._clip_slot(track_idx, scene_idx).clip
             if hasattr(clip, 'sample') and clip.sample:
                 gain = getattr(clip.sample, 'gain', 1.0)
-                self.c_surface.log_message(f"🔊 Sample T{track_idx}S{scene_idx} gain: {gain:.2f}")
+                if LOG_LISTENER_EVENTS:
+                    self.c_surface.log_message(f"🔊 Sample T{track_idx}S{scene_idx} gain: {gain:.2f}")
                 self._send_sample_gain(track_idx, scene_idx, gain)
     
     def _on_sample_reverse_changed(self, track_idx, scene_idx):
         """Sample reverse state changed"""
         if self.c_surface._is_connected and self._clip_exists(track_idx, scene_idx):
-            clip = self.song.tracks[track_idx].clip_slots[scene_idx].clip
+            clip = self._clip_slot(track_idx, scene_idx).clip
             if hasattr(clip, 'sample') and clip.sample:
                 reverse = getattr(clip.sample, 'reverse', False)
-                self.c_surface.log_message(f"↩️ Sample T{track_idx}S{scene_idx} reverse: {reverse}")
+                if LOG_LISTENER_EVENTS:
+                    self.c_surface.log_message(f"↩️ Sample T{track_idx}S{scene_idx} reverse: {reverse}")
                 self._send_sample_reverse(track_idx, scene_idx, reverse)
     
     def _on_sample_slices_changed(self, track_idx, scene_idx):
         """Sample slices changed"""
         if self.c_surface._is_connected and self._clip_exists(track_idx, scene_idx):
-            self.c_surface.log_message(f"✂️ Sample T{track_idx}S{scene_idx} slices changed")
-            clip = self.song.tracks[track_idx].clip_slots[scene_idx].clip
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"✂️ Sample T{track_idx}S{scene_idx} slices changed")
+            clip = self._clip_slot(track_idx, scene_idx).clip
             if hasattr(clip, 'sample') and clip.sample:
                 self._send_sample_slices(track_idx, scene_idx, clip.sample)
     
     def _on_sample_warp_markers_changed(self, track_idx, scene_idx):
         """Sample warp markers changed"""
         if self.c_surface._is_connected and self._clip_exists(track_idx, scene_idx):
-            self.c_surface.log_message(f"🌊 Sample T{track_idx}S{scene_idx} warp markers changed")
-            clip = self.song.tracks[track_idx].clip_slots[scene_idx].clip
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"🌊 Sample T{track_idx}S{scene_idx} warp markers changed")
+            clip = self._clip_slot(track_idx, scene_idx).clip
             if hasattr(clip, 'sample') and clip.sample:
                 self._send_sample_warp_markers(track_idx, scene_idx, clip.sample)
     
@@ -734,25 +969,64 @@ class ClipManager:
     def _on_scene_name_changed(self, scene_idx):
         """Scene name changed"""
         if self.c_surface._is_connected and scene_idx < len(self.song.scenes):
-            scene = self.song.scenes[scene_idx]
-            self.c_surface.log_message(f"📝 Scene S{scene_idx} name: '{scene.name}'")
-            self._send_scene_name(scene_idx, scene.name)
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"📝 Scene S{scene_idx} name changed")
+            self._mark_scene_dirty(scene_idx)
     
     def _on_scene_color_changed(self, scene_idx):
         """Scene color changed"""
         if self.c_surface._is_connected and scene_idx < len(self.song.scenes):
-            scene = self.song.scenes[scene_idx]
-            color_rgb = ColorUtils.live_color_to_rgb(scene.color)
-            self.c_surface.log_message(f"🎨 Scene S{scene_idx} color: {color_rgb}")
-            self._send_scene_color(scene_idx, color_rgb)
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"🎨 Scene S{scene_idx} color changed")
+            self._mark_scene_dirty(scene_idx)
     
     def _on_scene_triggered_changed(self, scene_idx):
         """Scene triggered state changed"""
         if self.c_surface._is_connected and scene_idx < len(self.song.scenes):
-            scene = self.song.scenes[scene_idx]
-            is_triggered = scene.is_triggered
-            self.c_surface.log_message(f"🔥 Scene S{scene_idx} triggered: {is_triggered}")
-            self._send_scene_triggered_state(scene_idx, is_triggered)
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"🔥 Scene S{scene_idx} triggered changed")
+            self._mark_scene_dirty(scene_idx)
+    
+    # ========================================
+    # DEFERRED SENDS
+    # ========================================
+    
+    def _schedule_dirty_flush(self):
+        """Schedule one _flush_dirty on the next Live tick (only when sets were empty)"""
+        if len(self._dirty_clips) + len(self._dirty_scenes) == 1:
+            self.c_surface.schedule_message(1, self._flush_dirty)
+    
+    def _mark_clip_dirty(self, track_idx, scene_idx):
+        """Queue clip state + pad update for the next tick"""
+        clip_key = (track_idx, scene_idx)
+        if clip_key not in self._dirty_clips:
+            self._dirty_clips.add(clip_key)
+            self._schedule_dirty_flush()
+    
+    def _mark_scene_dirty(self, scene_idx):
+        """Queue scene state for the next tick"""
+        if scene_idx not in self._dirty_scenes:
+            self._dirty_scenes.add(scene_idx)
+            self._schedule_dirty_flush()
+    
+    def _flush_dirty(self):
+        """Drain dirty clips/scenes, sending each once regardless of how many notifications fired"""
+        dirty_clips, self._dirty_clips = self._dirty_clips, set()
+        dirty_scenes, self._dirty_scenes = self._dirty_scenes, set()
+        if not self.c_surface._is_connected:
+            return
+        try:
+            for track_idx, scene_idx in dirty_clips:
+                self._send_clip_state(track_idx, scene_idx)
+                self._send_single_pad_update(track_idx, scene_idx)
+            
+            num_scenes = len(self.song.scenes)
+            for scene_idx in dirty_scenes:
+                if scene_idx < num_scenes:
+                    self._send_complete_scene_state_unchecked(scene_idx)
+                    
+        except Exception as e:
+            self.c_surface.log_message(f"❌ Error flushing deferred clip/scene sends: {e}")
     
     # ========================================
     # SEND METHODS
@@ -765,8 +1039,7 @@ class ClipManager:
                 scene_idx >= len(self.song.scenes)):
                 return
 
-            track = self.song.tracks[track_idx]
-            clip_slot = track.clip_slots[scene_idx]
+            clip_slot = self._clip_slot(track_idx, scene_idx)
 
             # Determine clip state
             if force_state is not None:
@@ -777,16 +1050,16 @@ class ClipManager:
                 state = CLIP_PLAYING
             elif clip_slot.is_triggered:
                 state = CLIP_QUEUED
-            elif hasattr(clip_slot, 'is_recording') and clip_slot.is_recording:
+            elif getattr(clip_slot, 'is_recording', False):
                 state = CLIP_RECORDING
             else:
                 state = CLIP_STOPPED  # Has clip but not playing
 
             # Get color (clip color if exists, otherwise track color)
             if clip_slot.has_clip:
-                color = ColorUtils.live_color_to_rgb(clip_slot.clip.color)
+                color = _live_color_to_rgb_cached(clip_slot.clip.color)
             else:
-                color = ColorUtils.live_color_to_rgb(track.color)
+                color = _live_color_to_rgb_cached(self.song.tracks[track_idx].color)
 
             # Calculate final LED color based on state
             if color_override is not None:
@@ -816,7 +1089,7 @@ class ClipManager:
         try:
             track_val = max(0, min(127, int(track_idx)))
             slot_val = max(0, min(127, int(scene_idx))) if is_fired else 127
-            payload = [track_val, slot_val]
+            payload = _PAY_2B.pack(track_val, slot_val)
             self.c_surface._send_sysex_command(CMD_TRACK_FIRED_SLOT, payload)
         except Exception as e:
             self.c_surface.log_message(
@@ -826,36 +1099,32 @@ class ClipManager:
     def _send_clip_name(self, track_idx, scene_idx, name):
         """Send clip name to hardware"""
         try:
-            name_bytes = name.encode('utf-8')[:12]  # Max 12 chars
+            name_bytes = name.encode('ascii', 'replace')[:12]  # Max 12 chars, 7-bit safe
             payload = [track_idx, scene_idx, len(name_bytes)]
-            payload.extend(list(name_bytes))
+            payload.extend(name_bytes)
             self.c_surface._send_sysex_command(CMD_CLIP_NAME, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending clip name T{track_idx}S{scene_idx}: {e}")
     
-    def _send_clip_loop_state(self, track_idx, scene_idx, loop_state):
-        """Send clip loop state to hardware"""
+    def _send_clip_flag(self, command, track_idx, scene_idx, state, tag):
+        """Send a (track, scene, on/off) clip flag to hardware"""
         try:
-            payload = [track_idx, scene_idx, 1 if loop_state else 0]
-            self.c_surface._send_sysex_command(CMD_CLIP_LOOP, payload)
+            payload = _PAY_3B.pack(track_idx, scene_idx, 1 if state else 0)
+            self.c_surface._send_sysex_command(command, payload)
         except Exception as e:
-            self.c_surface.log_message(f"❌ Error sending clip loop T{track_idx}S{scene_idx}: {e}")
+            self.c_surface.log_message(f"❌ Error sending {tag} T{track_idx}S{scene_idx}: {e}")
+    
+    def _send_clip_loop_state(self, track_idx, scene_idx, loop_state):
+        """Send clip loop state to hardware"""
+        self._send_clip_flag(CMD_CLIP_LOOP, track_idx, scene_idx, loop_state, "clip loop")
     
     def _send_clip_muted_state(self, track_idx, scene_idx, muted_state):
         """Send clip muted state to hardware"""
-        try:
-            payload = [track_idx, scene_idx, 1 if muted_state else 0]
-            self.c_surface._send_sysex_command(CMD_CLIP_MUTED, payload)
-        except Exception as e:
-            self.c_surface.log_message(f"❌ Error sending clip muted T{track_idx}S{scene_idx}: {e}")
+        self._send_clip_flag(CMD_CLIP_MUTED, track_idx, scene_idx, muted_state, "clip muted")
     
     def _send_clip_warp_state(self, track_idx, scene_idx, warp_state):
         """Send clip warp state to hardware"""
-        try:
-            payload = [track_idx, scene_idx, 1 if warp_state else 0]
-            self.c_surface._send_sysex_command(CMD_CLIP_WARP, payload)
-        except Exception as e:
-            self.c_surface.log_message(f"❌ Error sending clip warp T{track_idx}S{scene_idx}: {e}")
+        self._send_clip_flag(CMD_CLIP_WARP, track_idx, scene_idx, warp_state, "clip warp")
     
     def _send_clip_start_marker(self, track_idx, scene_idx, start_marker):
         """Send clip start marker to hardware"""
@@ -867,10 +1136,9 @@ class ClipManager:
                 scene_idx = 127  # Use 127 for invalid values
             
             # Convert to beats (simplified) and clamp to MIDI range
-            start_beats = max(0, min(127, int(start_marker) & 0x7F))
-            start_fraction = max(0, min(127, int((start_marker - int(start_marker)) * 127) & 0x7F))
+            start_beats, start_fraction = _split_beats(start_marker)
             
-            payload = [track_idx, scene_idx, start_beats, start_fraction]
+            payload = _PAY_4B.pack(track_idx, scene_idx, start_beats, start_fraction)
             self.c_surface._send_sysex_command(CMD_CLIP_START, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending clip start T{track_idx}S{scene_idx}: {e}")
@@ -885,10 +1153,9 @@ class ClipManager:
                 scene_idx = 127  # Use 127 for invalid values
             
             # Convert to beats (simplified) and clamp to MIDI range
-            end_beats = max(0, min(127, int(end_marker) & 0x7F))
-            end_fraction = max(0, min(127, int((end_marker - int(end_marker)) * 127) & 0x7F))
+            end_beats, end_fraction = _split_beats(end_marker)
             
-            payload = [track_idx, scene_idx, end_beats, end_fraction]
+            payload = _PAY_4B.pack(track_idx, scene_idx, end_beats, end_fraction)
             self.c_surface._send_sysex_command(CMD_CLIP_END, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending clip end T{track_idx}S{scene_idx}: {e}")
@@ -902,12 +1169,7 @@ class ClipManager:
             scene_idx (int): Scene index
             is_recording (bool): Recording state
         """
-        try:
-            recording_byte = 1 if is_recording else 0
-            payload = [track_idx, scene_idx, recording_byte]
-            self.c_surface._send_sysex_command(CMD_CLIP_IS_RECORDING, payload)
-        except Exception as e:
-            self.c_surface.log_message(f"❌ Error sending recording state T{track_idx}S{scene_idx}: {e}")
+        self._send_clip_flag(CMD_CLIP_IS_RECORDING, track_idx, scene_idx, is_recording, "recording state")
 
     def _send_clip_loop_start(self, track_idx, scene_idx, loop_start):
         """
@@ -920,10 +1182,9 @@ class ClipManager:
         """
         try:
             # Encode as beats + fraction (similar to start/end markers)
-            loop_start_beats = max(0, min(127, int(loop_start) & 0x7F))
-            loop_start_fraction = max(0, min(127, int((loop_start - int(loop_start)) * 127) & 0x7F))
+            loop_start_beats, loop_start_fraction = _split_beats(loop_start)
 
-            payload = [track_idx, scene_idx, loop_start_beats, loop_start_fraction]
+            payload = _PAY_4B.pack(track_idx, scene_idx, loop_start_beats, loop_start_fraction)
             self.c_surface._send_sysex_command(CMD_CLIP_LOOP_START, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending loop start T{track_idx}S{scene_idx}: {e}")
@@ -939,10 +1200,9 @@ class ClipManager:
         """
         try:
             # Encode as beats + fraction
-            loop_end_beats = max(0, min(127, int(loop_end) & 0x7F))
-            loop_end_fraction = max(0, min(127, int((loop_end - int(loop_end)) * 127) & 0x7F))
+            loop_end_beats, loop_end_fraction = _split_beats(loop_end)
 
-            payload = [track_idx, scene_idx, loop_end_beats, loop_end_fraction]
+            payload = _PAY_4B.pack(track_idx, scene_idx, loop_end_beats, loop_end_fraction)
             self.c_surface._send_sysex_command(CMD_CLIP_LOOP_END, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending loop end T{track_idx}S{scene_idx}: {e}")
@@ -958,10 +1218,9 @@ class ClipManager:
         """
         try:
             # Encode as beats + fraction
-            length_beats = max(0, min(127, int(length) & 0x7F))
-            length_fraction = max(0, min(127, int((length - int(length)) * 127) & 0x7F))
+            length_beats, length_fraction = _split_beats(length)
 
-            payload = [track_idx, scene_idx, length_beats, length_fraction]
+            payload = _PAY_4B.pack(track_idx, scene_idx, length_beats, length_fraction)
             self.c_surface._send_sysex_command(CMD_CLIP_LENGTH, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending length T{track_idx}S{scene_idx}: {e}")
@@ -977,10 +1236,9 @@ class ClipManager:
         """
         try:
             # Encode as beats + fraction (for precise position tracking)
-            position_beats = max(0, min(127, int(position) & 0x7F))
-            position_fraction = max(0, min(127, int((position - int(position)) * 127) & 0x7F))
+            position_beats, position_fraction = _split_beats(position)
 
-            payload = [track_idx, scene_idx, position_beats, position_fraction]
+            payload = _PAY_4B.pack(track_idx, scene_idx, position_beats, position_fraction)
             self.c_surface._send_sysex_command(CMD_CLIP_PLAYING_POSITION, payload)
         except Exception as e:
             # Don't log position errors (too verbose for high-frequency data)
@@ -997,11 +1255,11 @@ class ClipManager:
             file_path = getattr(sample, 'file_path', '')
             
             # Get basic file info from file path
-            filename = file_path.split('/')[-1] if file_path else sample_name
-            name_bytes = filename.encode('utf-8')[:16]  # Max 16 chars for sample name
+            filename = os.path.basename(file_path) if file_path else sample_name
+            name_bytes = filename.encode('ascii', 'replace')[:16]  # Max 16 chars for sample name, 7-bit safe
             
             payload = [track_idx, scene_idx, len(name_bytes)]
-            payload.extend(list(name_bytes))
+            payload.extend(name_bytes)
             
             # Add sample properties as flags
             flags = 0
@@ -1011,14 +1269,12 @@ class ClipManager:
             payload.append(flags)
             
             # Add basic sample info
-            length = int(getattr(sample, 'length', 0.0) * 1000) & 0x3FFF  # Length in ms, max ~16 seconds
-            gain = int(getattr(sample, 'gain', 1.0) * 127) & 0x7F  # Gain 0-127
+            length = min(0x3FFF, max(0, int(getattr(sample, 'length', 0.0) * 1000.0)))  # Length in ms, max ~16 seconds
+            gain = min(127, max(0, int(getattr(sample, 'gain', 1.0) * 127.0)))  # Gain 0-127
             
-            payload.extend([
-                (length >> 7) & 0x7F,  # Length high byte
-                length & 0x7F,         # Length low byte
-                gain                   # Gain
-            ])
+            offset = length << 1
+            payload.extend(_SPLIT14[offset:offset + 2])  # Length high/low bytes
+            payload.append(gain)                          # Gain
             
             # Use existing CMD_CLIP_NAME for sample info
             self.c_surface._send_sysex_command(CMD_CLIP_NAME, payload)
@@ -1029,12 +1285,10 @@ class ClipManager:
     def _send_sample_length(self, track_idx, scene_idx, length):
         """Send sample length to hardware"""
         try:
-            length_ms = int(length * 1000) & 0x3FFF  # Convert to ms, max ~16 seconds
-            payload = [
-                track_idx, scene_idx,
-                (length_ms >> 7) & 0x7F,  # High byte
-                length_ms & 0x7F          # Low byte
-            ]
+            length_ms = min(0x3FFF, max(0, int(length * 1000.0)))  # Convert to ms, max ~16 seconds
+            offset = length_ms << 1
+            # Track, scene, then length high/low bytes from the split table
+            payload = _PAY_2B.pack(track_idx, scene_idx) + _SPLIT14[offset:offset + 2]
             self.c_surface._send_sysex_command(CMD_CLIP_START, payload)  # Reuse start command
             
         except Exception as e:
@@ -1043,8 +1297,8 @@ class ClipManager:
     def _send_sample_gain(self, track_idx, scene_idx, gain):
         """Send sample gain to hardware"""
         try:
-            gain_127 = int(gain * 127) & 0x7F
-            payload = [track_idx, scene_idx, gain_127]
+            gain_127 = min(127, max(0, int(gain * 127.0)))
+            payload = _PAY_3B.pack(track_idx, scene_idx, gain_127)
             self.c_surface._send_sysex_command(CMD_CLIP_LOOP, payload)  # Reuse loop command
             
         except Exception as e:
@@ -1052,12 +1306,8 @@ class ClipManager:
     
     def _send_sample_reverse(self, track_idx, scene_idx, reverse_state):
         """Send sample reverse state to hardware"""
-        try:
-            payload = [track_idx, scene_idx, 1 if reverse_state else 0]
-            self.c_surface._send_sysex_command(CMD_CLIP_MUTED, payload)  # Reuse muted command
-            
-        except Exception as e:
-            self.c_surface.log_message(f"❌ Error sending sample reverse T{track_idx}S{scene_idx}: {e}")
+        # Reuse muted command
+        self._send_clip_flag(CMD_CLIP_MUTED, track_idx, scene_idx, reverse_state, "sample reverse")
     
     def _send_sample_slices(self, track_idx, scene_idx, sample):
         """Send sample slices information to hardware"""
@@ -1102,9 +1352,9 @@ class ClipManager:
     def _send_scene_name(self, scene_idx, name):
         """Send scene name to hardware"""
         try:
-            name_bytes = name.encode('utf-8')[:12]  # Max 12 chars
+            name_bytes = name.encode('ascii', 'replace')[:12]  # Max 12 chars, 7-bit safe
             payload = [scene_idx, len(name_bytes)]
-            payload.extend(list(name_bytes))
+            payload.extend(name_bytes)
             self.c_surface._send_sysex_command(CMD_SCENE_NAME, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending scene name S{scene_idx}: {e}")
@@ -1113,12 +1363,8 @@ class ClipManager:
         """Send scene color to hardware"""
         try:
             r, g, b = color_rgb
-            # Convert to MIDI range
-            r = min(127, max(0, r // 2))
-            g = min(127, max(0, g // 2))
-            b = min(127, max(0, b // 2))
-            
-            payload = [scene_idx, r, g, b]
+            # Convert to MIDI range via lookup table
+            payload = _PAY_4B.pack(scene_idx, _RGB_TO_MIDI[r & 0xFF], _RGB_TO_MIDI[g & 0xFF], _RGB_TO_MIDI[b & 0xFF])
             self.c_surface._send_sysex_command(CMD_SCENE_COLOR, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending scene color S{scene_idx}: {e}")
@@ -1126,7 +1372,7 @@ class ClipManager:
     def _send_scene_triggered_state(self, scene_idx, is_triggered):
         """Send scene triggered state to hardware"""
         try:
-            payload = [scene_idx, 1 if is_triggered else 0]
+            payload = _PAY_2B.pack(scene_idx, 1 if is_triggered else 0)
             self.c_surface._send_sysex_command(CMD_SCENE_IS_TRIGGERED, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending scene triggered S{scene_idx}: {e}")
@@ -1171,11 +1417,11 @@ class ClipManager:
                     state = CLIP_PLAYING
                 elif clip_slot.is_triggered:
                     state = CLIP_QUEUED
-                elif hasattr(clip_slot, 'is_recording') and clip_slot.is_recording:
+                elif getattr(clip_slot, 'is_recording', False):
                     state = CLIP_RECORDING
                 else:
                     state = CLIP_STOPPED
-                base_color = ColorUtils.live_color_to_rgb(clip.color)
+                base_color = _live_color_to_rgb_cached(clip.color)
                 color = color_override if color_override is not None else ColorUtils.get_clip_state_color(state, base_color)
             else:
                 # No clip present: clear name so hardware hides stale labels
@@ -1269,7 +1515,7 @@ class ClipManager:
                 scene_idx < len(self.song.scenes)):
                 self.ensure_region_monitored(track_idx, 1, scene_idx, 1)
                 track = self.song.tracks[track_idx]
-                track_color = ColorUtils.live_color_to_rgb(track.color)
+                track_color = _live_color_to_rgb_cached(track.color)
                 self._send_clip_state(track_idx, scene_idx, CLIP_STOPPED, track_color)
                 self._send_single_pad_update(track_idx, scene_idx, CLIP_STOPPED, track_color)
         except Exception as e:
@@ -1278,6 +1524,22 @@ class ClipManager:
             )
 
     def _send_neotrellis_clip_grid(self, track_start=None, scene_start=None):
+        """Mark the 4x8 ring window dirty; the grid frame ships on the next flush()."""
+        self._grid_pending_window = (track_start, scene_start)
+        self._grid_dirty = True
+
+    def flush(self):
+        """Send the pending grid frame, if any (called once per display tick)"""
+        if not self._grid_dirty:
+            return
+        self._grid_dirty = False
+        track_start, scene_start = self._grid_pending_window
+        try:
+            self._send_neotrellis_clip_grid_now(track_start, scene_start)
+        except Exception as e:
+            self.c_surface.log_message(f"❌ Error flushing clip grid: {e}")
+
+    def _send_neotrellis_clip_grid_now(self, track_start=None, scene_start=None):
         """Send/log the colors of the current 4x8 ring window to the NeoTrellis with FULL RGB."""
         is_connected = getattr(self.c_surface, '_is_connected', False)
 
@@ -1320,7 +1582,7 @@ class ClipManager:
                     clip_slots = self.song.tracks[abs_track].clip_slots
                     clip_slot = clip_slots[abs_scene]
 
-                    if clip_slot.has_clip and self._clip_exists(abs_track, abs_scene):
+                    if clip_slot.has_clip:
                         clip = clip_slot.clip
                         raw_color_value = getattr(clip, 'color', None)
 
@@ -1330,14 +1592,14 @@ class ClipManager:
                         elif clip_slot.is_triggered:
                             state = CLIP_QUEUED
                             state_label = 'QUEUED'
-                        elif hasattr(clip_slot, 'is_recording') and clip_slot.is_recording:
+                        elif getattr(clip_slot, 'is_recording', False):
                             state = CLIP_RECORDING
                             state_label = 'RECORDING'
                         else:
                             state = CLIP_STOPPED
                             state_label = 'STOPPED'
 
-                        base_color = ColorUtils.live_color_to_rgb(clip.color)
+                        base_color = _live_color_to_rgb_cached(clip.color)
                         color = ColorUtils.get_clip_state_color(state, base_color)
                     else:
                         raw_color_value = getattr(self.song.tracks[abs_track], 'color', None)
@@ -1362,16 +1624,20 @@ class ClipManager:
         if not is_connected:
             return
 
-        # Use enhanced encoder for full RGB support
-        if self._color_mode == 'full_rgb':
-            message = SysExEncoder.encode_grid_update_full_rgb(grid_data, logger=self.c_surface.log_message)
-        else:
-            message = SysExEncoder.encode_neotrellis_clip_grid(grid_data)
+        # Whole window packed into one immutable key; skip re-encoding/sending an identical frame
+        grid_frame = (self._color_mode, tuple(grid_data))
+        if grid_frame != self._last_grid_frame:
+            # Use enhanced encoder for full RGB support
+            if self._color_mode == 'full_rgb':
+                message = SysExEncoder.encode_grid_update_full_rgb(grid_data, logger=self.c_surface.log_message)
+            else:
+                message = SysExEncoder.encode_neotrellis_clip_grid(grid_data)
 
-        if message:
-            self.c_surface._send_midi(tuple(message))
-        else:
-            self.c_surface.log_message("GRID_UPDATE: ❌ Failed to encode grid message")
+            if message:
+                self.c_surface._send_midi(tuple(message))
+                self._last_grid_frame = grid_frame
+            else:
+                self.c_surface.log_message("GRID_UPDATE: ❌ Failed to encode grid message")
 
         # After bulk, refresh names for the visible window
         self._send_visible_track_names(track_start)
@@ -1381,8 +1647,13 @@ class ClipManager:
     # MIDI CLIP NOTE MANIPULATION METHODS
     # ========================================
     
-    def get_midi_clip_notes(self, track_idx, scene_idx, start_time=0.0, end_time=None):
-        """Get MIDI notes from clip using Live API"""
+    def get_midi_clip_notes(self, track_idx, scene_idx, start_time=0.0, end_time=None, raw=False):
+        """
+        Get MIDI notes from clip using Live API
+
+        With raw=True, returns (notes_data, min_time, max_time) straight from
+        get_notes_extended without building per-note dicts.
+        """
         try:
             if (track_idx < len(self.song.tracks) and 
                 scene_idx < len(self.song.scenes)):
@@ -1405,6 +1676,20 @@ class ClipManager:
                             time_span=end_time - start_time,
                             pitch_span=128
                         )
+
+                        if raw:
+                            # Single pass for the time span covered by the notes
+                            min_time = math.inf
+                            max_time = -math.inf
+                            for note_data in notes_data:
+                                note_start = note_data.start_time
+                                if note_start < min_time:
+                                    min_time = note_start
+                                note_end = note_start + note_data.duration
+                                if note_end > max_time:
+                                    max_time = note_end
+                            self.c_surface.log_message(f"🎹 Got {len(notes_data)} MIDI notes from T{track_idx}S{scene_idx}")
+                            return notes_data, min_time, max_time
                         
                         notes = []
                         for note_data in notes_data:
@@ -1426,11 +1711,11 @@ class ClipManager:
                 else:
                     self.c_surface.log_message(f"⚠️ T{track_idx}S{scene_idx} has no clip or no note access")
                     
-            return []
+            return ((), 0.0, 0.0) if raw else []
             
         except Exception as e:
             self.c_surface.log_message(f"❌ Error getting MIDI notes T{track_idx}S{scene_idx}: {e}")
-            return []
+            return ((), 0.0, 0.0) if raw else []
     
     def add_midi_note(self, track_idx, scene_idx, pitch, start_time, duration, velocity=100):
         """Add a single MIDI note to clip"""
@@ -1562,9 +1847,9 @@ class ClipManager:
     def duplicate_midi_clip_notes(self, src_track_idx, src_scene_idx, dst_track_idx, dst_scene_idx):
         """Duplicate MIDI notes from one clip to another"""
         try:
-            # Get notes from source clip
-            notes = self.get_midi_clip_notes(src_track_idx, src_scene_idx)
-            if not notes:
+            # Get raw notes from source clip (no per-note dict round-trip)
+            notes_data, min_time, max_time = self.get_midi_clip_notes(src_track_idx, src_scene_idx, raw=True)
+            if not notes_data:
                 return False
                 
             # Create destination clip if it doesn't exist
@@ -1584,36 +1869,24 @@ class ClipManager:
                     if hasattr(dst_clip, 'is_midi_clip') and dst_clip.is_midi_clip:
                         
                         if hasattr(dst_clip, 'set_notes_extended'):
-                            # Convert notes to tuple format
-                            note_tuples = []
-                            for note in notes:
-                                note_tuples.append((
-                                    note['pitch'],
-                                    note['start_time'],
-                                    note['duration'],
-                                    note['velocity'],
-                                    False  # not muted
-                                ))
+                            # Clear existing notes and add new ones in a single call
+                            # Note tuple format: (pitch, start_time, duration, velocity, muted)
+                            dst_clip.set_notes_extended(
+                                notes=tuple(
+                                    (nd.pitch, nd.start_time, nd.duration, nd.velocity, False)
+                                    for nd in notes_data
+                                ),
+                                from_time=min_time,
+                                from_pitch=0,
+                                time_span=max_time - min_time,
+                                pitch_span=128
+                            )
                             
-                            # Clear existing notes and add new ones
-                            if note_tuples:
-                                # Get time span for replacement
-                                min_time = min(note['start_time'] for note in notes)
-                                max_time = max(note['start_time'] + note['duration'] for note in notes)
-                                
-                                dst_clip.set_notes_extended(
-                                    notes=note_tuples,
-                                    from_time=min_time,
-                                    from_pitch=0,
-                                    time_span=max_time - min_time,
-                                    pitch_span=128
-                                )
-                                
-                                self.c_surface.log_message(
-                                    f"📋 Duplicated {len(notes)} MIDI notes: "
-                                    f"T{src_track_idx}S{src_scene_idx} → T{dst_track_idx}S{dst_scene_idx}"
-                                )
-                                return True
+                            self.c_surface.log_message(
+                                f"📋 Duplicated {len(notes_data)} MIDI notes: "
+                                f"T{src_track_idx}S{src_scene_idx} → T{dst_track_idx}S{dst_scene_idx}"
+                            )
+                            return True
                                 
             return False
             
@@ -1621,30 +1894,47 @@ class ClipManager:
             self.c_surface.log_message(f"❌ Error duplicating MIDI notes: {e}")
             return False
     
-    def _send_midi_notes_data(self, track_idx, scene_idx, notes):
-        """Send MIDI notes data to hardware"""
+    def iter_midi_clip_note_batches(self, track_idx, scene_idx, batch_size=10):
+        """Yield raw MIDI notes from clip in batches (one LOM call, O(batch) packing)"""
+        notes_data, _, _ = self.get_midi_clip_notes(track_idx, scene_idx, raw=True)
+        notes_iter = iter(notes_data)
+        batch = tuple(islice(notes_iter, batch_size))
+        while batch:
+            yield batch
+            batch = tuple(islice(notes_iter, batch_size))
+    
+    def _send_midi_notes_data(self, track_idx, scene_idx, note_batches):
+        """Send MIDI notes data to hardware, one SysEx message per batch"""
         try:
-            # Send notes in batches to avoid oversized messages
-            batch_size = 10
-            for i in range(0, len(notes), batch_size):
-                batch = notes[i:i + batch_size]
-                payload = [track_idx, scene_idx, len(batch)]
+            # Batches keep each message under the SysEx size limit
+            buf = self._notes_buffer
+            for batch in note_batches:
+                count = len(batch)
+                size = 3 + _NOTE_PACK.size * count
+                if len(buf) < size:
+                    buf = self._notes_buffer = bytearray(size)
+                _PAY_3B.pack_into(buf, 0, track_idx, scene_idx, count)
                 
+                # Encode each note straight into the buffer as it is read from Live
+                offset = 3
                 for note in batch:
                     # Pack note data: pitch, start_time_bytes, duration_bytes, velocity
-                    start_time_ms = int(note['start_time'] * 1000) & 0xFFFF
-                    duration_ms = int(note['duration'] * 1000) & 0xFFFF
+                    start_time_ms = int(note.start_time * 1000) & 0xFFFF
+                    duration_ms = int(note.duration * 1000) & 0xFFFF
                     
-                    payload.extend([
-                        note['pitch'] & 0x7F,
+                    _NOTE_PACK.pack_into(
+                        buf, offset,
+                        note.pitch & 0x7F,
                         (start_time_ms >> 8) & 0x7F,
                         start_time_ms & 0x7F,
                         (duration_ms >> 8) & 0x7F,
                         duration_ms & 0x7F,
-                        note['velocity'] & 0x7F
-                    ])
+                        int(note.velocity) & 0x7F
+                    )
+                    offset += _NOTE_PACK.size
                 
-                self.c_surface._send_sysex_command(CMD_MIDI_NOTES, payload)
+                # Queued payloads must not alias the reused buffer
+                self.c_surface._send_sysex_command(CMD_MIDI_NOTES, bytes(memoryview(buf)[:size]))
                 
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending MIDI notes data: {e}")
@@ -1654,11 +1944,50 @@ class ClipManager:
     # ========================================
     
     def _clip_exists(self, track_idx, scene_idx):
-        """Check if clip exists at position"""
+        """Check if clip exists at position (cached for monitored slots)"""
+        clip_key = (track_idx, scene_idx)
+        if clip_key in self._clip_listeners:
+            # has_clip listener keeps _has_clip_slots current for monitored slots
+            return clip_key in self._has_clip_slots
+        return self._clip_exists_live(track_idx, scene_idx)
+    
+    def _clip_slot(self, track_idx, scene_idx):
+        """Get clip slot, reusing the object held for monitored slots to skip proxy lookups"""
+        clip_slot = self._clip_slot_sources.get((track_idx, scene_idx))
+        if clip_slot is None:
+            clip_slot = self.song.tracks[track_idx].clip_slots[scene_idx]
+        return clip_slot
+    
+    def _scene(self, scene_idx):
+        """Get scene, reusing the object held for monitored scenes"""
+        scene = self._scene_sources.get(scene_idx)
+        if scene is None:
+            scene = self.song.scenes[scene_idx]
+        return scene
+    
+    def _clip_exists_live(self, track_idx, scene_idx):
+        """Check if clip exists at position by asking Live directly"""
         return (track_idx < len(self.song.tracks) and 
                 scene_idx < len(self.song.scenes) and
                 self.song.tracks[track_idx].clip_slots[scene_idx].has_clip)
     
+    def _clip_kind(self, track_idx, scene_idx, clip):
+        """Get clip kind for slot, cached against the clip object for monitored slots"""
+        clip_key = (track_idx, scene_idx)
+        cached = self._clip_kinds.get(clip_key)
+        if cached is not None and cached[0] == clip:
+            return cached[1]
+        if self._is_audio_clip(clip):
+            kind = _CLIP_KIND_AUDIO
+        elif self._is_midi_clip(clip):
+            kind = _CLIP_KIND_MIDI
+        else:
+            kind = _CLIP_KIND_UNKNOWN
+        # Unmonitored slots have no has_clip listener to invalidate an entry, so they are not cached
+        if clip_key in self._clip_listeners:
+            self._clip_kinds[clip_key] = (clip, kind)
+        return kind
+    
     def _is_audio_clip(self, clip):
         """Check if clip is audio clip with proper validation"""
         try:
@@ -1754,6 +2083,32 @@ class ClipManager:
             self.c_surface.log_message(f"❌ Error getting sample info: {e}")
             return {'available': False, 'error': str(e)}
     
+    def _clip_capabilities(self, track_idx, scene_idx, clip):
+        """Get _CAP_* bitmask for slot, probing the clip's attributes once per clip object (monitored slots only)"""
+        clip_key = (track_idx, scene_idx)
+        cached = self._clip_caps.get(clip_key)
+        if cached is not None and cached[0] == clip:
+            return cached[1]
+        caps = 0
+        for bit, attr in _CAP_ATTRS:
+            if hasattr(clip, attr):
+                caps |= bit
+        if self._clip_kind(track_idx, scene_idx, clip) == _CLIP_KIND_AUDIO:
+            for bit, attr in _CAP_AUDIO_ATTRS:
+                if hasattr(clip, attr):
+                    caps |= bit
+        if clip_key in self._clip_listeners:
+            self._clip_caps[clip_key] = (clip, caps)
+        return caps
+    
+    def _snapshot_clip(self, track_idx, scene_idx, clip, reuse=None):
+        """Read all clip properties needed for info/state sends in a single pass"""
+        is_audio = self._clip_kind(track_idx, scene_idx, clip) == _CLIP_KIND_AUDIO
+        caps = self._clip_capabilities(track_idx, scene_idx, clip)
+        if reuse is not None:
+            return reuse.fill(clip, is_audio, caps)
+        return ClipSnapshot(clip, is_audio, caps)
+    
     def get_clip_info(self, track_idx, scene_idx):
         """Get complete clip information"""
         if (track_idx >= len(self.song.tracks) or 
@@ -1772,17 +2127,20 @@ class ClipManager:
         
         if clip_slot.has_clip:
             clip = clip_slot.clip
+            snap = self._snapshot_clip(track_idx, scene_idx, clip)
+            is_audio = snap.is_audio
+            kind = self._clip_kind(track_idx, scene_idx, clip)
             info.update({
-                'name': clip.name,
-                'color': ColorUtils.live_color_to_rgb(clip.color),
-                'clip_type': 'audio' if self._is_audio_clip(clip) else 'midi' if self._is_midi_clip(clip) else 'unknown',
-                'looping': getattr(clip, 'looping', False),
-                'muted': getattr(clip, 'muted', False),
-                'warping': (clip.warping if hasattr(clip, 'warping') else False) if self._is_audio_clip(clip) else None,
-                'start_marker': getattr(clip, 'start_marker', 0.0) if self._is_audio_clip(clip) else None,
-                'end_marker': getattr(clip, 'end_marker', 0.0) if self._is_audio_clip(clip) else None,
-                'length': getattr(clip, 'length', 0.0),
-                'sample_info': self._get_sample_info(clip) if self._is_audio_clip(clip) else None
+                'name': snap.name,
+                'color': _live_color_to_rgb_cached(clip.color),
+                'clip_type': 'audio' if is_audio else 'midi' if kind == _CLIP_KIND_MIDI else 'unknown',
+                'looping': snap.looping if snap.looping is not None else False,
+                'muted': snap.muted if snap.muted is not None else False,
+                'warping': (snap.warping if snap.warping is not None else False) if is_audio else None,
+                'start_marker': (snap.start_marker if snap.start_marker is not None else 0.0) if is_audio else None,
+                'end_marker': (snap.end_marker if snap.end_marker is not None else 0.0) if is_audio else None,
+                'length': snap.length if snap.length is not None else 0.0,
+                'sample_info': self._get_sample_info(clip) if is_audio else None
             })
         
         return info
@@ -1795,92 +2153,173 @@ class ClipManager:
         scene = self.song.scenes[scene_idx]
         return {
             'name': scene.name,
-            'color': ColorUtils.live_color_to_rgb(scene.color),
+            'color': _live_color_to_rgb_cached(scene.color),
             'is_triggered': scene.is_triggered,
             'is_empty': scene.is_empty
         }
     
-    def send_complete_clip_state(self, track_idx, scene_idx):
-        """Send complete state for a single clip"""
+    def send_complete_clip_state(self, track_idx, scene_idx, force=False):
+        """Send complete state for a single clip (only changed fields unless force=True)"""
         if not self.c_surface._is_connected:
             return
-            
         try:
-            # Send clip state
-            self._send_clip_state(track_idx, scene_idx)
+            self._send_complete_clip_state_unchecked(track_idx, scene_idx, force)
+        except Exception as e:
+            self.c_surface.log_message(f"❌ Error sending clip T{track_idx}S{scene_idx} state: {e}")
+    
+    def _send_complete_clip_state_unchecked(self, track_idx, scene_idx, force=False):
+        """send_complete_clip_state body; caller checks the connection and handles errors"""
+        # Send clip state
+        self._send_clip_state(track_idx, scene_idx)
 
-            # Send ClipSlot recording state (important for visual feedback)
-            clip_slot = self.song.tracks[track_idx].clip_slots[scene_idx]
-            if hasattr(clip_slot, 'is_recording'):
-                self._send_clip_recording_state(track_idx, scene_idx, clip_slot.is_recording)
+        # Send ClipSlot recording state (important for visual feedback)
+        clip_slot = self._clip_slot(track_idx, scene_idx)
+        is_recording = getattr(clip_slot, 'is_recording', None)
+        if is_recording is not None:
+            self._send_clip_recording_state(track_idx, scene_idx, is_recording)
 
-            # Send additional clip info if clip exists
-            if self._clip_exists(track_idx, scene_idx):
-                clip = self.song.tracks[track_idx].clip_slots[scene_idx].clip
+        # Send additional clip info if clip exists
+        clip_key = (track_idx, scene_idx)
+        last_sent = self._last_sent_clip.get(clip_key)
+        prev = None if force else last_sent
+        if clip_slot.has_clip:
+            # Double-buffered per slot: refill the spare, keep last sent for the diff
+            snap = self._snapshot_clip(track_idx, scene_idx, clip_slot.clip,
+                                       reuse=self._snapshot_spares.pop(clip_key, None))
+            if not isinstance(prev, ClipSnapshot):
+                prev = None
 
-                self._send_clip_name(track_idx, scene_idx, clip.name)
+            if prev is None or prev.name != snap.name:
+                self._send_clip_name(track_idx, scene_idx, snap.name)
 
-                if hasattr(clip, 'looping'):
-                    self._send_clip_loop_state(track_idx, scene_idx, clip.looping)
+            if snap.looping is not None and (prev is None or prev.looping != snap.looping):
+                self._send_clip_loop_state(track_idx, scene_idx, snap.looping)
 
-                if hasattr(clip, 'muted'):
-                    self._send_clip_muted_state(track_idx, scene_idx, clip.muted)
+            if snap.muted is not None and (prev is None or prev.muted != snap.muted):
+                self._send_clip_muted_state(track_idx, scene_idx, snap.muted)
 
-                # New clip properties
-                if hasattr(clip, 'loop_start'):
-                    self._send_clip_loop_start(track_idx, scene_idx, clip.loop_start)
+            # New clip properties
+            if snap.loop_start is not None and (prev is None or prev.loop_start != snap.loop_start):
+                self._send_clip_loop_start(track_idx, scene_idx, snap.loop_start)
 
-                if hasattr(clip, 'loop_end'):
-                    self._send_clip_loop_end(track_idx, scene_idx, clip.loop_end)
+            if snap.loop_end is not None and (prev is None or prev.loop_end != snap.loop_end):
+                self._send_clip_loop_end(track_idx, scene_idx, snap.loop_end)
 
-                if hasattr(clip, 'length'):
-                    self._send_clip_length(track_idx, scene_idx, clip.length)
+            if snap.length is not None and (prev is None or prev.length != snap.length):
+                self._send_clip_length(track_idx, scene_idx, snap.length)
 
-                # Note: playing_position is NOT sent in initial state
-                # because it's high-frequency streaming data
+            # Note: playing_position is NOT sent in initial state
+            # because it's high-frequency streaming data
 
-                # Audio clip specific properties
-                if self._is_audio_clip(clip):
-                    if hasattr(clip, 'warping'):
-                        self._send_clip_warp_state(track_idx, scene_idx, clip.warping)
+            # Audio clip specific properties (only read for audio clips)
+            if snap.warping is not None and (prev is None or prev.warping != snap.warping):
+                self._send_clip_warp_state(track_idx, scene_idx, snap.warping)
 
-                    if hasattr(clip, 'start_marker'):
-                        self._send_clip_start_marker(track_idx, scene_idx, clip.start_marker)
+            if snap.start_marker is not None and (prev is None or prev.start_marker != snap.start_marker):
+                self._send_clip_start_marker(track_idx, scene_idx, snap.start_marker)
 
-                    if hasattr(clip, 'end_marker'):
-                        self._send_clip_end_marker(track_idx, scene_idx, clip.end_marker)
-            else:
-                # No clip, send empty name to clear display
+            if snap.end_marker is not None and (prev is None or prev.end_marker != snap.end_marker):
+                self._send_clip_end_marker(track_idx, scene_idx, snap.end_marker)
+
+            self._last_sent_clip[clip_key] = snap
+        else:
+            # No clip, send empty name to clear display
+            if prev is not _EMPTY_SLOT:
                 self._send_clip_name(track_idx, scene_idx, "")
-            
-        except Exception as e:
-            self.c_surface.log_message(f"❌ Error sending clip T{track_idx}S{scene_idx} state: {e}")
+            self._last_sent_clip[clip_key] = _EMPTY_SLOT
+
+        # Previous snapshot becomes the slot's spare for the next pass
+        if isinstance(last_sent, ClipSnapshot):
+            self._snapshot_spares[clip_key] = last_sent
     
-    def send_complete_scene_state(self, scene_idx):
-        """Send complete state for a single scene"""
+    def send_complete_scene_state(self, scene_idx, force=False):
+        """Send complete state for a single scene (only changed fields unless force=True)"""
         if not self.c_surface._is_connected or scene_idx >= len(self.song.scenes):
             return
-            
         try:
-            scene = self.song.scenes[scene_idx]
-            
-            self._send_scene_name(scene_idx, scene.name)
-            self._send_scene_color(scene_idx, ColorUtils.live_color_to_rgb(scene.color))
-            self._send_scene_triggered_state(scene_idx, scene.is_triggered)
-            
+            self._send_complete_scene_state_unchecked(scene_idx, force)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending scene S{scene_idx} state: {e}")
     
+    def _send_complete_scene_state_unchecked(self, scene_idx, force=False):
+        """send_complete_scene_state body; caller checks connection/bounds and handles errors"""
+        scene = self._scene(scene_idx)
+        name = scene.name
+        color = _live_color_to_rgb_cached(scene.color)
+        is_triggered = scene.is_triggered
+        prev = None if force else self._last_sent_scene.get(scene_idx)
+        
+        if prev is None or prev[0] != name:
+            self._send_scene_name(scene_idx, name)
+        if prev is None or prev[1] != color:
+            self._send_scene_color(scene_idx, color)
+        if prev is None or prev[2] != is_triggered:
+            self._send_scene_triggered_state(scene_idx, is_triggered)
+        
+        self._last_sent_scene[scene_idx] = (name, color, is_triggered)
+    
+    def _prune_stale_sources(self):
+        """Drop listeners/cached objects for slots and scenes whose index now points at a different Live object
+        Returns (stale clip slot count, stale scene count)"""
+        tracks = self.song.tracks
+        scenes = self.song.scenes
+        num_tracks = len(tracks)
+        num_scenes = len(scenes)
+
+        stale_clips = [
+            (track_idx, scene_idx)
+            for (track_idx, scene_idx), clip_slot in self._clip_slot_sources.items()
+            if (track_idx >= num_tracks or scene_idx >= num_scenes or
+                tracks[track_idx].clip_slots[scene_idx] != clip_slot)
+        ]
+        for track_idx, scene_idx in stale_clips:
+            self._remove_single_clip_listeners(track_idx, scene_idx)
+
+        stale_scenes = [
+            scene_idx for scene_idx, scene in self._scene_sources.items()
+            if scene_idx >= num_scenes or scenes[scene_idx] != scene
+        ]
+        for scene_idx in stale_scenes:
+            self._remove_single_scene_listeners(scene_idx)
+
+        # Ring window (re-adds listeners for pruned slots) is re-ensured on the next grid send
+        self._monitored_region = None
+        return len(stale_clips), len(stale_scenes)
+    
+    def _on_song_structure_changed(self):
+        """Tracks or scenes added/removed/moved: drop cached slot/scene objects that moved"""
+        try:
+            stale_clips, stale_scenes = self._prune_stale_sources()
+            if LOG_LISTENER_EVENTS and (stale_clips or stale_scenes):
+                self.c_surface.log_message(
+                    f"🔄 Dropped {stale_clips} moved clip slots, {stale_scenes} scenes"
+                )
+        except Exception as e:
+            self.c_surface.log_message(f"❌ Error pruning clip slot cache: {e}")
+    
     def refresh_all_tracks(self):
         """Refresh clip listeners for all tracks (when tracks are added/removed)"""
         try:
             self.c_surface.log_message("🔄 Refreshing all clip listeners...")
             
-            # Clean up all existing listeners
-            self.cleanup_listeners()
-            
-            # Re-setup listeners for all current clips and scenes
-            self.setup_listeners(max_tracks=8, max_scenes=8)
+            if not self._is_active:
+                self.setup_listeners(max_tracks=8, max_scenes=8)
+            else:
+                # Only rebuild slots/scenes whose index now points at a different Live object
+                stale_clips, stale_scenes = self._prune_stale_sources()
+                num_tracks = len(self.song.tracks)
+                num_scenes = len(self.song.scenes)
+
+                # Add whatever is missing from the default grid
+                for track_idx in range(min(8, num_tracks)):
+                    for scene_idx in range(min(8, num_scenes)):
+                        self._setup_single_clip_listeners(track_idx, scene_idx)
+                for scene_idx in range(min(8, num_scenes)):
+                    self._setup_single_scene_listeners(scene_idx)
+
+                self.c_surface.log_message(
+                    f"🔄 Rebuilt {stale_clips} clip slots, {stale_scenes} scenes"
+                )
 
             # Immediately push a fresh snapshot so hardware knows about
             # clip names/colors for the new grid.
@@ -1891,8 +2330,13 @@ class ClipManager:
         except Exception as e:
             self.c_surface.log_message(f"❌ Error refreshing all clip listeners: {e}")
     
-    def send_complete_state(self):
-        """Send complete state for all clips and scenes"""
+    def send_complete_state(self, force=False):
+        """
+        Send complete state for all clips and scenes
+
+        Only fields that changed since the last send go out, unless force=True
+        (used for the initial dump after connect, when the hardware has no state).
+        """
         if not self.c_surface._is_connected:
             return
             
@@ -1907,16 +2351,25 @@ class ClipManager:
             scene_end = min(scene_start + GRID_HEIGHT, len(self.song.scenes))
 
             # 1) Grid bulk first (visible window)
+            if force:
+                self._last_grid_frame = None
             self._send_neotrellis_clip_grid(track_start=track_start, scene_start=scene_start)
+            self.flush()
 
-            # 2) Visible clip states
-            for track_idx in range(track_start, track_end):
+            # Queue all per-clip/scene messages and flush them together
+            self.c_surface.begin_batch()
+            try:
+                # 2) Visible clip states
+                # (connection checked once above; ranges already clipped to the song)
+                for track_idx in range(track_start, track_end):
+                    for scene_idx in range(scene_start, scene_end):
+                        self._send_complete_clip_state_unchecked(track_idx, scene_idx, force)
+                
+                # 3) Visible scene states
                 for scene_idx in range(scene_start, scene_end):
-                    self.send_complete_clip_state(track_idx, scene_idx)
-            
-            # 3) Visible scene states
-            for scene_idx in range(scene_start, scene_end):
-                self.send_complete_scene_state(scene_idx)
+                    self._send_complete_scene_state_unchecked(scene_idx, force)
+            finally:
+                self.c_surface.end_batch()
 
             self.c_surface.log_message("✅ Clip/scene state sent")
             
@@ -1950,6 +2403,11 @@ class ClipManager:
             if track_start >= track_end or scene_start >= scene_end:
                 return
 
+            # Same window as last time: every slot already has listeners
+            region = (track_start, track_end, scene_start, scene_end)
+            if region == self._monitored_region:
+                return
+
             for track_idx in range(track_start, track_end):
                 for scene_idx in range(scene_start, scene_end):
                     self._setup_single_clip_listeners(track_idx, scene_idx)
@@ -1957,6 +2415,8 @@ class ClipManager:
             for scene_idx in range(scene_start, scene_end):
                 self._setup_single_scene_listeners(scene_idx)
 
+            self._monitored_region = region
+
         except Exception as e:
             self.c_surface.log_message(
                 f"❌ Error ensuring listeners for region starting at T{track_start} S{scene_start}: {e}"
@@ -1982,12 +2442,13 @@ class ClipManager:
     def fire_clip(self, track_idx, scene_idx):
         """Fire clip at position"""
         try:
-            if (track_idx < len(self.song.tracks) and 
-                scene_idx < len(self.song.scenes)):
-                
-                clip_slot = self.song.tracks[track_idx].clip_slots[scene_idx]
-                clip_slot.fire()
-                self.c_surface.log_message(f"🔥 Fired clip T{track_idx}S{scene_idx}")
+            # Looked up live: the index must resolve to the slot there now, not a cached one
+            tracks = self.song.tracks
+            if track_idx < len(tracks):
+                clip_slots = tracks[track_idx].clip_slots
+                if scene_idx < len(clip_slots):
+                    clip_slots[scene_idx].fire()
+                    self.c_surface.log_message(f"🔥 Fired clip T{track_idx}S{scene_idx}")
                 
         except Exception as e:
             self.c_surface.log_message(f"❌ Error firing clip T{track_idx}S{scene_idx}: {e}")
@@ -1995,12 +2456,13 @@ class ClipManager:
     def stop_clip(self, track_idx, scene_idx):
         """Stop clip at position"""
         try:
-            if (track_idx < len(self.song.tracks) and 
-                scene_idx < len(self.song.scenes)):
-                
-                clip_slot = self.song.tracks[track_idx].clip_slots[scene_idx]
-                clip_slot.stop()
-                self.c_surface.log_message(f"⏹️ Stopped clip T{track_idx}S{scene_idx}")
+            # Looked up live: the index must resolve to the slot there now, not a cached one
+            tracks = self.song.tracks
+            if track_idx < len(tracks):
+                clip_slots = tracks[track_idx].clip_slots
+                if scene_idx < len(clip_slots):
+                    clip_slots[scene_idx].stop()
+                    self.c_surface.log_message(f"⏹️ Stopped clip T{track_idx}S{scene_idx}")
                 
         except Exception as e:
             self.c_surface.log_message(f"❌ Error stopping clip T{track_idx}S{scene_idx}: {e}")
@@ -2008,9 +2470,10 @@ class ClipManager:
     def fire_scene(self, scene_idx):
         """Fire scene"""
         try:
-            if scene_idx < len(self.song.scenes):
-                scene = self.song.scenes[scene_idx]
-                scene.fire()
+            # Looked up live: the index must resolve to the scene there now, not a cached one
+            scenes = self.song.scenes
+            if scene_idx < len(scenes):
+                scenes[scene_idx].fire()
                 self.c_surface.log_message(f"🎬 Fired scene S{scene_idx}")
                 
         except Exception as e:
@@ -2019,42 +2482,51 @@ class ClipManager:
     def handle_midi_clip_command(self, command, payload):
         """Handle incoming MIDI clip commands from hardware"""
         try:
-            if command == CMD_MIDI_NOTE_ADD and len(payload) >= 6:
-                track_idx, scene_idx, pitch, velocity = payload[0], payload[1], payload[2], payload[3]
-                start_time_ms = (payload[4] << 8) | payload[5]
-                duration_ms = (payload[6] << 8) | payload[7] if len(payload) >= 8 else 500
-                
-                start_time = start_time_ms / 1000.0
-                duration = duration_ms / 1000.0
-                
-                self.add_midi_note(track_idx, scene_idx, pitch, start_time, duration, velocity)
-                
-            elif command == CMD_MIDI_NOTE_REMOVE and len(payload) >= 6:
-                track_idx, scene_idx = payload[0], payload[1]
-                start_time_ms = (payload[2] << 8) | payload[3]
-                end_time_ms = (payload[4] << 8) | payload[5]
-                
-                start_time = start_time_ms / 1000.0
-                end_time = end_time_ms / 1000.0
-                
-                pitch_range = None
-                if len(payload) >= 8:
-                    pitch_range = (payload[6], payload[7])
-                
-                self.remove_midi_notes(track_idx, scene_idx, start_time, end_time, pitch_range)
-                
-            elif command == CMD_MIDI_CLIP_QUANTIZE and len(payload) >= 3:
-                track_idx, scene_idx, quantization = payload[0], payload[1], payload[2]
-                self.quantize_midi_clip(track_idx, scene_idx, quantization)
-                
-            elif command == CMD_MIDI_NOTES and len(payload) >= 2:
-                track_idx, scene_idx = payload[0], payload[1]
-                notes = self.get_midi_clip_notes(track_idx, scene_idx)
-                if notes:
-                    self._send_midi_notes_data(track_idx, scene_idx, notes)
-                    
+            handler, min_len = self._midi_dispatch.get(command, (None, 0))
+            if handler and len(payload) >= min_len:
+                handler(payload)
             else:
                 self.c_surface.log_message(f"❓ Unknown MIDI clip command: 0x{command:02X}")
                 
         except Exception as e:
             self.c_surface.log_message(f"❌ Error handling MIDI clip command 0x{command:02X}: {e}")
+    
+    def _handle_midi_note_add(self, payload):
+        """CMD_MIDI_NOTE_ADD: track, scene, pitch, velocity, start(2) [, duration(2)]"""
+        data = bytes(payload)
+        if len(data) >= 8:
+            track_idx, scene_idx, pitch, velocity, start_time_ms, duration_ms = _MIDI_ADD_STRUCT.unpack_from(data)
+        else:
+            track_idx, scene_idx, pitch, velocity, start_time_ms = _MIDI_ADD_SHORT_STRUCT.unpack_from(data)
+            duration_ms = 500
+        
+        start_time = start_time_ms / 1000.0
+        duration = duration_ms / 1000.0
+        
+        self.add_midi_note(track_idx, scene_idx, pitch, start_time, duration, velocity)
+    
+    def _handle_midi_note_remove(self, payload):
+        """CMD_MIDI_NOTE_REMOVE: track, scene, start(2), end(2) [, pitch_from, pitch_to]"""
+        data = bytes(payload)
+        track_idx, scene_idx, start_time_ms, end_time_ms = _MIDI_REMOVE_STRUCT.unpack_from(data)
+        
+        start_time = start_time_ms / 1000.0
+        end_time = end_time_ms / 1000.0
+        
+        pitch_range = None
+        if len(data) >= 8:
+            pitch_range = (data[6], data[7])
+        
+        self.remove_midi_notes(track_idx, scene_idx, start_time, end_time, pitch_range)
+    
+    def _handle_midi_clip_quantize(self, payload):
+        """CMD_MIDI_CLIP_QUANTIZE: track, scene, quantization"""
+        self.quantize_midi_clip(payload[0], payload[1], payload[2])
+    
+    def _handle_midi_notes_request(self, payload):
+        """CMD_MIDI_NOTES: track, scene -> stream the clip's notes back"""
+        track_idx, scene_idx = payload[0], payload[1]
+        self._send_midi_notes_data(
+            track_idx, scene_idx,
+            self.iter_midi_clip_note_batches(track_idx, scene_idx)
+        )
@@ -4,21 +4,226 @@ Manages Device-level properties and parameter functionality
 Based on Live Object Model: Device, DeviceParameter, RackDevice, DrumPad
 """
 
+import weakref
+
 from .consts import *
 from .MIDIUtils import SysExEncoder, ColorUtils
 
+# 8-bit color channel -> 7-bit MIDI value
+_RGB_TO_MIDI = bytes(min(127, i >> 1) for i in range(256))
+
+# Device capability bits, probed once per monitored device
+_CAP_CHAINS = 1
+_CAP_DRUM_PADS = 2
+_CAP_VIEW = 4
+
+def _probe_device_caps(device):
+    """Resolve a device's _CAP_* bits with one getattr per capability"""
+    caps = 0
+    if getattr(device, 'can_have_chains', False):
+        caps |= _CAP_CHAINS
+    if getattr(device, 'can_have_drum_pads', False):
+        caps |= _CAP_DRUM_PADS
+    if getattr(device, 'view', None) is not None:
+        caps |= _CAP_VIEW
+    return caps
+
+# Live device class name -> DeviceManager type-specific setup method
+_DEVICE_TYPE_HANDLERS = {
+    'PluginDevice': '_setup_plugin_device_listeners',
+    'SimplerDevice': '_setup_simpler_listeners',
+    'WavetableDevice': '_setup_wavetable_listeners',
+    'Eq8Device': '_setup_eq8_listeners',
+    'OperatorDevice': '_setup_operator_listeners',
+    'Compressor2Device': '_setup_compressor_listeners',
+    'CompressorDevice': '_setup_compressor_listeners',
+}
+
+
+def _indexed_head(seq, limit):
+    """Yield (idx, item) for the first `limit` items of a Live collection by index (no slice copy)"""
+    for idx in range(min(limit, len(seq))):
+        yield idx, seq[idx]
+
+
+class _IndexedListener:
+    """Listener callable that forwards to a DeviceManager handler with fixed indices
+
+    Holds the handler weakly so listeners left registered in Live do not keep
+    the manager (and its control surface) alive; once it is gone calls are no-ops.
+    """
+    __slots__ = ('handler_ref', 'args')
+
+    def __init__(self, handler, *args):
+        self.handler_ref = weakref.WeakMethod(handler)
+        self.args = args
+
+    def __call__(self):
+        handler = self.handler_ref()
+        if handler is not None:
+            handler(*self.args)
+
+
+# Chain listeners: (listener attr, add method, remove method, handler name, handler also gets the chain)
+_CHAIN_LISTENER_SPECS = (
+    ('name', 'add_name_listener', 'remove_name_listener', '_on_chain_name_changed', True),
+    ('color', 'add_color_listener', 'remove_color_listener', '_on_chain_color_changed', True),
+    ('mute', 'add_mute_listener', 'remove_mute_listener', '_on_chain_mute_changed', False),
+    ('solo', 'add_solo_listener', 'remove_solo_listener', '_on_chain_solo_changed', False),
+    ('devices', 'add_devices_listener', 'remove_devices_listener', '_on_chain_devices_changed', False),
+)
+
+# Chain mixer listeners: (listener attr, mixer attr carrying the listener or None for the mixer itself,
+# add method, remove method, handler name)
+_CHAIN_MIXER_LISTENER_SPECS = (
+    ('volume', 'volume', 'add_value_listener', 'remove_value_listener', '_on_chain_volume_changed'),
+    ('pan', 'panning', 'add_value_listener', 'remove_value_listener', '_on_chain_pan_changed'),
+    ('crossfade', None, 'add_crossfade_assign_listener', 'remove_crossfade_assign_listener', '_on_chain_crossfade_changed'),
+)
+
+_CHAIN_REMOVERS = {attr: remove_name for attr, _, remove_name, _, _ in _CHAIN_LISTENER_SPECS}
+_CHAIN_MIXER_REMOVERS = {
+    attr: (target_attr, remove_name) for attr, target_attr, _, remove_name, _ in _CHAIN_MIXER_LISTENER_SPECS
+}
+
+# Deferred value senders keyed by chain index (their _dirty_values entries go stale when a rack's chains change)
+_CHAIN_VALUE_SENDERS = frozenset(('_send_chain_volume', '_send_chain_pan', '_send_chain_send'))
+
+
+def _remove_chain_listener(device, chain_idx, listener_attr, listener_func):
+    """Remove a Chain property or chain mixer listener"""
+    chains = getattr(device, 'chains', None)
+    if chains is None or chain_idx >= len(chains):
+        return
+    chain = chains[chain_idx]
+    
+    remover_name = _CHAIN_REMOVERS.get(listener_attr)
+    if remover_name is not None:
+        owner = chain
+    else:
+        # Chain mixer device listeners
+        target_attr, remover_name = _CHAIN_MIXER_REMOVERS[listener_attr]
+        owner = getattr(chain, 'mixer_device', None)
+        if owner and target_attr:
+            owner = getattr(owner, target_attr, None)
+    
+    remover = getattr(owner, remover_name, None)
+    if remover:
+        remover(listener_func)
+
+
+def _remove_chain_send_listener(device, chain_idx, send_idx, listener_func):
+    """Remove a chain mixer send listener"""
+    mixer = device.chains[chain_idx].mixer_device
+    if send_idx < len(mixer.sends):
+        mixer.sends[send_idx].remove_value_listener(listener_func)
+
+
+def _remove_macro_listener(device, macro_idx, listener_func):
+    """Remove a rack macro listener"""
+    macros = getattr(device, 'macros', None)
+    if macros is not None and macro_idx < len(macros):
+        macro = macros[macro_idx]
+        if hasattr(macro, 'remove_value_listener'):
+            macro.remove_value_listener(listener_func)
+
+
+# DrumPad property listeners: (listener attr, add method, handler name)
+_DRUM_PAD_LISTENER_SPECS = (
+    ('name', 'add_name_listener', '_on_drum_pad_name_changed'),
+    ('mute', 'add_mute_listener', '_on_drum_pad_mute_changed'),
+    ('solo', 'add_solo_listener', '_on_drum_pad_solo_changed'),
+)
+
+# DrumPad listener attr -> remover method name
+_DRUM_PAD_REMOVERS = {
+    attr: 'remove_%s_listener' % attr for attr in ('name', 'mute', 'solo', 'chains')
+}
+
+
+def _remove_drum_pad_listener(device, pad_idx, listener_attr, listener_func):
+    """Remove a DrumPad property listener (pad_idx counts from note 36)"""
+    drum_pad = device.drum_pads[pad_idx + 36]
+    remover = getattr(drum_pad, _DRUM_PAD_REMOVERS[listener_attr], None)
+    if remover:
+        remover(listener_func)
+
+
+def _remove_drum_pad_sample_listener(device, pad_idx, listener_func):
+    """Remove a drum pad sample file path listener"""
+    sample = getattr(device.drum_pads[pad_idx + 36].canonical_parent, 'sample', None)
+    if sample is not None:
+        sample.remove_file_path_listener(listener_func)
+
+
+def _remove_optional_listener(remover_name):
+    """Build a remover for device-level listeners Live may not expose on every device"""
+    def remove(device, listener_func):
+        remover = getattr(device, remover_name, None)
+        if remover:
+            remover(listener_func)
+    return remove
+
+
+# listener_type -> remover(device, *indices, listener_func) for _cleanup_device_listeners
+_LISTENER_REMOVERS = {
+    'name': lambda device, f: device.remove_name_listener(f),
+    'is_active': _remove_optional_listener('remove_is_active_listener'),
+    'selected_chain': lambda device, f: device.view.remove_selected_chain_listener(f),
+    'chains': lambda device, f: device.remove_chains_listener(f),
+    'chain': _remove_chain_listener,
+    'chain_send': _remove_chain_send_listener,
+    'macro': _remove_macro_listener,
+    'plugin_preset': _remove_optional_listener('remove_preset_listener'),
+    'plugin_program': _remove_optional_listener('remove_program_listener'),
+    'plugin_latency': _remove_optional_listener('remove_latency_listener'),
+    'plugin_ui': _remove_optional_listener('remove_ui_listener'),
+    'sample_name': lambda device, f: device.sample.remove_name_listener(f),
+    'band_gain': lambda device, band_idx, f: device.bands[band_idx].gain.remove_value_listener(f),
+    'band_freq': lambda device, band_idx, f: device.bands[band_idx].frequency.remove_value_listener(f),
+    'pad': _remove_drum_pad_listener,
+    'pad_sample': _remove_drum_pad_sample_listener,
+    'selected_drum_pad': lambda device, f: device.view.remove_selected_drum_pad_listener(f),
+}
+
+
 class DeviceManager:
     """
     Manages all Device-level listeners and handlers
     Covers: Device properties, parameters, racks, drum pads
     """
     
+    # Every attribute set in __init__; '__weakref__' is needed for the WeakMethod in _IndexedListener
+    __slots__ = (
+        'c_surface', 'song', '_send_sysex', '_send_midi',
+        '_device_listeners', '_listeners_by_track', '_param_listeners', '_drum_listeners',
+        '_device_sources', '_chain_index', '_device_headers', '_device_caps', '_class_handlers',
+        '_focused_device_key', '_focus_listeners', '_track_devices_listeners', '_is_active',
+        '_current_track', '_current_device', '_current_param_page', '_params_per_page',
+        '_encoder_values', '_takeover_threshold', '_takeover_active',
+        '_dirty_params', '_dirty_device_names', '_dirty_drum_grids', '_dirty_values',
+        '_last_sent_params', '_refresh_all_pending', '_send_state_pending',
+        '__weakref__',
+    )
+    
     def __init__(self, control_surface):
         self.c_surface = control_surface
         self.song = control_surface.song()
-        self._device_listeners = {}  # (track_idx, device_idx): [listeners]
-        self._param_listeners = {}   # (track_idx, device_idx, param_idx): [listeners]
-        self._drum_listeners = {}    # (track_idx, device_idx): [drum_listeners]
+        # Bound send methods, resolved once for the per-event send paths
+        self._send_sysex = control_surface._send_sysex_command
+        self._send_midi = control_surface._send_midi
+        self._device_listeners = {}  # (track_idx, device_idx): ((listener_type, *indices, func), ...)
+        self._listeners_by_track = {}  # track_idx: {device_idx} with entries in _device_listeners
+        self._param_listeners = {}   # (track_idx, device_idx, param_idx): value listener (sole owner of param listeners)
+        self._drum_listeners = {}    # (track_idx, device_idx): ((listener_type, *indices, func), ...)
+        self._device_sources = {}    # track_idx: [device obj the listeners are on, indexed by device_idx]
+        self._chain_index = {}       # (track_idx, device_idx): {chain: chain_idx}
+        self._device_headers = {}    # (track_idx, device_idx): pre-encoded payload prefix
+        self._device_caps = {}       # (track_idx, device_idx): _CAP_* bits
+        self._class_handlers = {}    # Live device class: type-specific setup method name (or None)
+        self._focused_device_key = None  # (track_idx, device_idx) of the selected PluginDevice
+        self._focus_listeners = (None, ())  # (device, ((listener_type, func), ...)) on the focused plugin
+        self._track_devices_listeners = {}  # track_idx: (track obj, devices listener) for cache invalidation
         self._is_active = False
         
         self.c_surface.log_message("🔧 Initializing DeviceManager...")
@@ -34,6 +239,17 @@ class DeviceManager:
         self._takeover_threshold = 5  # MIDI units for smooth takeover
         self._takeover_active = {}   # (track, device, param): is_taken_over
         
+        # Deferred listener sends, drained once per Live scheduler tick
+        self._dirty_params = {}          # (track_idx, device_idx, param_idx): param obj
+        self._dirty_device_names = set() # (track_idx, device_idx)
+        self._dirty_drum_grids = set()   # (track_idx, device_idx) needing a NeoTrellis grid resend
+        self._dirty_values = {}          # (sender method name, *indices): Live param whose value is sent (chain mixer, macros)
+        self._last_sent_params = {}      # (track_idx, device_idx, param_idx): (value_127, display_str)
+        
+        # Full refreshes requested during a burst of notifications run once on the next tick
+        self._refresh_all_pending = False
+        self._send_state_pending = False
+        
     def setup_listeners(self, max_tracks=8, max_devices_per_track=8):
         """Setup device listeners with enhanced parameter paging support"""
         if self._is_active:
@@ -42,8 +258,15 @@ class DeviceManager:
         try:
             self.c_surface.log_message(f"🎛️ Setting up Device listeners for {max_tracks} tracks...")
             
-            for track_idx in range(min(max_tracks, len(self.song.tracks))):
-                self._setup_track_device_listeners(track_idx, max_devices_per_track)
+            for track_idx, track in _indexed_head(self.song.tracks, max_tracks):
+                self._setup_track_device_listeners(track_idx, track, max_devices_per_track)
+            
+            # Track/device list changes invalidate the cached device objects (even while disconnected)
+            self.song.add_tracks_listener(self._on_song_tracks_changed)
+            
+            # Plugin preset/program/latency/UI listeners follow the selected device
+            self.song.view.add_selected_device_listener(self._on_selected_device_changed)
+            self._update_focus_listeners()
             
             self._is_active = True
             self.c_surface.log_message(f"✅ Device listeners setup for {len(self._device_listeners)} devices")
@@ -51,100 +274,102 @@ class DeviceManager:
         except Exception as e:
             self.c_surface.log_message(f"❌ Error setting up device listeners: {e}")
     
-    def _setup_track_device_listeners(self, track_idx, max_devices):
-        """Setup device listeners for all devices in a track"""
+    def _setup_track_device_listeners(self, track_idx, track, max_devices):
+        """Setup device listeners for all devices in a track (errors handled per device)"""
+        self._watch_track_devices(track_idx, track)
+        for device_idx, device in _indexed_head(track.devices, max_devices):
+            self._setup_single_device_listeners(track_idx, device_idx, device)
+    
+    def _watch_track_devices(self, track_idx, track):
+        """Listen to a track's devices list so cached devices are pruned when it changes"""
+        if track_idx in self._track_devices_listeners:
+            return
         try:
-            if track_idx >= len(self.song.tracks):
-                return
-                
-            track = self.song.tracks[track_idx]
-            devices = list(track.devices)  # Convert to list for indexing
-            
-            for device_idx in range(min(max_devices, len(devices))):
-                self._setup_single_device_listeners(track_idx, device_idx)
-                
+            devices_listener = _IndexedListener(self._on_track_devices_changed, track_idx)
+            track.add_devices_listener(devices_listener)
+            self._track_devices_listeners[track_idx] = (track, devices_listener)
         except Exception as e:
-            self.c_surface.log_message(f"❌ Error setting up track {track_idx} device listeners: {e}")
+            self.c_surface.log_message(f"❌ Error watching track {track_idx} devices: {e}")
+    
+    def _unwatch_track_devices(self, track_idx):
+        """Remove the devices list listener from the track watched at track_idx"""
+        track, devices_listener = self._track_devices_listeners.pop(track_idx)
+        try:
+            track.remove_devices_listener(devices_listener)
+        except Exception:
+            pass  # Track deleted or listener already removed
     
-    def _setup_single_device_listeners(self, track_idx, device_idx):
-        """Setup listeners for a single device"""
+    def _setup_single_device_listeners(self, track_idx, device_idx, device):
+        """Setup listeners for a single device (device already resolved by the caller)"""
         device_key = (track_idx, device_idx)
-        if device_key in self._device_listeners:
+        if device_key in self._device_listeners or device is None:
             return  # Already setup
             
         try:
-            if track_idx >= len(self.song.tracks):
-                return
-                
-            track = self.song.tracks[track_idx]
-            devices = list(track.devices)
-            
-            if device_idx >= len(devices):
-                return
-                
-            device = devices[device_idx]
+            caps = _probe_device_caps(device)
+            device_class = device.__class__.__name__
             listeners = []
             
             # === BASIC DEVICE PROPERTIES ===
             
             # Device name
-            name_listener = lambda t_idx=track_idx, d_idx=device_idx: self._on_device_name_changed(t_idx, d_idx)
+            name_listener = _IndexedListener(self._on_device_name_changed, track_idx, device_idx)
             device.add_name_listener(name_listener)
             listeners.append(('name', name_listener))
             
             # Device enabled state (compatibility check)
             if hasattr(device, 'add_is_active_listener'):
-                is_active_listener = lambda t_idx=track_idx, d_idx=device_idx: self._on_device_enabled_changed(t_idx, d_idx)
+                is_active_listener = _IndexedListener(self._on_device_enabled_changed, track_idx, device_idx)
                 device.add_is_active_listener(is_active_listener)
                 listeners.append(('is_active', is_active_listener))
             else:
-                self.c_surface.log_message(f"⚠️ Device T{track_idx}D{device_idx} ({device.__class__.__name__}) doesn't support is_enabled listener")
+                self.c_surface.log_message(f"⚠️ Device T{track_idx}D{device_idx} ({device_class}) doesn't support is_enabled listener")
             
             # === DEVICE PARAMETERS ===
-            self._setup_device_parameter_listeners(track_idx, device_idx, device, listeners)
+            self._setup_device_parameter_listeners(track_idx, device_idx, device, device_class, listeners)
             
             # === RACK DEVICE SPECIFIC ===
-            if hasattr(device, 'can_have_chains') and device.can_have_chains:
+            if caps & _CAP_CHAINS:
                 self._setup_rack_device_listeners(track_idx, device_idx, device, listeners)
             
             # === DRUM RACK SPECIFIC ===
-            if hasattr(device, 'can_have_drum_pads') and device.can_have_drum_pads:
+            if caps & _CAP_DRUM_PADS:
                 self._setup_drum_rack_listeners(track_idx, device_idx, device)
             
             # === DEVICE TYPE SPECIFIC ===
-            self._setup_device_type_listeners(track_idx, device_idx, device, listeners)
+            self._setup_device_type_listeners(track_idx, device_idx, device, device_class, listeners)
             
             # Store all listeners for this device
-            self._device_listeners[device_key] = listeners
+            self._device_listeners[device_key] = tuple(listeners)  # Frozen: no spare list capacity
+            self._listeners_by_track.setdefault(track_idx, set()).add(device_idx)
+            track_devices = self._device_sources.setdefault(track_idx, [])
+            if device_idx >= len(track_devices):
+                track_devices.extend([None] * (device_idx + 1 - len(track_devices)))
+            track_devices[device_idx] = device
+            self._device_headers[device_key] = bytes((track_idx, device_idx))
+            self._device_caps[device_key] = caps
             
         except Exception as e:
             self.c_surface.log_message(f"❌ Error setting up device T{track_idx}D{device_idx} listeners: {e}")
     
-    def _setup_device_parameter_listeners(self, track_idx, device_idx, device, listeners):
+    def _setup_device_parameter_listeners(self, track_idx, device_idx, device, device_class, listeners):
         """Setup parameter listeners for a device"""
         try:
-            # Parameters (with validation)
-            device_class = device.__class__.__name__
             param_count = 0
             
-            for param_idx, param in enumerate(device.parameters[:8]):  # First 8 params
-                try:
-                    # Check if parameter is valid and has listener support
-                    if hasattr(param, 'add_value_listener') and hasattr(param, 'value'):
-                        param_listener = lambda t_idx=track_idx, d_idx=device_idx, p_idx=param_idx: self._on_parameter_value_changed(t_idx, d_idx, p_idx)
-                        param.add_value_listener(param_listener)
-                        listeners.append((f'param_{param_idx}', param_listener))
-                        
-                        # Store in param listeners registry
-                        param_key = (track_idx, device_idx, param_idx)
-                        self._param_listeners[param_key] = [('value', param_listener)]
-                        param_count += 1
-                    else:
-                        self.c_surface.log_message(f"⚠️ Parameter T{track_idx}D{device_idx}P{param_idx} ({param.name if hasattr(param, 'name') else 'Unknown'}) doesn't support listeners")
-                except Exception as param_error:
-                    self.c_surface.log_message(f"⚠️ Error setting up parameter T{track_idx}D{device_idx}P{param_idx}: {param_error}")
+            # One guard for the whole loop; listeners added before a failure stay registered
+            # (every DeviceParameter has value + add_value_listener, so no per-param probing)
+            for param_idx, param in _indexed_head(device.parameters, 8):  # First 8 params
+                param_listener = _IndexedListener(self._on_parameter_value_changed, track_idx, device_idx, param_idx)
+                param.add_value_listener(param_listener)
+                
+                # Param listeners live only in their keyed registry (removed via _cleanup_parameter_listeners)
+                param_key = (track_idx, device_idx, param_idx)
+                self._param_listeners[param_key] = param_listener
+                param_count += 1
             
-            self.c_surface.log_message(f"✅ Setup {param_count}/8 parameters for {device_class} T{track_idx}D{device_idx}")
+            if DEBUG_ENABLED:
+                self.c_surface.log_message(f"✅ Setup {param_count}/8 parameters for {device_class} T{track_idx}D{device_idx}")
             
         except Exception as e:
             self.c_surface.log_message(f"❌ Error setting up parameter listeners T{track_idx}D{device_idx}: {e}")
@@ -157,28 +382,29 @@ class DeviceManager:
             
             # Chain selection listener
             if hasattr(device, 'view') and hasattr(device.view, 'selected_chain'):
-                chain_listener = lambda t_idx=track_idx, d_idx=device_idx: self._on_selected_chain_changed(t_idx, d_idx)
+                chain_listener = _IndexedListener(self._on_selected_chain_changed, track_idx, device_idx)
                 device.view.add_selected_chain_listener(chain_listener)
                 listeners.append(('selected_chain', chain_listener))
             
             # Chains list listener
             if hasattr(device, 'chains'):
-                chains_listener = lambda t_idx=track_idx, d_idx=device_idx: self._on_chains_changed(t_idx, d_idx)
+                chains_listener = _IndexedListener(self._on_chains_changed, track_idx, device_idx)
                 device.add_chains_listener(chains_listener)
                 listeners.append(('chains', chains_listener))
+                self._rebuild_chain_index(track_idx, device_idx, device)
                 
                 # Individual chain listeners (enhanced Chain class integration)
-                for chain_idx, chain in enumerate(device.chains[:8]):  # Support up to 8 chains
+                for chain_idx, chain in _indexed_head(device.chains, 8):  # Support up to 8 chains
                     if chain:
                         self._setup_single_chain_listeners(track_idx, device_idx, chain_idx, chain, listeners)
             
             # Rack macro controls (RackDevice macros property)
             if hasattr(device, 'macros'):
-                for macro_idx, macro in enumerate(device.macros[:8]):
+                for macro_idx, macro in _indexed_head(device.macros, 8):
                     if macro and hasattr(macro, 'value'):
-                        macro_listener = lambda t_idx=track_idx, d_idx=device_idx, m_idx=macro_idx: self._on_rack_macro_changed(t_idx, d_idx, m_idx)
+                        macro_listener = _IndexedListener(self._on_rack_macro_changed, track_idx, device_idx, macro_idx)
                         macro.add_value_listener(macro_listener)
-                        listeners.append((f'macro_{macro_idx}', macro_listener))
+                        listeners.append(('macro', macro_idx, macro_listener))
             
         except Exception as e:
             self.c_surface.log_message(f"❌ Error setting up rack listeners T{track_idx}D{device_idx}: {e}")
@@ -186,73 +412,46 @@ class DeviceManager:
     def _setup_single_chain_listeners(self, track_idx, device_idx, chain_idx, chain, listeners):
         """Setup listeners for a single Chain class instance"""
         try:
-            # Chain name listener
-            if hasattr(chain, 'name'):
-                chain_name_listener = lambda t_idx=track_idx, d_idx=device_idx, c_idx=chain_idx: self._on_chain_name_changed(t_idx, d_idx, c_idx)
-                chain.add_name_listener(chain_name_listener)
-                listeners.append((f'chain_{chain_idx}_name', chain_name_listener))
-            
-            # Chain color listener
-            if hasattr(chain, 'color'):
-                chain_color_listener = lambda t_idx=track_idx, d_idx=device_idx, c_idx=chain_idx: self._on_chain_color_changed(t_idx, d_idx, c_idx)
-                chain.add_color_listener(chain_color_listener)
-                listeners.append((f'chain_{chain_idx}_color', chain_color_listener))
-            
-            # Chain mute/solo listeners
-            if hasattr(chain, 'mute'):
-                chain_mute_listener = lambda t_idx=track_idx, d_idx=device_idx, c_idx=chain_idx: self._on_chain_mute_changed(t_idx, d_idx, c_idx)
-                chain.add_mute_listener(chain_mute_listener)
-                listeners.append((f'chain_{chain_idx}_mute', chain_mute_listener))
-            
-            if hasattr(chain, 'solo'):
-                chain_solo_listener = lambda t_idx=track_idx, d_idx=device_idx, c_idx=chain_idx: self._on_chain_solo_changed(t_idx, d_idx, c_idx)
-                chain.add_solo_listener(chain_solo_listener)
-                listeners.append((f'chain_{chain_idx}_solo', chain_solo_listener))
-            
-            # Chain devices listener (Chain.devices property)
-            if hasattr(chain, 'devices'):
-                chain_devices_listener = lambda t_idx=track_idx, d_idx=device_idx, c_idx=chain_idx: self._on_chain_devices_changed(t_idx, d_idx, c_idx)
-                chain.add_devices_listener(chain_devices_listener)
-                listeners.append((f'chain_{chain_idx}_devices', chain_devices_listener))
+            # Chain properties (name, color, mute, solo, devices); see _CHAIN_LISTENER_SPECS
+            for listener_attr, add_name, _, handler_name, with_chain in _CHAIN_LISTENER_SPECS:
+                add_listener = getattr(chain, add_name, None)
+                if add_listener is not None:
+                    handler = getattr(self, handler_name)
+                    if with_chain:
+                        listener = _IndexedListener(handler, track_idx, device_idx, chain_idx, chain)
+                    else:
+                        listener = _IndexedListener(handler, track_idx, device_idx, chain_idx)
+                    add_listener(listener)
+                    listeners.append(('chain', chain_idx, listener_attr, listener))
             
             # Chain mixer device (Chain.mixer_device property)
-            if hasattr(chain, 'mixer_device') and chain.mixer_device:
-                self._setup_chain_mixer_listeners(track_idx, device_idx, chain_idx, chain.mixer_device, listeners)
+            mixer_device = getattr(chain, 'mixer_device', None)
+            if mixer_device:
+                self._setup_chain_mixer_listeners(track_idx, device_idx, chain_idx, mixer_device, listeners)
                 
         except Exception as e:
             self.c_surface.log_message(f"❌ Error setting up chain {chain_idx} listeners T{track_idx}D{device_idx}: {e}")
     
     def _setup_chain_mixer_listeners(self, track_idx, device_idx, chain_idx, mixer_device, listeners):
-        """Setup listeners for Chain mixer device (ChainMixerDevice)"""
-        try:
-            # Chain volume
-            if hasattr(mixer_device, 'volume') and hasattr(mixer_device.volume, 'value'):
-                volume_listener = lambda t_idx=track_idx, d_idx=device_idx, c_idx=chain_idx: self._on_chain_volume_changed(t_idx, d_idx, c_idx)
-                mixer_device.volume.add_value_listener(volume_listener)
-                listeners.append((f'chain_{chain_idx}_volume', volume_listener))
-            
-            # Chain pan
-            if hasattr(mixer_device, 'panning') and hasattr(mixer_device.panning, 'value'):
-                pan_listener = lambda t_idx=track_idx, d_idx=device_idx, c_idx=chain_idx: self._on_chain_pan_changed(t_idx, d_idx, c_idx)
-                mixer_device.panning.add_value_listener(pan_listener)
-                listeners.append((f'chain_{chain_idx}_pan', pan_listener))
-            
-            # Chain sends
-            if hasattr(mixer_device, 'sends'):
-                for send_idx, send in enumerate(mixer_device.sends[:4]):
-                    if send and hasattr(send, 'value'):
-                        send_listener = lambda t_idx=track_idx, d_idx=device_idx, c_idx=chain_idx, s_idx=send_idx: self._on_chain_send_changed(t_idx, d_idx, c_idx, s_idx)
-                        send.add_value_listener(send_listener)
-                        listeners.append((f'chain_{chain_idx}_send_{send_idx}', send_listener))
-            
-            # Chain crossfade assignment
-            if hasattr(mixer_device, 'crossfade_assign'):
-                crossfade_listener = lambda t_idx=track_idx, d_idx=device_idx, c_idx=chain_idx: self._on_chain_crossfade_changed(t_idx, d_idx, c_idx)
-                mixer_device.add_crossfade_assign_listener(crossfade_listener)
-                listeners.append((f'chain_{chain_idx}_crossfade', crossfade_listener))
-                
-        except Exception as e:
-            self.c_surface.log_message(f"❌ Error setting up chain mixer listeners T{track_idx}D{device_idx}C{chain_idx}: {e}")
+        """Setup listeners for Chain mixer device (ChainMixerDevice)
+        Errors propagate to the per-chain guard in _setup_single_chain_listeners"""
+        # Volume, pan and crossfade assignment; see _CHAIN_MIXER_LISTENER_SPECS
+        for listener_attr, target_attr, add_name, _, handler_name in _CHAIN_MIXER_LISTENER_SPECS:
+            target = getattr(mixer_device, target_attr, None) if target_attr else mixer_device
+            add_listener = getattr(target, add_name, None)
+            if add_listener is not None:
+                listener = _IndexedListener(getattr(self, handler_name), track_idx, device_idx, chain_idx)
+                add_listener(listener)
+                listeners.append(('chain', chain_idx, listener_attr, listener))
+        
+        # Chain sends
+        sends = getattr(mixer_device, 'sends', None)
+        if sends is not None:
+            for send_idx, send in _indexed_head(sends, 4):
+                if send:
+                    send_listener = _IndexedListener(self._on_chain_send_changed, track_idx, device_idx, chain_idx, send_idx)
+                    send.add_value_listener(send_listener)
+                    listeners.append(('chain_send', chain_idx, send_idx, send_listener))
     
     def _setup_drum_rack_listeners(self, track_idx, device_idx, drum_rack):
         """Setup listeners for drum rack specific functionality"""
@@ -260,168 +459,169 @@ class DeviceManager:
             drum_listeners = []
             
             # Drum pads (typically 0-127, but we'll focus on first 16)
-            if hasattr(drum_rack, 'drum_pads'):
+            # Bridged collection fetched once; each pad is read into a local
+            drum_pads = getattr(drum_rack, 'drum_pads', None)
+            if drum_pads is not None:
+                n_pads = len(drum_pads)
                 for pad_idx in range(16):  # C-1 to D#0 (36-51)
                     pad_note = pad_idx + 36  # MIDI note number
+                    if pad_note >= n_pads:
+                        break
                     
-                    if pad_note < len(drum_rack.drum_pads):
-                        drum_pad = drum_rack.drum_pads[pad_note]
-                        
-                        if drum_pad:  # Pad exists
-                            # Pad name
-                            if hasattr(drum_pad, 'name'):
-                                pad_name_listener = lambda t_idx=track_idx, d_idx=device_idx, p_idx=pad_idx: self._on_drum_pad_name_changed(t_idx, d_idx, p_idx)
-                                drum_pad.add_name_listener(pad_name_listener)
-                                drum_listeners.append((f'pad_{pad_idx}_name', pad_name_listener))
-                            
-                            # Pad mute state (Live Object Model DrumPad.mute)
-                            if hasattr(drum_pad, 'mute'):
-                                pad_mute_listener = lambda t_idx=track_idx, d_idx=device_idx, p_idx=pad_idx: self._on_drum_pad_mute_changed(t_idx, d_idx, p_idx)
-                                drum_pad.add_mute_listener(pad_mute_listener)
-                                drum_listeners.append((f'pad_{pad_idx}_mute', pad_mute_listener))
-                            
-                            # Pad solo state (Live Object Model DrumPad.solo)
-                            if hasattr(drum_pad, 'solo'):
-                                pad_solo_listener = lambda t_idx=track_idx, d_idx=device_idx, p_idx=pad_idx: self._on_drum_pad_solo_changed(t_idx, d_idx, p_idx)
-                                drum_pad.add_solo_listener(pad_solo_listener)
-                                drum_listeners.append((f'pad_{pad_idx}_solo', pad_solo_listener))
-                            
-                            # Pad chains (if has chains)
-                            if hasattr(drum_pad, 'chains') and drum_pad.chains:
-                                pad_chains_listener = lambda t_idx=track_idx, d_idx=device_idx, p_idx=pad_idx: self._on_drum_pad_chains_changed(t_idx, d_idx, p_idx)
-                                drum_pad.add_chains_listener(pad_chains_listener)
-                                drum_listeners.append((f'pad_{pad_idx}_chains', pad_chains_listener))
-                            
-                            # Pad canonical parent (for accessing nested devices/samples)
-                            if hasattr(drum_pad, 'canonical_parent'):
-                                try:
-                                    parent = drum_pad.canonical_parent
-                                    if hasattr(parent, 'sample') and parent.sample:
-                                        # Sample properties (file path, etc.)
-                                        sample = parent.sample
-                                        if hasattr(sample, 'add_file_path_listener'):
-                                            sample_listener = lambda t_idx=track_idx, d_idx=device_idx, p_idx=pad_idx: self._on_drum_pad_sample_changed(t_idx, d_idx, p_idx)
-                                            sample.add_file_path_listener(sample_listener)
-                                            drum_listeners.append((f'pad_{pad_idx}_sample', sample_listener))
-                                except Exception:
-                                    pass  # Some pads may not have samples
+                    drum_pad = drum_pads[pad_note]
+                    if not drum_pad:  # Pad doesn't exist
+                        continue
+                    
+                    # Pad name/mute/solo (Live Object Model DrumPad); see _DRUM_PAD_LISTENER_SPECS
+                    for listener_attr, add_name, handler_name in _DRUM_PAD_LISTENER_SPECS:
+                        add_listener = getattr(drum_pad, add_name, None)
+                        if add_listener is not None:
+                            pad_listener = _IndexedListener(getattr(self, handler_name), track_idx, device_idx, pad_idx)
+                            add_listener(pad_listener)
+                            drum_listeners.append(('pad', pad_idx, listener_attr, pad_listener))
+                    
+                    # Pad chains (if has chains)
+                    if getattr(drum_pad, 'chains', None):
+                        pad_chains_listener = _IndexedListener(self._on_drum_pad_chains_changed, track_idx, device_idx, pad_idx)
+                        drum_pad.add_chains_listener(pad_chains_listener)
+                        drum_listeners.append(('pad', pad_idx, 'chains', pad_chains_listener))
+                    
+                    # Pad canonical parent (for accessing nested devices/samples)
+                    try:
+                        parent = getattr(drum_pad, 'canonical_parent', None)
+                        sample = getattr(parent, 'sample', None)
+                        if sample:
+                            # Sample properties (file path, etc.)
+                            add_listener = getattr(sample, 'add_file_path_listener', None)
+                            if add_listener is not None:
+                                sample_listener = _IndexedListener(self._on_drum_pad_sample_changed, track_idx, device_idx, pad_idx)
+                                add_listener(sample_listener)
+                                drum_listeners.append(('pad_sample', pad_idx, sample_listener))
+                    except Exception:
+                        pass  # Some pads may not have samples
             
             # Selected drum pad
-            if hasattr(drum_rack, 'view') and hasattr(drum_rack.view, 'selected_drum_pad'):
-                selected_pad_listener = lambda t_idx=track_idx, d_idx=device_idx: self._on_selected_drum_pad_changed(t_idx, d_idx)
-                drum_rack.view.add_selected_drum_pad_listener(selected_pad_listener)
+            drum_rack_view = getattr(drum_rack, 'view', None)
+            if drum_rack_view is not None and hasattr(drum_rack_view, 'selected_drum_pad'):
+                selected_pad_listener = _IndexedListener(self._on_selected_drum_pad_changed, track_idx, device_idx)
+                drum_rack_view.add_selected_drum_pad_listener(selected_pad_listener)
                 drum_listeners.append(('selected_drum_pad', selected_pad_listener))
             
             # Store drum listeners
             drum_key = (track_idx, device_idx)
-            self._drum_listeners[drum_key] = drum_listeners
+            self._drum_listeners[drum_key] = tuple(drum_listeners)
             
         except Exception as e:
             self.c_surface.log_message(f"❌ Error setting up drum rack listeners T{track_idx}D{device_idx}: {e}")
     
-    def _setup_device_type_listeners(self, track_idx, device_idx, device, listeners):
+    def _setup_device_type_listeners(self, track_idx, device_idx, device, device_class, listeners):
         """Setup listeners for specific device types"""
         try:
-            device_class = device.__class__.__name__
-            device_type = getattr(device, 'type', 'unknown')
-            
-            self.c_surface.log_message(f"🔌 Device T{track_idx}D{device_idx} class: {device_class}, type: {device_type}")
-            
-            # Plugin Device (VST, AU, VST3)
-            if device_class == 'PluginDevice' or 'plugin' in device_class.lower():
-                self._setup_plugin_device_listeners(track_idx, device_idx, device, listeners)
-            
-            # Simpler device
-            elif hasattr(device, 'sample') and device_class == 'SimplerDevice':
-                self._setup_simpler_listeners(track_idx, device_idx, device, listeners)
-            
-            # Wavetable device
-            elif device_class == 'WavetableDevice':
-                self._setup_wavetable_listeners(track_idx, device_idx, device, listeners)
-            
-            # EQ Eight
-            elif device_class == 'Eq8Device':
-                self._setup_eq8_listeners(track_idx, device_idx, device, listeners)
-            
-            # Operator
-            elif device_class == 'OperatorDevice':
-                self._setup_operator_listeners(track_idx, device_idx, device, listeners)
-            
-            # Compressor
-            elif device_class == 'Compressor2Device':
-                self._setup_compressor_listeners(track_idx, device_idx, device, listeners)
+            if DEBUG_ENABLED:
+                device_type = getattr(device, 'type', 'unknown')
+                self.c_surface.log_message(f"🔌 Device T{track_idx}D{device_idx} class: {device_class}, type: {device_type}")
             
-            # Compressor
-            elif device_class == 'CompressorDevice':
-                self._setup_compressor_listeners(track_idx, device_idx, device, listeners)
+            handler_name = self._type_setup_for(device)
+            if handler_name:
+                getattr(self, handler_name)(track_idx, device_idx, device, listeners)
                 
         except Exception as e:
             self.c_surface.log_message(f"❌ Error setting up device type listeners T{track_idx}D{device_idx}: {e}")
     
+    def _type_setup_for(self, device):
+        """Get the type-specific setup method name for device, resolved once per Live class"""
+        device_cls = type(device)
+        handler_name = self._class_handlers.get(device_cls, False)
+        if handler_name is False:
+            device_class = device_cls.__name__
+            handler_name = _DEVICE_TYPE_HANDLERS.get(device_class)
+            # Other plugin wrappers (VST, AU, VST3)
+            if handler_name is None and 'plugin' in device_class.lower():
+                handler_name = '_setup_plugin_device_listeners'
+            self._class_handlers[device_cls] = handler_name
+        return handler_name
+    
     def _setup_plugin_device_listeners(self, track_idx, device_idx, device, listeners):
-        """Setup PluginDevice-specific listeners (VST/AU/VST3)"""
-        try:
+        """Setup PluginDevice-specific listeners (VST/AU/VST3)
+        Parameters are covered by the generic parameter listeners; preset/program/latency/UI
+        listeners are attached only while the plugin is the selected device (_update_focus_listeners)"""
+        if DEBUG_ENABLED:
             self.c_surface.log_message(f"🔌 Setting up PluginDevice listeners T{track_idx}D{device_idx}")
-            
-            # Plugin preset changes
-            if hasattr(device, 'selected_preset_index'):
-                preset_listener = lambda t_idx=track_idx, d_idx=device_idx: self._on_plugin_preset_changed(t_idx, d_idx)
-                try:
-                    if hasattr(device, 'add_preset_listener'):
-                        device.add_preset_listener(preset_listener)
-                        listeners.append(('plugin_preset', preset_listener))
-                except AttributeError:
-                    self.c_surface.log_message(f"ℹ️ Plugin preset listener not available for T{track_idx}D{device_idx}")
-            
-            # Plugin program/bank changes
-            if hasattr(device, 'selected_program_name'):
-                program_listener = lambda t_idx=track_idx, d_idx=device_idx: self._on_plugin_program_changed(t_idx, d_idx)
-                try:
-                    if hasattr(device, 'add_program_listener'):
-                        device.add_program_listener(program_listener)
-                        listeners.append(('plugin_program', program_listener))
-                except AttributeError:
-                    self.c_surface.log_message(f"ℹ️ Plugin program listener not available for T{track_idx}D{device_idx}")
-            
-            # Plugin latency reporting
-            if hasattr(device, 'latency_in_ms'):
-                latency_listener = lambda t_idx=track_idx, d_idx=device_idx: self._on_plugin_latency_changed(t_idx, d_idx)
-                try:
-                    if hasattr(device, 'add_latency_listener'):
-                        device.add_latency_listener(latency_listener)
-                        listeners.append(('plugin_latency', latency_listener))
-                except AttributeError:
-                    pass  # Latency listeners are optional
-            
-            # Plugin window state (if available)
-            if hasattr(device, 'is_showing_plugin_ui'):
-                ui_listener = lambda t_idx=track_idx, d_idx=device_idx: self._on_plugin_ui_changed(t_idx, d_idx)
-                try:
-                    if hasattr(device, 'add_ui_listener'):
-                        device.add_ui_listener(ui_listener)
-                        listeners.append(('plugin_ui', ui_listener))
-                except AttributeError:
-                    pass  # UI listeners are optional
+    
+    # ========================================
+    # FOCUSED PLUGIN LISTENERS
+    # ========================================
+    
+    def _on_selected_device_changed(self):
+        """Handle selected device change (moves the plugin focus listeners)"""
+        self._update_focus_listeners()
+    
+    def _update_focus_listeners(self):
+        """Keep the plugin preset/program/latency/UI listeners on the selected device only"""
+        try:
+            selected = self.song.view.selected_device
+            focused_key = None
+            if selected is not None:
+                for track_idx, track_devices in self._device_sources.items():
+                    for device_idx, device in enumerate(track_devices):
+                        if device == selected:
+                            focused_key = (track_idx, device_idx)
+                            break
+                    if focused_key:
+                        break
+            
+            if focused_key == self._focused_device_key and self._focus_listeners[0] == selected:
+                return  # Focus unchanged
+            
+            self._detach_focus_listeners()
+            if focused_key and self._type_setup_for(selected) == '_setup_plugin_device_listeners':
+                self._attach_focus_listeners(focused_key[0], focused_key[1], selected)
+                
+        except Exception as e:
+            self.c_surface.log_message(f"❌ Error updating focused plugin listeners: {e}")
+    
+    def _attach_focus_listeners(self, track_idx, device_idx, device):
+        """Attach the heavier plugin listeners to the focused PluginDevice"""
+        listeners = []
+        try:
+            # Optional plugin listeners (preset, program/bank, latency, window state);
+            # registered only when the plugin exposes the add method
+            for add_name, handler, listener_type in (
+                ('add_preset_listener', self._on_plugin_preset_changed, 'plugin_preset'),
+                ('add_program_listener', self._on_plugin_program_changed, 'plugin_program'),
+                ('add_latency_listener', self._on_plugin_latency_changed, 'plugin_latency'),
+                ('add_ui_listener', self._on_plugin_ui_changed, 'plugin_ui'),
+            ):
+                add_listener = getattr(device, add_name, None)
+                if add_listener is not None:
+                    listener = _IndexedListener(handler, track_idx, device_idx)
+                    add_listener(listener)
+                    listeners.append((listener_type, listener))
                     
         except Exception as e:
             self.c_surface.log_message(f"❌ Error setting up PluginDevice listeners T{track_idx}D{device_idx}: {e}")
+        
+        # Listeners added before a failure are kept so they can still be detached
+        self._focused_device_key = (track_idx, device_idx)
+        self._focus_listeners = (device, tuple(listeners))
+    
+    def _detach_focus_listeners(self):
+        """Remove the plugin listeners from the previously focused device"""
+        device, listeners = self._focus_listeners
+        for listener_type, listener_func in listeners:
+            try:
+                _LISTENER_REMOVERS[listener_type](device, listener_func)
+            except Exception:
+                pass  # Device deleted or listener already removed
+        self._focused_device_key = None
+        self._focus_listeners = (None, ())
     
     def _setup_operator_listeners(self, track_idx, device_idx, device, listeners):
         """Setup Operator-specific listeners"""
-        try:
+        if DEBUG_ENABLED:
             self.c_surface.log_message(f"🎡 Setting up Operator listeners T{track_idx}D{device_idx}")
-            # Operator has 4 operators (A, B, C, D) with complex FM synthesis
-            # Could add specific operator parameter listeners here
-        except Exception as e:
-            self.c_surface.log_message(f"❌ Error setting up Operator listeners: {e}")
-    
-    def _setup_compressor_listeners(self, track_idx, device_idx, device, listeners):
-        """Setup Compressor-specific listeners"""
-        try:
-            self.c_surface.log_message(f"🎧 Setting up Compressor listeners T{track_idx}D{device_idx}")
-            # Compressor2 specific parameters can be monitored
-        except Exception as e:
-            self.c_surface.log_message(f"❌ Error setting up Compressor listeners: {e}")
+        # Operator has 4 operators (A, B, C, D) with complex FM synthesis
+        # Could add specific operator parameter listeners here
     
     def _setup_simpler_listeners(self, track_idx, device_idx, device, listeners):
         """Setup Simpler device specific listeners"""
@@ -431,57 +631,44 @@ class DeviceManager:
                 
                 # Sample name
                 if hasattr(sample, 'name'):
-                    sample_name_listener = lambda t_idx=track_idx, d_idx=device_idx: self._on_simpler_sample_name_changed(t_idx, d_idx)
+                    sample_name_listener = _IndexedListener(self._on_simpler_sample_name_changed, track_idx, device_idx)
                     sample.add_name_listener(sample_name_listener)
                     listeners.append(('sample_name', sample_name_listener))
                 
-                # Sample length
-                if hasattr(sample, 'length'):
-                    sample_length_listener = lambda t_idx=track_idx, d_idx=device_idx: self._on_simpler_sample_length_changed(t_idx, d_idx)
-                    # Note: length property exists but add_length_listener does not exist in Live API
-                    # Length changes can be tracked through other device parameter listeners
-                    listeners.append(('sample_length', sample_length_listener))
+                # Sample has no add_length_listener in the Live API, so length changes are not tracked
                     
         except Exception as e:
             self.c_surface.log_message(f"❌ Error setting up Simpler listeners T{track_idx}D{device_idx}: {e}")
     
     def _setup_wavetable_listeners(self, track_idx, device_idx, device, listeners):
         """Setup Wavetable device specific listeners"""
-        try:
-            # Wavetable specific parameters would go here
-            # This is a placeholder for wavetable-specific functionality
-            pass
-            
-        except Exception as e:
-            self.c_surface.log_message(f"❌ Error setting up Wavetable listeners T{track_idx}D{device_idx}: {e}")
+        # Wavetable specific parameters would go here
+        # This is a placeholder for wavetable-specific functionality
+        pass
     
     def _setup_eq8_listeners(self, track_idx, device_idx, device, listeners):
         """Setup EQ Eight device specific listeners"""
         try:
             # EQ bands
             if hasattr(device, 'bands'):
-                for band_idx, band in enumerate(device.bands[:8]):  # 8 bands
+                for band_idx, band in _indexed_head(device.bands, 8):  # 8 bands
                     if hasattr(band, 'gain'):
-                        band_gain_listener = lambda t_idx=track_idx, d_idx=device_idx, b_idx=band_idx: self._on_eq_band_gain_changed(t_idx, d_idx, b_idx)
+                        band_gain_listener = _IndexedListener(self._on_eq_band_gain_changed, track_idx, device_idx, band_idx)
                         band.gain.add_value_listener(band_gain_listener)
-                        listeners.append((f'band_{band_idx}_gain', band_gain_listener))
+                        listeners.append(('band_gain', band_idx, band_gain_listener))
                     
                     if hasattr(band, 'frequency'):
-                        band_freq_listener = lambda t_idx=track_idx, d_idx=device_idx, b_idx=band_idx: self._on_eq_band_freq_changed(t_idx, d_idx, b_idx)
+                        band_freq_listener = _IndexedListener(self._on_eq_band_freq_changed, track_idx, device_idx, band_idx)
                         band.frequency.add_value_listener(band_freq_listener)
-                        listeners.append((f'band_{band_idx}_freq', band_freq_listener))
+                        listeners.append(('band_freq', band_idx, band_freq_listener))
                         
         except Exception as e:
             self.c_surface.log_message(f"❌ Error setting up EQ8 listeners T{track_idx}D{device_idx}: {e}")
     
     def _setup_compressor_listeners(self, track_idx, device_idx, device, listeners):
         """Setup Compressor device specific listeners"""
-        try:
-            # Compressor specific parameters would go here
-            pass
-            
-        except Exception as e:
-            self.c_surface.log_message(f"❌ Error setting up Compressor listeners T{track_idx}D{device_idx}: {e}")
+        # Compressor specific parameters would go here
+        pass
     
     def cleanup_listeners(self):
         """Remove all device listeners"""
@@ -489,21 +676,46 @@ class DeviceManager:
             return
             
         try:
+            # Clean up focused plugin listeners
+            try:
+                self.song.view.remove_selected_device_listener(self._on_selected_device_changed)
+            except Exception:
+                pass  # Ignore if already removed
+            self._detach_focus_listeners()
+            
+            # Clean up track/device list listeners
+            try:
+                self.song.remove_tracks_listener(self._on_song_tracks_changed)
+            except Exception:
+                pass  # Ignore if already removed
+            for track_idx in list(self._track_devices_listeners):
+                self._unwatch_track_devices(track_idx)
+            
             # Clean up device listeners
             for (track_idx, device_idx), listeners in self._device_listeners.items():
                 self._cleanup_device_listeners(track_idx, device_idx, listeners)
             
             # Clean up parameter listeners
-            for (track_idx, device_idx, param_idx), listeners in self._param_listeners.items():
-                self._cleanup_parameter_listeners(track_idx, device_idx, param_idx, listeners)
+            for (track_idx, device_idx, param_idx), listener_func in self._param_listeners.items():
+                self._cleanup_parameter_listeners(track_idx, device_idx, param_idx, listener_func)
             
             # Clean up drum listeners
             for (track_idx, device_idx), listeners in self._drum_listeners.items():
                 self._cleanup_drum_listeners(track_idx, device_idx, listeners)
             
             self._device_listeners = {}
+            self._listeners_by_track = {}
             self._param_listeners = {}
             self._drum_listeners = {}
+            self._device_sources = {}
+            self._chain_index = {}
+            self._device_headers = {}
+            self._device_caps = {}
+            self._dirty_params.clear()
+            self._dirty_device_names.clear()
+            self._dirty_drum_grids.clear()
+            self._dirty_values.clear()
+            self._last_sent_params.clear()
             self._is_active = False
             self.c_surface.log_message("✅ Device listeners cleaned up")
             
@@ -513,316 +725,263 @@ class DeviceManager:
     def _cleanup_device_listeners(self, track_idx, device_idx, listeners):
         """Clean up listeners for a specific device"""
         try:
-            if track_idx >= len(self.song.tracks):
+            device = self._get_device(track_idx, device_idx)
+            if not device:
                 return
-                
-            track = self.song.tracks[track_idx]
-            devices = list(track.devices)
             
-            if device_idx >= len(devices):
-                return
-                
-            device = devices[device_idx]
-            
-            for listener_type, listener_func in listeners:
-                try:
-                    if listener_type == 'name':
-                        device.remove_name_listener(listener_func)
-                    elif listener_type == 'is_active':
-                        if hasattr(device, 'remove_is_active_listener'):
-                            device.remove_is_active_listener(listener_func)
-                    elif listener_type.startswith('param_'):
-                        param_idx = int(listener_type.split('_')[1])
-                        if param_idx < len(device.parameters):
-                            device.parameters[param_idx].remove_value_listener(listener_func)
-                    elif listener_type == 'selected_chain':
-                        device.view.remove_selected_chain_listener(listener_func)
-                    elif listener_type == 'chains':
-                        device.remove_chains_listener(listener_func)
-                    elif listener_type.startswith('chain_'):
-                        # Handle Chain class listener cleanup
-                        parts = listener_type.split('_')
-                        if len(parts) >= 3:
-                            chain_idx = int(parts[1])
-                            listener_attr = '_'.join(parts[2:])
-                            
-                            if hasattr(device, 'chains') and chain_idx < len(device.chains):
-                                chain = device.chains[chain_idx]
-                                
-                                # Chain property listeners
-                                if listener_attr == 'name' and hasattr(chain, 'remove_name_listener'):
-                                    chain.remove_name_listener(listener_func)
-                                elif listener_attr == 'color' and hasattr(chain, 'remove_color_listener'):
-                                    chain.remove_color_listener(listener_func)
-                                elif listener_attr == 'mute' and hasattr(chain, 'remove_mute_listener'):
-                                    chain.remove_mute_listener(listener_func)
-                                elif listener_attr == 'solo' and hasattr(chain, 'remove_solo_listener'):
-                                    chain.remove_solo_listener(listener_func)
-                                elif listener_attr == 'devices' and hasattr(chain, 'remove_devices_listener'):
-                                    chain.remove_devices_listener(listener_func)
-                                
-                                # Chain mixer device listeners
-                                elif hasattr(chain, 'mixer_device') and chain.mixer_device:
-                                    mixer = chain.mixer_device
-                                    if listener_attr == 'volume' and hasattr(mixer.volume, 'remove_value_listener'):
-                                        mixer.volume.remove_value_listener(listener_func)
-                                    elif listener_attr == 'pan' and hasattr(mixer.panning, 'remove_value_listener'):
-                                        mixer.panning.remove_value_listener(listener_func)
-                                    elif listener_attr == 'crossfade' and hasattr(mixer, 'remove_crossfade_assign_listener'):
-                                        mixer.remove_crossfade_assign_listener(listener_func)
-                                    elif listener_attr.startswith('send_'):
-                                        send_idx = int(listener_attr.split('_')[1])
-                                        if hasattr(mixer, 'sends') and send_idx < len(mixer.sends):
-                                            send = mixer.sends[send_idx]
-                                            if hasattr(send, 'remove_value_listener'):
-                                                send.remove_value_listener(listener_func)
-                    
-                    elif listener_type.startswith('macro_'):
-                        # Handle rack macro cleanup
-                        macro_idx = int(listener_type.split('_')[1])
-                        if hasattr(device, 'macros') and macro_idx < len(device.macros):
-                            macro = device.macros[macro_idx]
-                            if hasattr(macro, 'remove_value_listener'):
-                                macro.remove_value_listener(listener_func)
-                except:
-                    pass
+            # Entries are (listener_type, *indices, listener_func); see _LISTENER_REMOVERS
+            for listener_type, *indices, listener_func in listeners:
+                remover = _LISTENER_REMOVERS.get(listener_type)
+                if remover:
+                    try:
+                        remover(device, *indices, listener_func)
+                    except Exception:
+                        pass  # Ignore if already removed
                     
         except Exception as e:
             self.c_surface.log_message(f"❌ Error cleaning device T{track_idx}D{device_idx} listeners: {e}")
     
-    def _cleanup_parameter_listeners(self, track_idx, device_idx, param_idx, listeners):
-        """Clean up listeners for a specific parameter"""
+    def _cleanup_parameter_listeners(self, track_idx, device_idx, param_idx, listener_func):
+        """Clean up the value listener for a specific parameter"""
         try:
-            if track_idx >= len(self.song.tracks):
-                return
-                
-            track = self.song.tracks[track_idx]
-            devices = list(track.devices)
-            
-            if device_idx >= len(devices):
-                return
-                
-            device = devices[device_idx]
-            
-            if param_idx >= len(device.parameters):
+            device = self._get_device(track_idx, device_idx)
+            parameters = device.parameters if device else ()
+            if param_idx >= len(parameters):
                 return
                 
-            param = device.parameters[param_idx]
-            
-            for listener_type, listener_func in listeners:
-                try:
-                    if listener_type == 'value':
-                        param.remove_value_listener(listener_func)
-                except:
-                    pass
+            try:
+                parameters[param_idx].remove_value_listener(listener_func)
+            except Exception:
+                pass  # Ignore if already removed
                     
         except Exception as e:
             self.c_surface.log_message(f"❌ Error cleaning param T{track_idx}D{device_idx}P{param_idx} listeners: {e}")
     
     def _cleanup_drum_listeners(self, track_idx, device_idx, listeners):
-        """Clean up drum rack listeners"""
-        try:
-            # Implementation would be similar to other cleanup methods
-            pass
-            
-        except Exception as e:
-            self.c_surface.log_message(f"❌ Error cleaning drum T{track_idx}D{device_idx} listeners: {e}")
+        """Clean up drum rack listeners (same entry layout and removers as device listeners)"""
+        self._cleanup_device_listeners(track_idx, device_idx, listeners)
     
     # ========================================
     # DEVICE EVENT HANDLERS
     # ========================================
     
     def _on_device_name_changed(self, track_idx, device_idx):
-        """Device name changed"""
+        """Device name changed (sent on the next tick)"""
         if self.c_surface._is_connected:
-            device = self._get_device(track_idx, device_idx)
-            if device:
-                self.c_surface.log_message(f"🎛️ Device T{track_idx}D{device_idx} name: '{device.name}'")
-                self._send_device_name(track_idx, device_idx, device.name)
+            device_key = (track_idx, device_idx)
+            if device_key not in self._dirty_device_names:
+                self._dirty_device_names.add(device_key)
+                self._schedule_dirty_flush()
     
     def _on_device_enabled_changed(self, track_idx, device_idx):
         """Device enabled state changed"""
         if self.c_surface._is_connected:
             device = self._get_device(track_idx, device_idx)
             if device:
-                self.c_surface.log_message(f"🔘 Device T{track_idx}D{device_idx} enabled: {device.is_active}")
+                if LOG_LISTENER_EVENTS:
+                    self.c_surface.log_message(f"🔘 Device T{track_idx}D{device_idx} enabled: {device.is_active}")
                 self._send_device_enabled_state(track_idx, device_idx, device.is_active)
     
     def _on_parameter_value_changed(self, track_idx, device_idx, param_idx):
-        """Device parameter value changed"""
+        """Device parameter value changed (latest value sent on the next tick)"""
         if self.c_surface._is_connected:
+            param_key = (track_idx, device_idx, param_idx)
+            if param_key in self._dirty_params:
+                return
             device = self._get_device(track_idx, device_idx)
-            if device and param_idx < len(device.parameters):
-                param = device.parameters[param_idx]
-                self.c_surface.log_message(f"🎚️ Param T{track_idx}D{device_idx}P{param_idx}: {param.value:.2f}")
-                self._send_parameter_value(track_idx, device_idx, param_idx, param.value, param.name)
+            parameters = device.parameters if device else ()
+            if param_idx < len(parameters):
+                self._dirty_params[param_key] = parameters[param_idx]
+                self._schedule_dirty_flush()
     
     def _on_selected_chain_changed(self, track_idx, device_idx):
         """Rack device selected chain changed"""
         if self.c_surface._is_connected:
             device = self._get_device(track_idx, device_idx)
-            if device and hasattr(device, 'view') and hasattr(device.view, 'selected_chain'):
+            if device and self._device_caps_of(track_idx, device_idx, device) & _CAP_VIEW and hasattr(device.view, 'selected_chain'):
                 selected_chain = device.view.selected_chain
-                chain_idx = list(device.chains).index(selected_chain) if selected_chain else -1
-                self.c_surface.log_message(f"🔗 Device T{track_idx}D{device_idx} selected chain: {chain_idx}")
+                chain_idx = self._chain_index_of(track_idx, device_idx, device, selected_chain)
+                if LOG_LISTENER_EVENTS:
+                    self.c_surface.log_message(f"🔗 Device T{track_idx}D{device_idx} selected chain: {chain_idx}")
                 self._send_selected_chain(track_idx, device_idx, chain_idx)
     
     def _on_chains_changed(self, track_idx, device_idx):
         """Rack device chains changed"""
+        device = self._get_device(track_idx, device_idx)
+        if device:
+            self._rebuild_chain_index(track_idx, device_idx, device)
+        # Chain indices may have shifted: drop queued chain mixer values for this rack
+        rack_key = (track_idx, device_idx)
+        self._dirty_values = {
+            key: param for key, param in self._dirty_values.items()
+            if key[0] not in _CHAIN_VALUE_SENDERS or (key[1], key[2]) != rack_key
+        }
         if self.c_surface._is_connected:
-            self.c_surface.log_message(f"🔗 Device T{track_idx}D{device_idx} chains changed")
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"🔗 Device T{track_idx}D{device_idx} chains changed")
             self._send_device_chains(track_idx, device_idx)
     
-    def _on_chain_name_changed(self, track_idx, device_idx, chain_idx):
-        """Individual chain name changed"""
-        if self.c_surface._is_connected:
-            device = self._get_device(track_idx, device_idx)
-            if device and hasattr(device, 'chains') and chain_idx < len(device.chains):
-                chain = device.chains[chain_idx]
-                self.c_surface.log_message(f"🔗 Chain T{track_idx}D{device_idx}C{chain_idx} name: '{chain.name}'")
-                self._send_chain_name(track_idx, device_idx, chain_idx, chain.name)
+    def _chain_at(self, track_idx, device_idx, chain_idx):
+        """Get chain by index from a device (None if missing); device.chains is read once"""
+        chains = getattr(self._get_device(track_idx, device_idx), 'chains', None)
+        if chains is None or chain_idx >= len(chains):
+            return None
+        return chains[chain_idx]
     
-    def _on_chain_color_changed(self, track_idx, device_idx, chain_idx):
-        """Individual chain color changed"""
+    def _drum_pad_at(self, track_idx, device_idx, pad_idx):
+        """Get drum pad by pad index (counted from note 36) from a device (None if missing)"""
+        drum_pads = getattr(self._get_device(track_idx, device_idx), 'drum_pads', None)
+        pad_note = pad_idx + 36
+        if drum_pads is None or pad_note >= len(drum_pads):
+            return None
+        return drum_pads[pad_note]
+    
+    def _on_chain_name_changed(self, track_idx, device_idx, chain_idx, chain=None):
+        """Individual chain name changed (chain = object the listener was added to)"""
         if self.c_surface._is_connected:
-            device = self._get_device(track_idx, device_idx)
-            if device and hasattr(device, 'chains') and chain_idx < len(device.chains):
-                chain = device.chains[chain_idx]
+            if chain is None:
+                chain = self._chain_at(track_idx, device_idx, chain_idx)
+            if chain:
+                name = chain.name
+                if LOG_LISTENER_EVENTS:
+                    self.c_surface.log_message(f"🔗 Chain T{track_idx}D{device_idx}C{chain_idx} name: '{name}'")
+                self._send_chain_name(track_idx, device_idx, chain_idx, name)
+    
+    def _on_chain_color_changed(self, track_idx, device_idx, chain_idx, chain=None):
+        """Individual chain color changed (chain = object the listener was added to)"""
+        if self.c_surface._is_connected:
+            if chain is None:
+                chain = self._chain_at(track_idx, device_idx, chain_idx)
+            if chain:
                 color_rgb = ColorUtils.live_color_to_rgb(chain.color)
-                self.c_surface.log_message(f"🎨 Chain T{track_idx}D{device_idx}C{chain_idx} color: {color_rgb}")
+                if LOG_LISTENER_EVENTS:
+                    self.c_surface.log_message(f"🎨 Chain T{track_idx}D{device_idx}C{chain_idx} color: {color_rgb}")
                 self._send_chain_color(track_idx, device_idx, chain_idx, color_rgb)
     
     def _on_chain_mute_changed(self, track_idx, device_idx, chain_idx):
         """Chain mute state changed"""
         if self.c_surface._is_connected:
-            device = self._get_device(track_idx, device_idx)
-            if device and hasattr(device, 'chains') and chain_idx < len(device.chains):
-                chain = device.chains[chain_idx]
+            chain = self._chain_at(track_idx, device_idx, chain_idx)
+            if chain:
                 if hasattr(chain, 'mute'):
-                    self.c_surface.log_message(f"🔇 Chain T{track_idx}D{device_idx}C{chain_idx} mute: {chain.mute}")
+                    if LOG_LISTENER_EVENTS:
+                        self.c_surface.log_message(f"🔇 Chain T{track_idx}D{device_idx}C{chain_idx} mute: {chain.mute}")
                     self._send_chain_mute(track_idx, device_idx, chain_idx, chain.mute)
     
     def _on_chain_solo_changed(self, track_idx, device_idx, chain_idx):
         """Chain solo state changed"""
         if self.c_surface._is_connected:
-            device = self._get_device(track_idx, device_idx)
-            if device and hasattr(device, 'chains') and chain_idx < len(device.chains):
-                chain = device.chains[chain_idx]
+            chain = self._chain_at(track_idx, device_idx, chain_idx)
+            if chain:
                 if hasattr(chain, 'solo'):
-                    self.c_surface.log_message(f"🔊 Chain T{track_idx}D{device_idx}C{chain_idx} solo: {chain.solo}")
+                    if LOG_LISTENER_EVENTS:
+                        self.c_surface.log_message(f"🔊 Chain T{track_idx}D{device_idx}C{chain_idx} solo: {chain.solo}")
                     self._send_chain_solo(track_idx, device_idx, chain_idx, chain.solo)
     
     def _on_chain_devices_changed(self, track_idx, device_idx, chain_idx):
         """Chain devices changed"""
         if self.c_surface._is_connected:
-            self.c_surface.log_message(f"🎛️ Chain T{track_idx}D{device_idx}C{chain_idx} devices changed")
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"🎛️ Chain T{track_idx}D{device_idx}C{chain_idx} devices changed")
             self._send_chain_devices(track_idx, device_idx, chain_idx)
     
     def _on_chain_volume_changed(self, track_idx, device_idx, chain_idx):
         """Chain volume changed"""
         if self.c_surface._is_connected:
-            device = self._get_device(track_idx, device_idx)
-            if device and hasattr(device, 'chains') and chain_idx < len(device.chains):
-                chain = device.chains[chain_idx]
+            chain = self._chain_at(track_idx, device_idx, chain_idx)
+            if chain:
                 if hasattr(chain, 'mixer_device') and chain.mixer_device:
                     mixer = chain.mixer_device
                     if hasattr(mixer, 'volume') and hasattr(mixer.volume, 'value'):
-                        volume = mixer.volume.value
-                        self.c_surface.log_message(f"🔊 Chain T{track_idx}D{device_idx}C{chain_idx} volume: {volume:.2f}")
-                        self._send_chain_volume(track_idx, device_idx, chain_idx, volume)
+                        if LOG_LISTENER_EVENTS:
+                            self.c_surface.log_message(f"🔊 Chain T{track_idx}D{device_idx}C{chain_idx} volume: {mixer.volume.value:.2f}")
+                        self._mark_value_dirty(('_send_chain_volume', track_idx, device_idx, chain_idx), mixer.volume)
     
     def _on_chain_pan_changed(self, track_idx, device_idx, chain_idx):
         """Chain pan changed"""
         if self.c_surface._is_connected:
-            device = self._get_device(track_idx, device_idx)
-            if device and hasattr(device, 'chains') and chain_idx < len(device.chains):
-                chain = device.chains[chain_idx]
+            chain = self._chain_at(track_idx, device_idx, chain_idx)
+            if chain:
                 if hasattr(chain, 'mixer_device') and chain.mixer_device:
                     mixer = chain.mixer_device
                     if hasattr(mixer, 'panning') and hasattr(mixer.panning, 'value'):
-                        pan = mixer.panning.value
-                        self.c_surface.log_message(f"🔄 Chain T{track_idx}D{device_idx}C{chain_idx} pan: {pan:.2f}")
-                        self._send_chain_pan(track_idx, device_idx, chain_idx, pan)
+                        if LOG_LISTENER_EVENTS:
+                            self.c_surface.log_message(f"🔄 Chain T{track_idx}D{device_idx}C{chain_idx} pan: {mixer.panning.value:.2f}")
+                        self._mark_value_dirty(('_send_chain_pan', track_idx, device_idx, chain_idx), mixer.panning)
     
     def _on_chain_send_changed(self, track_idx, device_idx, chain_idx, send_idx):
         """Chain send changed"""
         if self.c_surface._is_connected:
-            device = self._get_device(track_idx, device_idx)
-            if device and hasattr(device, 'chains') and chain_idx < len(device.chains):
-                chain = device.chains[chain_idx]
+            chain = self._chain_at(track_idx, device_idx, chain_idx)
+            if chain:
                 if hasattr(chain, 'mixer_device') and chain.mixer_device:
                     mixer = chain.mixer_device
                     if hasattr(mixer, 'sends') and send_idx < len(mixer.sends):
                         send = mixer.sends[send_idx]
                         if hasattr(send, 'value'):
-                            value = send.value
-                            self.c_surface.log_message(f"📤 Chain T{track_idx}D{device_idx}C{chain_idx}S{send_idx} send: {value:.2f}")
-                            self._send_chain_send(track_idx, device_idx, chain_idx, send_idx, value)
+                            if LOG_LISTENER_EVENTS:
+                                self.c_surface.log_message(f"📤 Chain T{track_idx}D{device_idx}C{chain_idx}S{send_idx} send: {send.value:.2f}")
+                            self._mark_value_dirty(('_send_chain_send', track_idx, device_idx, chain_idx, send_idx), send)
     
     def _on_chain_crossfade_changed(self, track_idx, device_idx, chain_idx):
         """Chain crossfade assignment changed"""
         if self.c_surface._is_connected:
-            device = self._get_device(track_idx, device_idx)
-            if device and hasattr(device, 'chains') and chain_idx < len(device.chains):
-                chain = device.chains[chain_idx]
+            chain = self._chain_at(track_idx, device_idx, chain_idx)
+            if chain:
                 if hasattr(chain, 'mixer_device') and chain.mixer_device:
                     mixer = chain.mixer_device
                     if hasattr(mixer, 'crossfade_assign'):
                         assign = mixer.crossfade_assign
-                        self.c_surface.log_message(f"⚖️ Chain T{track_idx}D{device_idx}C{chain_idx} crossfade: {assign}")
+                        if LOG_LISTENER_EVENTS:
+                            self.c_surface.log_message(f"⚖️ Chain T{track_idx}D{device_idx}C{chain_idx} crossfade: {assign}")
                         self._send_chain_crossfade(track_idx, device_idx, chain_idx, assign)
     
     def _on_rack_macro_changed(self, track_idx, device_idx, macro_idx):
         """Rack macro parameter changed"""
         if self.c_surface._is_connected:
-            device = self._get_device(track_idx, device_idx)
-            if device and hasattr(device, 'macros') and macro_idx < len(device.macros):
-                macro = device.macros[macro_idx]
+            macros = getattr(self._get_device(track_idx, device_idx), 'macros', None)
+            if macros is not None and macro_idx < len(macros):
+                macro = macros[macro_idx]
                 if hasattr(macro, 'value'):
-                    value = macro.value
-                    self.c_surface.log_message(f"🎚️ Rack T{track_idx}D{device_idx} macro {macro_idx}: {value:.2f}")
-                    self._send_rack_macro(track_idx, device_idx, macro_idx, value)
+                    if LOG_LISTENER_EVENTS:
+                        self.c_surface.log_message(f"🎚️ Rack T{track_idx}D{device_idx} macro {macro_idx}: {macro.value:.2f}")
+                    self._mark_value_dirty(('_send_rack_macro', track_idx, device_idx, macro_idx), macro)
     
     def _on_drum_pad_name_changed(self, track_idx, device_idx, pad_idx):
         """Drum pad name changed"""
         if self.c_surface._is_connected:
-            device = self._get_device(track_idx, device_idx)
-            if device and hasattr(device, 'drum_pads'):
-                pad_note = pad_idx + 36
-                if pad_note < len(device.drum_pads) and device.drum_pads[pad_note]:
-                    drum_pad = device.drum_pads[pad_note]
+            drum_pad = self._drum_pad_at(track_idx, device_idx, pad_idx)
+            if drum_pad:
+                if LOG_LISTENER_EVENTS:
                     self.c_surface.log_message(f"🥁 Drum pad T{track_idx}D{device_idx}P{pad_idx} name: '{drum_pad.name}'")
-                    self._send_drum_pad_name(track_idx, device_idx, pad_idx, drum_pad.name)
-                    self._send_drum_pad_info(track_idx, device_idx, pad_idx)
+                self._send_drum_pad_name(track_idx, device_idx, pad_idx, drum_pad.name)
+                self._send_drum_pad_info(track_idx, device_idx, pad_idx)
     
     def _on_drum_pad_mute_changed(self, track_idx, device_idx, pad_idx):
         """Drum pad mute state changed"""
         if self.c_surface._is_connected:
-            device = self._get_device(track_idx, device_idx)
-            if device and hasattr(device, 'drum_pads'):
-                pad_note = pad_idx + 36
-                if pad_note < len(device.drum_pads) and device.drum_pads[pad_note]:
-                    drum_pad = device.drum_pads[pad_note]
-                    if hasattr(drum_pad, 'mute'):
+            drum_pad = self._drum_pad_at(track_idx, device_idx, pad_idx)
+            if drum_pad:
+                if hasattr(drum_pad, 'mute'):
+                    if LOG_LISTENER_EVENTS:
                         self.c_surface.log_message(f"🔇 Drum pad T{track_idx}D{device_idx}P{pad_idx} mute: {drum_pad.mute}")
-                        self._send_drum_pad_info(track_idx, device_idx, pad_idx)
+                    self._send_drum_pad_info(track_idx, device_idx, pad_idx)
     
     def _on_drum_pad_solo_changed(self, track_idx, device_idx, pad_idx):
         """Drum pad solo state changed"""
         if self.c_surface._is_connected:
-            device = self._get_device(track_idx, device_idx)
-            if device and hasattr(device, 'drum_pads'):
-                pad_note = pad_idx + 36
-                if pad_note < len(device.drum_pads) and device.drum_pads[pad_note]:
-                    drum_pad = device.drum_pads[pad_note]
-                    if hasattr(drum_pad, 'solo'):
+            drum_pad = self._drum_pad_at(track_idx, device_idx, pad_idx)
+            if drum_pad:
+                if hasattr(drum_pad, 'solo'):
+                    if LOG_LISTENER_EVENTS:
                         self.c_surface.log_message(f"🔊 Drum pad T{track_idx}D{device_idx}P{pad_idx} solo: {drum_pad.solo}")
-                        self._send_drum_pad_info(track_idx, device_idx, pad_idx)
+                    self._send_drum_pad_info(track_idx, device_idx, pad_idx)
     
     def _on_drum_pad_sample_changed(self, track_idx, device_idx, pad_idx):
         """Drum pad sample changed"""
         if self.c_surface._is_connected:
-            self.c_surface.log_message(f"🎧 Drum pad T{track_idx}D{device_idx}P{pad_idx} sample changed")
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"🎧 Drum pad T{track_idx}D{device_idx}P{pad_idx} sample changed")
             self._send_drum_pad_info(track_idx, device_idx, pad_idx)
     
     def _on_plugin_preset_changed(self, track_idx, device_idx):
@@ -832,7 +991,8 @@ class DeviceManager:
             if device:
                 preset_name = getattr(device, 'selected_preset_name', 'Unknown')
                 preset_index = getattr(device, 'selected_preset_index', -1)
-                self.c_surface.log_message(f"🎵 Plugin T{track_idx}D{device_idx} preset: {preset_name} ({preset_index})")
+                if LOG_LISTENER_EVENTS:
+                    self.c_surface.log_message(f"🎵 Plugin T{track_idx}D{device_idx} preset: {preset_name} ({preset_index})")
                 self._send_plugin_preset_info(track_idx, device_idx, preset_index, preset_name)
     
     def _on_plugin_program_changed(self, track_idx, device_idx):
@@ -841,7 +1001,8 @@ class DeviceManager:
             device = self._get_device(track_idx, device_idx)
             if device:
                 program_name = getattr(device, 'selected_program_name', 'Unknown')
-                self.c_surface.log_message(f"🎹 Plugin T{track_idx}D{device_idx} program: {program_name}")
+                if LOG_LISTENER_EVENTS:
+                    self.c_surface.log_message(f"🎹 Plugin T{track_idx}D{device_idx} program: {program_name}")
                 self._send_plugin_program_info(track_idx, device_idx, program_name)
     
     def _on_plugin_latency_changed(self, track_idx, device_idx):
@@ -850,7 +1011,8 @@ class DeviceManager:
             device = self._get_device(track_idx, device_idx)
             if device:
                 latency = getattr(device, 'latency_in_ms', 0.0)
-                self.c_surface.log_message(f"⏱️ Plugin T{track_idx}D{device_idx} latency: {latency:.1f}ms")
+                if LOG_LISTENER_EVENTS:
+                    self.c_surface.log_message(f"⏱️ Plugin T{track_idx}D{device_idx} latency: {latency:.1f}ms")
                 self._send_plugin_latency_info(track_idx, device_idx, latency)
     
     def _on_plugin_ui_changed(self, track_idx, device_idx):
@@ -859,29 +1021,32 @@ class DeviceManager:
             device = self._get_device(track_idx, device_idx)
             if device:
                 ui_visible = getattr(device, 'is_showing_plugin_ui', False)
-                self.c_surface.log_message(f"🖥️ Plugin T{track_idx}D{device_idx} UI visible: {ui_visible}")
+                if LOG_LISTENER_EVENTS:
+                    self.c_surface.log_message(f"🖥️ Plugin T{track_idx}D{device_idx} UI visible: {ui_visible}")
                 self._send_plugin_ui_info(track_idx, device_idx, ui_visible)
     
     def _on_drum_pad_chains_changed(self, track_idx, device_idx, pad_idx):
         """Drum pad chains changed"""
         if self.c_surface._is_connected:
-            self.c_surface.log_message(f"🥁 Drum pad T{track_idx}D{device_idx}P{pad_idx} chains changed")
+            if LOG_LISTENER_EVENTS:
+                self.c_surface.log_message(f"🥁 Drum pad T{track_idx}D{device_idx}P{pad_idx} chains changed")
             self._send_drum_pad_state(track_idx, device_idx, pad_idx)
-            # Update complete NeoTrellis grid
-            self._send_neotrellis_drum_grid(track_idx, device_idx)
+            # Update complete NeoTrellis grid (once per tick however many pads changed)
+            self._mark_drum_grid_dirty(track_idx, device_idx)
     
     def _on_selected_drum_pad_changed(self, track_idx, device_idx):
         """Selected drum pad changed"""
         if self.c_surface._is_connected:
             device = self._get_device(track_idx, device_idx)
-            if device and hasattr(device, 'view') and hasattr(device.view, 'selected_drum_pad'):
+            if device and self._device_caps_of(track_idx, device_idx, device) & _CAP_VIEW and hasattr(device.view, 'selected_drum_pad'):
                 selected_pad = device.view.selected_drum_pad
                 pad_note = selected_pad.note if selected_pad else -1
                 pad_idx = pad_note - 36 if pad_note >= 36 else -1
-                self.c_surface.log_message(f"🥁 Device T{track_idx}D{device_idx} selected drum pad: {pad_idx}")
+                if LOG_LISTENER_EVENTS:
+                    self.c_surface.log_message(f"🥁 Device T{track_idx}D{device_idx} selected drum pad: {pad_idx}")
                 self._send_selected_drum_pad(track_idx, device_idx, pad_idx)
                 # Update complete NeoTrellis grid to show selection
-                self._send_neotrellis_drum_grid(track_idx, device_idx)
+                self._mark_drum_grid_dirty(track_idx, device_idx)
     
     # Device type specific handlers
     def _on_simpler_sample_name_changed(self, track_idx, device_idx):
@@ -890,17 +1055,10 @@ class DeviceManager:
             device = self._get_device(track_idx, device_idx)
             if device and hasattr(device, 'sample') and device.sample:
                 sample_name = device.sample.name
-                self.c_surface.log_message(f"🎵 Simpler T{track_idx}D{device_idx} sample: '{sample_name}'")
+                if LOG_LISTENER_EVENTS:
+                    self.c_surface.log_message(f"🎵 Simpler T{track_idx}D{device_idx} sample: '{sample_name}'")
                 self._send_simpler_sample_info(track_idx, device_idx, sample_name)
     
-    def _on_simpler_sample_length_changed(self, track_idx, device_idx):
-        """Simpler sample length changed"""
-        if self.c_surface._is_connected:
-            device = self._get_device(track_idx, device_idx)
-            if device and hasattr(device, 'sample') and device.sample:
-                sample_length = device.sample.length
-                self.c_surface.log_message(f"📏 Simpler T{track_idx}D{device_idx} length: {sample_length}")
-    
     def _on_eq_band_gain_changed(self, track_idx, device_idx, band_idx):
         """EQ band gain changed"""
         if self.c_surface._is_connected:
@@ -908,7 +1066,8 @@ class DeviceManager:
             if device and hasattr(device, 'bands') and band_idx < len(device.bands):
                 band = device.bands[band_idx]
                 gain = band.gain.value if hasattr(band, 'gain') else 0.0
-                self.c_surface.log_message(f"🎚️ EQ T{track_idx}D{device_idx}B{band_idx} gain: {gain:.2f}")
+                if LOG_LISTENER_EVENTS:
+                    self.c_surface.log_message(f"🎚️ EQ T{track_idx}D{device_idx}B{band_idx} gain: {gain:.2f}")
     
     def _on_eq_band_freq_changed(self, track_idx, device_idx, band_idx):
         """EQ band frequency changed"""
@@ -917,7 +1076,80 @@ class DeviceManager:
             if device and hasattr(device, 'bands') and band_idx < len(device.bands):
                 band = device.bands[band_idx]
                 freq = band.frequency.value if hasattr(band, 'frequency') else 0.0
-                self.c_surface.log_message(f"🎵 EQ T{track_idx}D{device_idx}B{band_idx} freq: {freq:.1f}Hz")
+                if LOG_LISTENER_EVENTS:
+                    self.c_surface.log_message(f"🎵 EQ T{track_idx}D{device_idx}B{band_idx} freq: {freq:.1f}Hz")
+    
+    # ========================================
+    # DEFERRED SENDS
+    # ========================================
+    
+    def _schedule_dirty_flush(self):
+        """Schedule one _flush_dirty on the next Live tick (only when queues were empty)"""
+        if len(self._dirty_params) + len(self._dirty_device_names) + len(self._dirty_drum_grids) + len(self._dirty_values) == 1:
+            self.c_surface.schedule_message(1, self._flush_dirty)
+    
+    def _mark_drum_grid_dirty(self, track_idx, device_idx):
+        """Queue a NeoTrellis drum grid resend for the next tick"""
+        grid_key = (track_idx, device_idx)
+        if grid_key not in self._dirty_drum_grids:
+            self._dirty_drum_grids.add(grid_key)
+            self._schedule_dirty_flush()
+    
+    def _mark_value_dirty(self, value_key, param):
+        """Queue a chain mixer/macro value send for the next tick (value_key is (sender name, *indices))"""
+        if value_key not in self._dirty_values:
+            self._dirty_values[value_key] = param
+            self._schedule_dirty_flush()
+    
+    def _flush_dirty(self):
+        """Drain dirty params/device names/drum grids/values, sending each once regardless of how many notifications fired"""
+        dirty_params, self._dirty_params = self._dirty_params, {}
+        dirty_names, self._dirty_device_names = self._dirty_device_names, set()
+        dirty_grids, self._dirty_drum_grids = self._dirty_drum_grids, set()
+        dirty_values, self._dirty_values = self._dirty_values, {}
+        if not self.c_surface._is_connected:
+            return
+        # Each entry is read and sent under its own guard so one stale Live object doesn't drop the rest of the tick
+        for (track_idx, device_idx, param_idx), param in dirty_params.items():
+            try:
+                value = param.value
+                if LOG_PARAMETER_CHANGES:
+                    self.c_surface.log_message(f"🎚️ Param T{track_idx}D{device_idx}P{param_idx}: {value:.2f}")
+                self._send_parameter_value(track_idx, device_idx, param_idx, value, param.name)
+            except Exception as e:
+                self.c_surface.log_message(f"❌ Error flushing param T{track_idx}D{device_idx}P{param_idx}: {e}")
+        
+        for track_idx, device_idx in dirty_names:
+            try:
+                device = self._get_device(track_idx, device_idx)
+                if device:
+                    if LOG_LISTENER_EVENTS:
+                        self.c_surface.log_message(f"🎛️ Device T{track_idx}D{device_idx} name: '{device.name}'")
+                    self._send_device_name(track_idx, device_idx, device.name)
+            except Exception as e:
+                self.c_surface.log_message(f"❌ Error flushing device T{track_idx}D{device_idx} name: {e}")
+        
+        for track_idx, device_idx in dirty_grids:
+            try:
+                self._send_neotrellis_drum_grid(track_idx, device_idx)
+            except Exception as e:
+                self.c_surface.log_message(f"❌ Error flushing drum grid T{track_idx}D{device_idx}: {e}")
+        
+        # Chain volume/pan/sends and rack macros: latest value only
+        for (sender_name, *indices), param in dirty_values.items():
+            try:
+                getattr(self, sender_name)(*indices, param.value)
+            except Exception as e:
+                self.c_surface.log_message(f"❌ Error flushing {sender_name}{tuple(indices)}: {e}")
+    
+    def _drop_dirty(self, track_idx, device_idx=None):
+        """Forget queued sends for a track (or one device) being rebuilt/pruned (their indices/param objects are stale)"""
+        def keep(key_track_idx, key_device_idx):
+            return key_track_idx != track_idx or (device_idx is not None and key_device_idx != device_idx)
+        self._dirty_params = {key: param for key, param in self._dirty_params.items() if keep(key[0], key[1])}
+        self._dirty_device_names = {key for key in self._dirty_device_names if keep(*key)}
+        self._dirty_drum_grids = {key for key in self._dirty_drum_grids if keep(*key)}
+        self._dirty_values = {key: param for key, param in self._dirty_values.items() if keep(key[1], key[2])}
     
     # ========================================
     # SEND METHODS
@@ -926,23 +1158,23 @@ class DeviceManager:
     def _send_device_name(self, track_idx, device_idx, name):
         """Send device name to hardware"""
         try:
-            name_bytes = name.encode('utf-8')[:12]  # Max 12 chars
-            payload = [track_idx, device_idx, len(name_bytes)]
-            payload.extend(list(name_bytes))
-            self.c_surface._send_sysex_command(CMD_DEVICE_LIST, payload)  # Reuse device list command
+            # Encode only the 12-char prefix (never shorter than 12 bytes) rather than the whole name
+            name_bytes = name[:12].encode('utf-8')[:12]  # Max 12 chars
+            payload = self._device_header(track_idx, device_idx) + bytes((len(name_bytes),)) + name_bytes
+            self._send_sysex(CMD_DEVICE_LIST, payload)  # Reuse device list command
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending device name T{track_idx}D{device_idx}: {e}")
     
     def _send_device_enabled_state(self, track_idx, device_idx, is_enabled):
         """Send device enabled state to hardware"""
         try:
-            payload = [track_idx, device_idx, 1 if is_enabled else 0]
-            self.c_surface._send_sysex_command(CMD_DEVICE_ENABLE, payload)
+            payload = self._device_header(track_idx, device_idx) + (b'\x01' if is_enabled else b'\x00')
+            self._send_sysex(CMD_DEVICE_ENABLE, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending device enabled T{track_idx}D{device_idx}: {e}")
     
-    def _send_parameter_value(self, track_idx, device_idx, param_idx, value, param_name):
-        """Send parameter value to hardware"""
+    def _send_parameter_value(self, track_idx, device_idx, param_idx, value, param_name, force=False):
+        """Send parameter value to hardware (skipped if the encoded message would be unchanged)"""
         try:
             # Validate and clamp value to MIDI range 0-127
             value_127 = int(value * 127)  # Convert to 0-127 range
@@ -950,10 +1182,17 @@ class DeviceManager:
             
             display_str = f"{value:.2f}"
             
+            # Small moves often land on the same 7-bit value and display string
+            param_key = (track_idx, device_idx, param_idx)
+            sent = (value_127, display_str)
+            if not force and self._last_sent_params.get(param_key) == sent:
+                return
+            self._last_sent_params[param_key] = sent
+            
             # Use the parameter encoding from MIDIUtils
             message = SysExEncoder.encode_param_value(track_idx, device_idx, param_idx, value_127, display_str)
             if message:
-                self.c_surface._send_midi(tuple(message))
+                self._send_midi(tuple(message))
                 
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending parameter T{track_idx}D{device_idx}P{param_idx}: {e}")
@@ -961,8 +1200,8 @@ class DeviceManager:
     def _send_selected_chain(self, track_idx, device_idx, chain_idx):
         """Send selected chain to hardware"""
         try:
-            payload = [track_idx, device_idx, chain_idx if chain_idx >= 0 else 127]
-            self.c_surface._send_sysex_command(CMD_CHAIN_SELECT, payload)
+            payload = self._device_header(track_idx, device_idx) + bytes((chain_idx if chain_idx >= 0 else 127,))
+            self._send_sysex(CMD_CHAIN_SELECT, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending selected chain T{track_idx}D{device_idx}: {e}")
     
@@ -972,17 +1211,17 @@ class DeviceManager:
             device = self._get_device(track_idx, device_idx)
             if device and hasattr(device, 'chains'):
                 chains_info = []
-                for chain in device.chains[:4]:  # Max 4 chains
+                for chain_idx, chain in _indexed_head(device.chains, 4):  # Max 4 chains
                     chains_info.append({
                         'name': chain.name,
                         'enabled': True,  # Chains don't have enabled state typically
-                        'index': list(device.chains).index(chain)
+                        'index': chain_idx
                     })
                 
                 # Use device list encoding
                 message = SysExEncoder.encode_device_list(track_idx, chains_info)
                 if message:
-                    self.c_surface._send_midi(tuple(message))
+                    self._send_midi(tuple(message))
                     
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending device chains T{track_idx}D{device_idx}: {e}")
@@ -990,10 +1229,9 @@ class DeviceManager:
     def _send_chain_name(self, track_idx, device_idx, chain_idx, name):
         """Send chain name to hardware"""
         try:
-            name_bytes = name.encode('utf-8')[:12]  # Max 12 chars
-            payload = [track_idx, device_idx, chain_idx, len(name_bytes)]
-            payload.extend(list(name_bytes))
-            self.c_surface._send_sysex_command(CMD_DEVICE_CHAIN, payload)
+            name_bytes = name[:12].encode('utf-8')[:12]  # Max 12 chars
+            payload = self._device_header(track_idx, device_idx) + bytes((chain_idx, len(name_bytes))) + name_bytes
+            self._send_sysex(CMD_DEVICE_CHAIN, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending chain name T{track_idx}D{device_idx}C{chain_idx}: {e}")
     
@@ -1001,13 +1239,9 @@ class DeviceManager:
         """Send chain color to hardware"""
         try:
             r, g, b = color_rgb
-            # Convert to MIDI range
-            r = min(127, max(0, r // 2))
-            g = min(127, max(0, g // 2))
-            b = min(127, max(0, b // 2))
-            
-            payload = [track_idx, device_idx, chain_idx, r, g, b]
-            self.c_surface._send_sysex_command(CMD_DEVICE_CHAIN, payload)
+            payload = self._device_header(track_idx, device_idx) + bytes((
+                chain_idx, _RGB_TO_MIDI[r & 0xFF], _RGB_TO_MIDI[g & 0xFF], _RGB_TO_MIDI[b & 0xFF]))
+            self._send_sysex(CMD_DEVICE_CHAIN, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending chain color T{track_idx}D{device_idx}C{chain_idx}: {e}")
     
@@ -1015,7 +1249,7 @@ class DeviceManager:
         """Send chain mute state to hardware"""
         try:
             payload = [track_idx, device_idx, chain_idx, 1 if mute_state else 0]
-            self.c_surface._send_sysex_command(CMD_CHAIN_MUTE, payload)
+            self._send_sysex(CMD_CHAIN_MUTE, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending chain mute T{track_idx}D{device_idx}C{chain_idx}: {e}")
     
@@ -1023,26 +1257,27 @@ class DeviceManager:
         """Send chain solo state to hardware"""
         try:
             payload = [track_idx, device_idx, chain_idx, 1 if solo_state else 0]
-            self.c_surface._send_sysex_command(CMD_CHAIN_SOLO, payload)
+            self._send_sysex(CMD_CHAIN_SOLO, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending chain solo T{track_idx}D{device_idx}C{chain_idx}: {e}")
     
     def _send_chain_devices(self, track_idx, device_idx, chain_idx):
         """Send chain devices list to hardware"""
         try:
-            device = self._get_device(track_idx, device_idx)
-            if device and hasattr(device, 'chains') and chain_idx < len(device.chains):
-                chain = device.chains[chain_idx]
+            chain = self._chain_at(track_idx, device_idx, chain_idx)
+            if chain:
                 if hasattr(chain, 'devices'):
+                    chain_devices = chain.devices
                     device_names = []
-                    for chain_device in chain.devices[:4]:  # Max 4 devices per chain
+                    for _, chain_device in _indexed_head(chain_devices, 4):  # Max 4 devices per chain
                         if chain_device:
                             name_bytes = chain_device.name.encode('utf-8')[:8]
-                            device_names.extend([len(name_bytes)] + list(name_bytes))
+                            device_names.append(len(name_bytes))
+                            device_names.extend(name_bytes)
                     
-                    payload = [track_idx, device_idx, chain_idx, len(chain.devices)] + device_names
+                    payload = [track_idx, device_idx, chain_idx, len(chain_devices)] + device_names
                     if len(payload) <= 50:  # Reasonable size limit
-                        self.c_surface._send_sysex_command(CMD_DEVICE_CHAIN, payload)
+                        self._send_sysex(CMD_DEVICE_CHAIN, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending chain devices T{track_idx}D{device_idx}C{chain_idx}: {e}")
     
@@ -1051,7 +1286,7 @@ class DeviceManager:
         try:
             volume_127 = int(volume * 127)
             payload = [track_idx, device_idx, chain_idx, volume_127]
-            self.c_surface._send_sysex_command(CMD_CHAIN_VOLUME, payload)
+            self._send_sysex(CMD_CHAIN_VOLUME, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending chain volume T{track_idx}D{device_idx}C{chain_idx}: {e}")
     
@@ -1060,7 +1295,7 @@ class DeviceManager:
         try:
             pan_127 = int((pan + 1.0) * 63.5)  # Convert -1.0 to 1.0 range to 0-127
             payload = [track_idx, device_idx, chain_idx, pan_127]
-            self.c_surface._send_sysex_command(CMD_CHAIN_PAN, payload)
+            self._send_sysex(CMD_CHAIN_PAN, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending chain pan T{track_idx}D{device_idx}C{chain_idx}: {e}")
     
@@ -1069,7 +1304,7 @@ class DeviceManager:
         try:
             send_127 = int(value * 127)
             payload = [track_idx, device_idx, chain_idx, send_idx, send_127]
-            self.c_surface._send_sysex_command(CMD_CHAIN_SEND, payload)
+            self._send_sysex(CMD_CHAIN_SEND, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending chain send T{track_idx}D{device_idx}C{chain_idx}S{send_idx}: {e}")
     
@@ -1079,7 +1314,7 @@ class DeviceManager:
             # Convert crossfade assign to number: 0=A, 1=None, 2=B
             assign_val = 0 if assign == 0 else (2 if assign == 2 else 1)
             payload = [track_idx, device_idx, chain_idx, assign_val]
-            self.c_surface._send_sysex_command(CMD_CHAIN_CROSSFADE, payload)
+            self._send_sysex(CMD_CHAIN_CROSSFADE, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending chain crossfade T{track_idx}D{device_idx}C{chain_idx}: {e}")
     
@@ -1088,112 +1323,122 @@ class DeviceManager:
         try:
             value_127 = int(value * 127)
             payload = [track_idx, device_idx, macro_idx, value_127]
-            self.c_surface._send_sysex_command(CMD_RACK_MACRO, payload)
+            self._send_sysex(CMD_RACK_MACRO, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending rack macro T{track_idx}D{device_idx}M{macro_idx}: {e}")
     
     def _send_drum_pad_name(self, track_idx, device_idx, pad_idx, name):
         """Send drum pad name to hardware"""
         try:
-            name_bytes = name.encode('utf-8')[:8]  # Max 8 chars for pad names
-            payload = [track_idx, device_idx, pad_idx, len(name_bytes)]
-            payload.extend(list(name_bytes))
-            self.c_surface._send_sysex_command(CMD_DRUM_PAD_STATE, payload)
+            name_bytes = name[:8].encode('utf-8')[:8]  # Max 8 chars for pad names
+            payload = self._device_header(track_idx, device_idx) + bytes((pad_idx, len(name_bytes))) + name_bytes
+            self._send_sysex(CMD_DRUM_PAD_STATE, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending drum pad name T{track_idx}D{device_idx}P{pad_idx}: {e}")
     
     def _send_drum_pad_state(self, track_idx, device_idx, pad_idx):
         """Send drum pad state to hardware"""
         try:
-            device = self._get_device(track_idx, device_idx)
-            if device and hasattr(device, 'drum_pads'):
+            drum_pads = getattr(self._get_device(track_idx, device_idx), 'drum_pads', None)
+            if drum_pads is not None:
                 pad_note = pad_idx + 36
-                has_pad = (pad_note < len(device.drum_pads) and 
-                          device.drum_pads[pad_note] is not None)
+                has_pad = (pad_note < len(drum_pads) and 
+                          drum_pads[pad_note] is not None)
                 
                 payload = [track_idx, device_idx, pad_idx, 1 if has_pad else 0]
-                self.c_surface._send_sysex_command(CMD_DRUM_PAD_STATE, payload)
+                self._send_sysex(CMD_DRUM_PAD_STATE, payload)
                 
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending drum pad state T{track_idx}D{device_idx}P{pad_idx}: {e}")
     
+    def _send_drum_pad_states_bulk(self, track_idx, device_idx):
+        """Send the first 16 drum pad states in a single CMD_DRUM_PAD_STATES frame: track, device, 16, states"""
+        try:
+            device = self._get_device(track_idx, device_idx)
+            drum_pads = getattr(device, 'drum_pads', None) if device else None
+            if drum_pads is None:
+                return
+            n_pads = len(drum_pads)
+            states = bytes(1 if pad_note < n_pads and drum_pads[pad_note] is not None else 0
+                           for pad_note in range(36, 52))
+            payload = self._device_header(track_idx, device_idx) + bytes((16,)) + states
+            self._send_sysex(CMD_DRUM_PAD_STATES, payload)
+        except Exception as e:
+            self.c_surface.log_message(f"❌ Error sending drum pad states T{track_idx}D{device_idx}: {e}")
+    
     def _send_selected_drum_pad(self, track_idx, device_idx, pad_idx):
         """Send selected drum pad to hardware"""
         try:
-            payload = [track_idx, device_idx, pad_idx if pad_idx >= 0 else 127]
-            self.c_surface._send_sysex_command(CMD_DRUM_RACK_STATE, payload)
+            payload = self._device_header(track_idx, device_idx) + bytes((pad_idx if pad_idx >= 0 else 127,))
+            self._send_sysex(CMD_DRUM_RACK_STATE, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending selected drum pad T{track_idx}D{device_idx}: {e}")
     
     def _send_drum_pad_info(self, track_idx, device_idx, pad_idx):
         """Send comprehensive drum pad information to hardware"""
         try:
-            device = self._get_device(track_idx, device_idx)
-            if device and hasattr(device, 'drum_pads'):
+            drum_pad = self._drum_pad_at(track_idx, device_idx, pad_idx)
+            if drum_pad:
                 pad_note = pad_idx + 36
-                if pad_note < len(device.drum_pads) and device.drum_pads[pad_note]:
-                    drum_pad = device.drum_pads[pad_note]
-                    
-                    # Pack drum pad data
-                    name_bytes = drum_pad.name.encode('utf-8')[:8] if hasattr(drum_pad, 'name') else []
-                    
-                    payload = [
-                        track_idx, device_idx, pad_idx, pad_note,  # Basic indices
-                        len(name_bytes)  # Name length
-                    ]
-                    payload.extend(list(name_bytes))  # Pad name
-                    
-                    # Pad state flags
-                    flags = 0
-                    if hasattr(drum_pad, 'mute') and drum_pad.mute:
-                        flags |= 0x01  # Muted
-                    if hasattr(drum_pad, 'solo') and drum_pad.solo:
-                        flags |= 0x02  # Solo
-                    if hasattr(drum_pad, 'chains') and drum_pad.chains:
-                        flags |= 0x04  # Has chains
-                    
-                    # Check for sample
-                    has_sample = False
-                    if hasattr(drum_pad, 'canonical_parent'):
-                        try:
-                            parent = drum_pad.canonical_parent
-                            has_sample = (hasattr(parent, 'sample') and 
-                                        parent.sample is not None and
-                                        hasattr(parent.sample, 'file_path') and
-                                        parent.sample.file_path != '')
-                        except Exception:
-                            pass
-                    
-                    if has_sample:
-                        flags |= 0x08  # Has sample
-                    
-                    payload.append(flags)
-                    
-                    # Chain count
-                    chain_count = 0
-                    if hasattr(drum_pad, 'chains') and drum_pad.chains:
-                        chain_count = len(drum_pad.chains)
-                    payload.append(min(chain_count, 255))  # Max 255 chains
-                    
-                    self.c_surface._send_sysex_command(CMD_DRUM_PAD_STATE, payload)
-                    
+                
+                # Pack drum pad data
+                name_bytes = drum_pad.name[:8].encode('utf-8')[:8] if hasattr(drum_pad, 'name') else b''
+                
+                payload = [
+                    track_idx, device_idx, pad_idx, pad_note,  # Basic indices
+                    len(name_bytes)  # Name length
+                ]
+                payload.extend(name_bytes)  # Pad name
+                
+                # Pad state flags
+                flags = 0
+                if hasattr(drum_pad, 'mute') and drum_pad.mute:
+                    flags |= 0x01  # Muted
+                if hasattr(drum_pad, 'solo') and drum_pad.solo:
+                    flags |= 0x02  # Solo
+                if hasattr(drum_pad, 'chains') and drum_pad.chains:
+                    flags |= 0x04  # Has chains
+                
+                # Check for sample
+                has_sample = False
+                if hasattr(drum_pad, 'canonical_parent'):
+                    try:
+                        parent = drum_pad.canonical_parent
+                        has_sample = (hasattr(parent, 'sample') and 
+                                    parent.sample is not None and
+                                    hasattr(parent.sample, 'file_path') and
+                                    parent.sample.file_path != '')
+                    except Exception:
+                        pass
+                
+                if has_sample:
+                    flags |= 0x08  # Has sample
+                
+                payload.append(flags)
+                
+                # Chain count
+                chain_count = 0
+                if hasattr(drum_pad, 'chains') and drum_pad.chains:
+                    chain_count = len(drum_pad.chains)
+                payload.append(min(chain_count, 255))  # Max 255 chains
+                
+                self._send_sysex(CMD_DRUM_PAD_STATE, payload)
+                
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending drum pad info T{track_idx}D{device_idx}P{pad_idx}: {e}")
     
     def _send_plugin_preset_info(self, track_idx, device_idx, preset_index, preset_name):
         """Send plugin preset information to hardware"""
         try:
-            name_bytes = preset_name.encode('utf-8')[:16] if preset_name else []
-            payload = [
-                track_idx, device_idx,
+            name_bytes = preset_name[:16].encode('utf-8')[:16] if preset_name else b''
+            payload = self._device_header(track_idx, device_idx) + bytes((
                 (preset_index >> 8) & 0x7F,  # High byte
-                preset_index & 0x7F,         # Low byte  
+                preset_index & 0x7F,         # Low byte
                 len(name_bytes)
-            ]
-            payload.extend(list(name_bytes))
+            )) + name_bytes
             
             # Could add CMD_PLUGIN_PRESET = 0x71 to consts.py
-            self.c_surface._send_sysex_command(0x71, payload)
+            self._send_sysex(0x71, payload)
             
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending plugin preset info: {e}")
@@ -1201,12 +1446,11 @@ class DeviceManager:
     def _send_plugin_program_info(self, track_idx, device_idx, program_name):
         """Send plugin program information to hardware"""
         try:
-            name_bytes = program_name.encode('utf-8')[:16] if program_name else []
-            payload = [track_idx, device_idx, len(name_bytes)]
-            payload.extend(list(name_bytes))
+            name_bytes = program_name[:16].encode('utf-8')[:16] if program_name else b''
+            payload = self._device_header(track_idx, device_idx) + bytes((len(name_bytes),)) + name_bytes
             
             # Could add CMD_PLUGIN_PROGRAM = 0x72 to consts.py
-            self.c_surface._send_sysex_command(0x72, payload)
+            self._send_sysex(0x72, payload)
             
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending plugin program info: {e}")
@@ -1224,7 +1468,7 @@ class DeviceManager:
             ]
             
             # Could add CMD_PLUGIN_LATENCY = 0x73 to consts.py
-            self.c_surface._send_sysex_command(0x73, payload)
+            self._send_sysex(0x73, payload)
             
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending plugin latency info: {e}")
@@ -1232,10 +1476,10 @@ class DeviceManager:
     def _send_plugin_ui_info(self, track_idx, device_idx, ui_visible):
         """Send plugin UI visibility information to hardware"""
         try:
-            payload = [track_idx, device_idx, 1 if ui_visible else 0]
+            payload = self._device_header(track_idx, device_idx) + (b'\x01' if ui_visible else b'\x00')
             
             # Could add CMD_PLUGIN_UI = 0x74 to consts.py
-            self.c_surface._send_sysex_command(0x74, payload)
+            self._send_sysex(0x74, payload)
             
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending plugin UI info: {e}")
@@ -1244,50 +1488,43 @@ class DeviceManager:
         """Send complete NeoTrellis drum grid state (4x8 = 32 pads)"""
         try:
             device = self._get_device(track_idx, device_idx)
-            if not device or not hasattr(device, 'can_have_drum_pads') or not device.can_have_drum_pads:
+            if not device or not self._device_caps_of(track_idx, device_idx, device) & _CAP_DRUM_PADS:
                 return
             
-            # NeoTrellis 4x8 grid (32 pads total)
-            grid_data = []
+            # Resolve LOM proxies once instead of per pad
+            drum_pads = getattr(device, 'drum_pads', None)
+            n_pads = len(drum_pads) if drum_pads else 0
+            valid_pads = max(0, min(32, n_pads - 36))  # Grid pads backed by a drum pad (notes 36+)
+            view = getattr(device, 'view', None)
+            selected = getattr(view, 'selected_drum_pad', None) if view else None
+            selected_idx = getattr(selected, 'note', -1) - 36 if selected is not None else -1
             
-            for row in range(4):
-                for col in range(8):
-                    pad_idx = row * 8 + col  # 0-31
-                    pad_note = pad_idx + 36  # Standard drum mapping starts at C2 (36)
-                    
-                    # Check if drum pad exists and has content
-                    if (hasattr(device, 'drum_pads') and 
-                        pad_note < len(device.drum_pads) and 
-                        device.drum_pads[pad_note]):
-                        
-                        drum_pad = device.drum_pads[pad_note]
-                        
-                        # Determine color based on pad state
-                        has_sample = bool(drum_pad.chains and len(drum_pad.chains) > 0)
-                        is_active = has_sample and any(chain.is_active for chain in drum_pad.chains)
-                        
-                        # Color mapping: 0=empty, 1=loaded, 2=active, 3=selected
-                        if is_active:
-                            color = 2  # Active (bright)
-                        elif has_sample:
-                            color = 1  # Loaded (dim)
-                        else:
-                            color = 0  # Empty
-                            
-                        # Check if this is the selected pad
-                        if (hasattr(device, 'view') and 
-                            hasattr(device.view, 'selected_drum_pad') and
-                            device.view.selected_drum_pad and
-                            device.view.selected_drum_pad == drum_pad):
-                            color = 3  # Selected
-                    else:
-                        color = 0  # Empty/no pad
+            # Payload: track, device, then the NeoTrellis 4x8 grid (32 pads), 0 = empty/no pad
+            grid = bytearray(34)
+            grid[0:2] = self._device_header(track_idx, device_idx)
+            
+            for pad_idx in range(valid_pads):
+                drum_pad = drum_pads[pad_idx + 36]  # Standard drum mapping starts at C2 (36)
+                
+                # Check if drum pad exists and has content
+                if drum_pad:
+                    # Determine color based on pad state
+                    chains = list(drum_pad.chains)
+                    has_sample = len(chains) > 0
+                    is_active = has_sample and any(chain.is_active for chain in chains)
                     
-                    grid_data.append(color)
+                    # Color mapping: 0=empty, 1=loaded, 2=active, 3=selected
+                    if pad_idx == selected_idx:
+                        grid[2 + pad_idx] = 3  # Selected
+                    elif is_active:
+                        grid[2 + pad_idx] = 2  # Active (bright)
+                    elif has_sample:
+                        grid[2 + pad_idx] = 1  # Loaded (dim)
             
             # Send grid state: track, device, 32 color bytes
-            payload = [track_idx, device_idx] + grid_data
-            self.c_surface._send_sysex_command(CMD_NEOTRELLIS_GRID, payload, silent=True)
+            # Keyed per rack so a batch holding several racks' grids keeps each one
+            self._send_sysex(CMD_NEOTRELLIS_GRID, bytes(grid), silent=True,
+                             state_key=f"{CMD_NEOTRELLIS_GRID}_T{track_idx}D{device_idx}")
             
             self.c_surface.log_message(f"🎛️ Sent NeoTrellis grid for T{track_idx}D{device_idx}")
             
@@ -1297,11 +1534,10 @@ class DeviceManager:
     def _send_simpler_sample_info(self, track_idx, device_idx, sample_name):
         """Send Simpler sample info to hardware"""
         try:
-            name_bytes = sample_name.encode('utf-8')[:12]  # Max 12 chars
-            payload = [track_idx, device_idx, len(name_bytes)]
-            payload.extend(list(name_bytes))
+            name_bytes = sample_name[:12].encode('utf-8')[:12]  # Max 12 chars
+            payload = self._device_header(track_idx, device_idx) + bytes((len(name_bytes),)) + name_bytes
             # Could use a specific simpler command or reuse device name
-            self.c_surface._send_sysex_command(CMD_DEVICE_LIST, payload)
+            self._send_sysex(CMD_DEVICE_LIST, payload)
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending simpler sample T{track_idx}D{device_idx}: {e}")
     
@@ -1310,28 +1546,65 @@ class DeviceManager:
     # ========================================
     
     def _get_device(self, track_idx, device_idx):
-        """Get device by track and device index"""
+        """Get device by track and device index (cached for monitored devices)"""
+        track_devices = self._device_sources.get(track_idx)
+        if track_devices is not None and device_idx < len(track_devices):
+            device = track_devices[device_idx]
+            if device is not None:
+                return device
         try:
-            if track_idx >= len(self.song.tracks):
+            tracks = self.song.tracks
+            if track_idx >= len(tracks):
                 return None
                 
-            track = self.song.tracks[track_idx]
-            devices = list(track.devices)
-            
-            if device_idx >= len(devices):
+            devices = tracks[track_idx].devices
+            if not 0 <= device_idx < len(devices):
                 return None
                 
             return devices[device_idx]
             
-        except:
+        except (IndexError, AttributeError, RuntimeError):
             return None
     
+    def _device_header(self, track_idx, device_idx):
+        """Get the (track_idx, device_idx) payload prefix, pre-encoded for monitored devices"""
+        header = self._device_headers.get((track_idx, device_idx))
+        if header is None:
+            header = bytes((track_idx, device_idx))
+        return header
+    
+    def _device_caps_of(self, track_idx, device_idx, device):
+        """Get a device's _CAP_* bits, cached for monitored devices"""
+        caps = self._device_caps.get((track_idx, device_idx))
+        if caps is None:
+            caps = _probe_device_caps(device)
+        return caps
+    
+    def _rebuild_chain_index(self, track_idx, device_idx, device):
+        """Rebuild the chain -> index map for a rack device"""
+        self._chain_index[(track_idx, device_idx)] = {
+            chain: chain_idx for chain_idx, chain in enumerate(device.chains)
+        }
+    
+    def _chain_index_of(self, track_idx, device_idx, device, chain):
+        """Get index of chain in device.chains (-1 if none), using the cached map when possible"""
+        if not chain:
+            return -1
+        chain_idx = self._chain_index.get((track_idx, device_idx), {}).get(chain)
+        if chain_idx is not None:
+            return chain_idx
+        for chain_idx, candidate in enumerate(device.chains):
+            if candidate == chain:
+                return chain_idx
+        return -1
+    
     def get_device_info(self, track_idx, device_idx):
         """Get complete device information"""
         device = self._get_device(track_idx, device_idx)
         if not device:
             return None
             
+        caps = self._device_caps_of(track_idx, device_idx, device)
         info = {
             'name': device.name,
             'is_active': device.is_active,
@@ -1340,7 +1613,7 @@ class DeviceManager:
         }
         
         # Add parameter info
-        for param_idx, param in enumerate(device.parameters[:8]):
+        for param_idx, param in _indexed_head(device.parameters, 8):
             info['parameters'].append({
                 'index': param_idx,
                 'name': param.name,
@@ -1350,9 +1623,9 @@ class DeviceManager:
             })
         
         # Add RackDevice and Chain class comprehensive info
-        if hasattr(device, 'can_have_chains') and device.can_have_chains:
+        if caps & _CAP_CHAINS:
             info['chains'] = []
-            for chain_idx, chain in enumerate(device.chains[:8]):  # Support up to 8 chains
+            for chain_idx, chain in _indexed_head(device.chains, 8):  # Support up to 8 chains
                 chain_info = {
                     'index': chain_idx,
                     'name': getattr(chain, 'name', f'Chain {chain_idx}'),
@@ -1364,10 +1637,10 @@ class DeviceManager:
                 
                 # Chain devices list (Chain.devices property)
                 if hasattr(chain, 'devices'):
-                    for device_idx, chain_device in enumerate(chain.devices[:4]):
+                    for chain_device_idx, chain_device in _indexed_head(chain.devices, 4):
                         if chain_device:
                             chain_info['devices'].append({
-                                'index': device_idx,
+                                'index': chain_device_idx,
                                 'name': chain_device.name,
                                 'is_active': getattr(chain_device, 'is_active', True),
                                 'class_name': chain_device.__class__.__name__
@@ -1385,7 +1658,7 @@ class DeviceManager:
                     
                     # Chain sends
                     if hasattr(mixer, 'sends'):
-                        for send_idx, send in enumerate(mixer.sends[:4]):
+                        for send_idx, send in _indexed_head(mixer.sends, 4):
                             if send:
                                 chain_info['mixer']['sends'].append({
                                     'index': send_idx,
@@ -1395,14 +1668,14 @@ class DeviceManager:
                 info['chains'].append(chain_info)
             
             # Selected chain info
-            if hasattr(device, 'view') and hasattr(device.view, 'selected_chain'):
+            if caps & _CAP_VIEW and hasattr(device.view, 'selected_chain'):
                 selected_chain = device.view.selected_chain
-                info['selected_chain_idx'] = list(device.chains).index(selected_chain) if selected_chain else -1
+                info['selected_chain_idx'] = self._chain_index_of(track_idx, device_idx, device, selected_chain)
             
             # Rack macro controls
             if hasattr(device, 'macros'):
                 info['macros'] = []
-                for macro_idx, macro in enumerate(device.macros[:8]):
+                for macro_idx, macro in _indexed_head(device.macros, 8):
                     if macro:
                         info['macros'].append({
                             'index': macro_idx,
@@ -1412,12 +1685,14 @@ class DeviceManager:
                             'max': getattr(macro, 'max', 1.0)
                         })
         
-        if hasattr(device, 'can_have_drum_pads') and device.can_have_drum_pads:
+        if caps & _CAP_DRUM_PADS:
             info['drum_pads'] = []
+            drum_pads = device.drum_pads
+            n_pads = len(drum_pads)
             for pad_idx in range(16):
                 pad_note = pad_idx + 36
-                if pad_note < len(device.drum_pads) and device.drum_pads[pad_note]:
-                    drum_pad = device.drum_pads[pad_note]
+                if pad_note < n_pads and drum_pads[pad_note]:
+                    drum_pad = drum_pads[pad_note]
                     # Complete DrumPad info according to Live Object Model
                     pad_info = {
                         'index': pad_idx,
@@ -1462,41 +1737,116 @@ class DeviceManager:
             if not device:
                 return
             
-            # Send device basic info
-            self._send_device_name(track_idx, device_idx, device.name)
-            self._send_device_enabled_state(track_idx, device_idx, device.is_active)
+            caps = self._device_caps_of(track_idx, device_idx, device)
+            
+            # Queue the whole device snapshot and flush it in one pass
+            self.c_surface.begin_batch()
+            try:
+                # Send device basic info
+                self._send_device_name(track_idx, device_idx, device.name)
+                self._send_device_enabled_state(track_idx, device_idx, device.is_active)
             
-            # Send parameters
-            for param_idx, param in enumerate(device.parameters[:8]):
-                self._send_parameter_value(track_idx, device_idx, param_idx, param.value, param.name)
+                # Send parameters
+                for param_idx, param in _indexed_head(device.parameters, 8):
+                    self._send_parameter_value(track_idx, device_idx, param_idx, param.value, param.name, force=True)
             
-            # Send device-specific info
-            if hasattr(device, 'can_have_chains') and device.can_have_chains:
-                self._send_device_chains(track_idx, device_idx)
+                # Send device-specific info
+                if caps & _CAP_CHAINS:
+                    self._send_device_chains(track_idx, device_idx)
                 
-                if hasattr(device, 'view') and hasattr(device.view, 'selected_chain'):
-                    selected_chain = device.view.selected_chain
-                    chain_idx = list(device.chains).index(selected_chain) if selected_chain else -1
-                    self._send_selected_chain(track_idx, device_idx, chain_idx)
-            
-            if hasattr(device, 'can_have_drum_pads') and device.can_have_drum_pads:
-                # Send complete NeoTrellis drum grid (32 pads with colors)
-                self._send_neotrellis_drum_grid(track_idx, device_idx)
+                    if caps & _CAP_VIEW and hasattr(device.view, 'selected_chain'):
+                        selected_chain = device.view.selected_chain
+                        chain_idx = self._chain_index_of(track_idx, device_idx, device, selected_chain)
+                        self._send_selected_chain(track_idx, device_idx, chain_idx)
+            
+                if caps & _CAP_DRUM_PADS:
+                    # Send complete NeoTrellis drum grid (32 pads with colors)
+                    self._send_neotrellis_drum_grid(track_idx, device_idx)
                 
-                # Send individual drum pad states for compatibility
-                for pad_idx in range(16):
-                    self._send_drum_pad_state(track_idx, device_idx, pad_idx)
+                    # Send drum pad states for compatibility (one bulk frame once the firmware parses it)
+                    if ENABLE_DRUM_PAD_STATES_BULK:
+                        self._send_drum_pad_states_bulk(track_idx, device_idx)
+                    else:
+                        for pad_idx in range(16):
+                            self._send_drum_pad_state(track_idx, device_idx, pad_idx)
                 
-                # Send selected drum pad
-                if hasattr(device, 'view') and hasattr(device.view, 'selected_drum_pad'):
-                    selected_pad = device.view.selected_drum_pad
-                    pad_note = selected_pad.note if selected_pad else -1
-                    pad_idx = pad_note - 36 if pad_note >= 36 else -1
-                    self._send_selected_drum_pad(track_idx, device_idx, pad_idx)
+                    # Send selected drum pad
+                    if caps & _CAP_VIEW and hasattr(device.view, 'selected_drum_pad'):
+                        selected_pad = device.view.selected_drum_pad
+                        pad_note = selected_pad.note if selected_pad else -1
+                        pad_idx = pad_note - 36 if pad_note >= 36 else -1
+                        self._send_selected_drum_pad(track_idx, device_idx, pad_idx)
+            finally:
+                self.c_surface.end_batch()
             
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending device T{track_idx}D{device_idx} state: {e}")
     
+    def _remove_single_device(self, track_idx, device_idx):
+        """Remove listeners and cached state for one device (removal goes through the cached object, so it runs first)"""
+        device_key = (track_idx, device_idx)
+        for param_key in [key for key in self._param_listeners if key[0] == track_idx and key[1] == device_idx]:
+            self._cleanup_parameter_listeners(*param_key, self._param_listeners.pop(param_key))
+        listeners = self._device_listeners.pop(device_key, None)
+        if listeners:
+            self._cleanup_device_listeners(track_idx, device_idx, listeners)
+        drum_listeners = self._drum_listeners.pop(device_key, None)
+        if drum_listeners:
+            self._cleanup_drum_listeners(track_idx, device_idx, drum_listeners)
+        if self._focused_device_key == device_key:
+            self._detach_focus_listeners()
+        
+        self._listeners_by_track.get(track_idx, set()).discard(device_idx)
+        self._chain_index.pop(device_key, None)
+        self._device_headers.pop(device_key, None)
+        self._device_caps.pop(device_key, None)
+        self._device_sources[track_idx][device_idx] = None
+        self._drop_dirty(track_idx, device_idx)
+    
+    def _prune_stale_devices(self, track_idx):
+        """Drop listeners/cached objects for devices on a track whose index now points at a different Live object
+        Returns the stale device count"""
+        track_devices = self._device_sources.get(track_idx)
+        if not track_devices:
+            return 0
+        tracks = self.song.tracks
+        devices = tracks[track_idx].devices if track_idx < len(tracks) else ()
+        num_devices = len(devices)
+        
+        stale_devices = [
+            device_idx for device_idx, device in enumerate(track_devices)
+            if device is not None and (device_idx >= num_devices or devices[device_idx] != device)
+        ]
+        for device_idx in stale_devices:
+            self._remove_single_device(track_idx, device_idx)
+        return len(stale_devices)
+    
+    def _on_track_devices_changed(self, track_idx):
+        """Devices added/removed/moved on a watched track: drop cached devices that moved"""
+        try:
+            stale_devices = self._prune_stale_devices(track_idx)
+            if LOG_LISTENER_EVENTS and stale_devices:
+                self.c_surface.log_message(f"🔄 Dropped {stale_devices} moved devices on track {track_idx}")
+        except Exception as e:
+            self.c_surface.log_message(f"❌ Error pruning track {track_idx} device cache: {e}")
+    
+    def _on_song_tracks_changed(self):
+        """Tracks added/removed/moved: re-point the devices list listeners and drop cached devices that moved"""
+        try:
+            tracks = self.song.tracks
+            num_tracks = len(tracks)
+            for track_idx, (track, _) in list(self._track_devices_listeners.items()):
+                if track_idx >= num_tracks or tracks[track_idx] != track:
+                    self._unwatch_track_devices(track_idx)
+                    if track_idx < num_tracks:
+                        self._watch_track_devices(track_idx, tracks[track_idx])
+            
+            stale_devices = sum(self._prune_stale_devices(track_idx) for track_idx in list(self._device_sources))
+            if LOG_LISTENER_EVENTS and stale_devices:
+                self.c_surface.log_message(f"🔄 Dropped {stale_devices} moved devices")
+        except Exception as e:
+            self.c_surface.log_message(f"❌ Error pruning device cache: {e}")
+    
     def refresh_track_devices(self, track_idx):
         """Refresh device listeners for a specific track when devices change"""
         try:
@@ -1506,20 +1856,40 @@ class DeviceManager:
             track = self.song.tracks[track_idx]
             self.c_surface.log_message(f"🔄 Refreshing devices for track {track_idx}...")
             
+            # Clean up existing parameter listeners for this track (before device objects are dropped)
+            param_keys_to_remove = [key for key in self._param_listeners.keys() if key[0] == track_idx]
+            for key in param_keys_to_remove:
+                self._cleanup_parameter_listeners(*key, self._param_listeners.pop(key))
+            
             # Clean up existing device listeners for this track
-            keys_to_remove = [(t_idx, d_idx) for (t_idx, d_idx) in self._device_listeners.keys() if t_idx == track_idx]
-            for key in keys_to_remove:
-                track_idx_old, device_idx_old = key
-                listeners = self._device_listeners[key]
-                self._cleanup_device_listeners(track_idx_old, device_idx_old, listeners)
-                del self._device_listeners[key]
+            for device_idx_old in self._listeners_by_track.pop(track_idx, ()):
+                key = (track_idx, device_idx_old)
+                self._cleanup_device_listeners(track_idx, device_idx_old, self._device_listeners.pop(key))
+                drum_listeners = self._drum_listeners.pop(key, None)
+                if drum_listeners:
+                    self._cleanup_drum_listeners(track_idx, device_idx_old, drum_listeners)
+                self._chain_index.pop(key, None)
+                self._device_headers.pop(key, None)
+                self._device_caps.pop(key, None)
+            
+            self._device_sources.pop(track_idx, None)
+            self._drop_dirty(track_idx)
+            
+            # Focus listeners carry device indices that may have shifted on this track
+            focused_key = self._focused_device_key
+            if focused_key and focused_key[0] == track_idx:
+                self._detach_focus_listeners()
             
             # Setup listeners for all current devices in this track
+            self._watch_track_devices(track_idx, track)
             if hasattr(track, 'devices'):
                 for device_idx, device in enumerate(track.devices):
                     if device:
-                        self._setup_single_device_listeners(track_idx, device_idx)
-                        self.c_surface.log_message(f"🎛️ Setup device T{track_idx}D{device_idx}: {device.name}")
+                        self._setup_single_device_listeners(track_idx, device_idx, device)
+                        if DEBUG_ENABLED:
+                            self.c_surface.log_message(f"🎛️ Setup device T{track_idx}D{device_idx}: {device.name}")
+            
+            self._update_focus_listeners()
             
             self.c_surface.log_message(f"✅ Track {track_idx} device listeners refreshed")
             
@@ -1527,7 +1897,16 @@ class DeviceManager:
             self.c_surface.log_message(f"❌ Error refreshing track {track_idx} devices: {e}")
     
     def refresh_all_tracks(self):
-        """Refresh device listeners for all tracks (when tracks are added/removed)"""
+        """Refresh device listeners for all tracks (when tracks are added/removed), once per tick"""
+        if not self._refresh_all_pending:
+            self._refresh_all_pending = True
+            self.c_surface.schedule_message(1, self._refresh_all_tracks_now)
+    
+    def _refresh_all_tracks_now(self):
+        """Run a deferred refresh_all_tracks"""
+        self._refresh_all_pending = False
+        if not self._is_active:
+            return  # Cleaned up while the refresh was pending
         try:
             self.c_surface.log_message("🔄 Refreshing all device listeners...")
             
@@ -1543,15 +1922,28 @@ class DeviceManager:
             self.c_surface.log_message(f"❌ Error refreshing all device listeners: {e}")
     
     def send_complete_state(self):
-        """Send complete state for all devices"""
+        """Send complete state for all devices, once per tick"""
+        if not self._send_state_pending:
+            self._send_state_pending = True
+            self.c_surface.schedule_message(1, self._send_complete_state_now)
+    
+    def _send_complete_state_now(self):
+        """Run a deferred send_complete_state"""
+        self._send_state_pending = False
         if not self.c_surface._is_connected:
             return
             
         try:
             self.c_surface.log_message("📡 Sending complete device state...")
             
-            for (track_idx, device_idx) in self._device_listeners.keys():
-                self.send_complete_device_state(track_idx, device_idx)
+            # LOM reads must stay on Live's main thread, so devices are walked serially;
+            # the batch still defers all output to a single flush at the end
+            self.c_surface.begin_batch()
+            try:
+                for (track_idx, device_idx) in self._device_listeners.keys():
+                    self.send_complete_device_state(track_idx, device_idx)
+            finally:
+                self.c_surface.end_batch()
             
             self.c_surface.log_message("✅ Device state sent")
             
@@ -1583,18 +1975,20 @@ class DeviceManager:
     def navigate_device(self, direction):
         """Navigate to next/previous device"""
         try:
-            if direction > 0:  # Next device
-                self._current_device += 1
-            else:  # Previous device
-                self._current_device = max(0, self._current_device - 1)
+            tracks = self.song.tracks
+            if self._current_track >= len(tracks):
+                return
             
-            # Check if device exists
-            device = self._get_device(self._current_track, self._current_device)
-            if device:
-                self.select_device(self._current_track, self._current_device)
-            else:
-                # Wrap around or stay at boundary
-                self._current_device = max(0, self._current_device - 1)
+            # Clamp to the track's device range so select_device gets a known-good index
+            device_count = len(tracks[self._current_track].devices)
+            if device_count == 0:
+                return
+            step = 1 if direction > 0 else -1
+            new_device = max(0, min(device_count - 1, self._current_device + step))
+            
+            # Stay at the boundary
+            if new_device != self._current_device:
+                self.select_device(self._current_track, new_device)
                 
         except Exception as e:
             self.c_surface.log_message(f"❌ Error navigating device: {e}")
@@ -1629,27 +2023,23 @@ class DeviceManager:
             if not device:
                 return
                 
-            total_params = len(device.parameters)
+            parameters = device.parameters
+            total_params = len(parameters)
             total_pages = (total_params + 7) // 8
             start_param = page * 8
+            page_params = parameters[start_param:start_param + 8]  # One proxy slice per page
             
-            params_info = []
-            for i in range(8):
-                param_idx = start_param + i
-                if param_idx < total_params:
-                    param = device.parameters[param_idx]
-                    params_info.append({
-                        'index': param_idx,
-                        'value': int(param.value * 127),
-                        'name': param.name
-                    })
-                else:
-                    params_info.append({'index': 0xFF})  # Empty slot
+            # Parallel index/value slots; index 0x7F marks an empty slot
+            indexes = bytearray(b'\x7f' * 8)
+            values = bytearray(8)
+            for i, param in enumerate(page_params):
+                indexes[i] = (start_param + i) & 0x7F
+                values[i] = max(0, min(127, int(param.value * 127)))
             
             # Use device params encoding from MIDIUtils
-            message = SysExEncoder.encode_device_params(track_idx, device_idx, page, total_pages, params_info)
+            message = SysExEncoder.encode_device_params(track_idx, device_idx, page, total_pages, indexes, values)
             if message:
-                self.c_surface._send_midi(tuple(message))
+                self._send_midi(tuple(message))
                 
         except Exception as e:
             self.c_surface.log_message(f"❌ Error sending device param page T{track_idx}D{device_idx}: {e}")
@@ -1662,19 +2052,18 @@ class DeviceManager:
         """Handle encoder changes with soft takeover"""
         try:
             device = self._get_device(track_idx, device_idx)
-            if not device or param_idx >= len(device.parameters):
+            parameters = device.parameters if device else ()
+            if param_idx >= len(parameters):
                 return
                 
-            param = device.parameters[param_idx]
+            param = parameters[param_idx]
             param_key = (track_idx, device_idx, param_idx)
             
             # Current parameter value in hardware range (0-127)
             current_value_127 = int(param.value * 127)
             
-            # Check if this encoder is already taken over
-            is_taken_over = self._takeover_active.get(param_key, False)
-            
-            if not is_taken_over:
+            # Once taken over (the common case while turning) a single dict probe is all the state work
+            if not self._takeover_active.get(param_key, False):
                 # Check if hardware value is close enough to take over
                 diff = abs(hardware_value - current_value_127)
                 if diff <= self._takeover_threshold:
@@ -1689,16 +2078,18 @@ class DeviceManager:
             
             # Update parameter value
             normalized_value = hardware_value / 127.0
-            param_range = param.max - param.min
-            new_value = param.min + (normalized_value * param_range)
+            param_min = param.min
+            new_value = param_min + (normalized_value * (param.max - param_min))
             param.value = new_value
             
             # Store the hardware value
             self._encoder_values[param_key] = hardware_value
             
-            self.c_surface.log_message(
-                f"🎹 Encoder T{track_idx}D{device_idx}P{param_idx}: {param.name} = {new_value:.2f}"
-            )
+            # Per-turn log only when parameter logging is on (fires on every encoder detent)
+            if LOG_PARAMETER_CHANGES:
+                self.c_surface.log_message(
+                    f"🎹 Encoder T{track_idx}D{device_idx}P{param_idx}: {param.name} = {new_value:.2f}"
+                )
             
         except Exception as e:
             self.c_surface.log_message(f"❌ Error handling encoder change: {e}")
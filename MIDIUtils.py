@@ -61,6 +61,7 @@ class SysExEncoder:
     """
     _sequence_number = 0
     _max_sequence = 127
+    _command_prefixes = {}  # command -> SYSEX_HEADER + (command,), built on first use
 
     @classmethod
     def _get_next_sequence(cls):
@@ -75,32 +76,33 @@ class SysExEncoder:
         length, payload, and checksum.
         """
         try:
-            message = list(SYSEX_HEADER)
-            message.append(command & 0x7F)
+            prefix = SysExEncoder._command_prefixes.get(command)
+            if prefix is None:
+                prefix = SYSEX_HEADER + (command & 0x7F,)
+                SysExEncoder._command_prefixes[command] = prefix
             
-            sequence = SysExEncoder._get_next_sequence()
-            message.append(sequence)
+            # Validate the payload in one pass (bytes() rejects non-ints and values outside 0-255)
+            try:
+                data = bytes(payload) if payload else b''
+            except (TypeError, ValueError):
+                data = None
+            if data is None or (data and max(data) > 127):
+                bad = next(b for b in payload if not (isinstance(b, int) and 0 <= b <= 127))
+                print(f"❌ Invalid 8-bit value in SysEx payload: {bad}. Command: 0x{command:02X}")
+                return None
             
-            payload_len = len(payload) if payload else 0
-            # Always encode payload length as 14-bit (MSB, LSB)
-            len_msb = (payload_len >> 7) & 0x7F
-            len_lsb = payload_len & 0x7F
-            message.extend([len_msb, len_lsb])
-
-            if payload:
-                for byte in payload:
-                    if not (0 <= byte <= 127):
-                        print(f"❌ Invalid 8-bit value in SysEx payload: {byte}. Command: 0x{command:02X}")
-                        return None
-                    message.append(byte)
+            sequence = SysExEncoder._get_next_sequence()
             
             checksum = (command & 0x7F) ^ sequence
-            if payload:
-                for byte in payload:
-                    checksum ^= byte
-            message.append(checksum & 0x7F)
+            for byte in data:
+                checksum ^= byte
             
-            message.append(SYSEX_END)
+            # Always encode payload length as 14-bit (MSB, LSB)
+            payload_len = len(data)
+            message = list(prefix)
+            message += (sequence, (payload_len >> 7) & 0x7F, payload_len & 0x7F)
+            message += data
+            message += (checksum & 0x7F, SYSEX_END)
             return message
         except Exception as e:
             print(f"❌ Error creating SysEx message: {e}")
@@ -222,6 +224,21 @@ class SysExEncoder:
         
         return SysExEncoder.create_sysex(CMD_PARAM_VALUE, payload)
 
+    @staticmethod
+    def encode_device_params(track, device, page, total_pages, indexes, values):
+        """
+        Encodes one page of device parameters from parallel index/value arrays.
+        Payload format: [track, device, page, total_pages, idx0, val0, idx1, val1, ...]
+        """
+        payload = bytearray(4 + 2 * len(indexes))
+        payload[0] = track & 0x7F
+        payload[1] = device & 0x7F
+        payload[2] = page & 0x7F
+        payload[3] = total_pages & 0x7F
+        payload[4::2] = indexes
+        payload[5::2] = values
+        return SysExEncoder.create_sysex(CMD_DEVICE_PARAMS, payload)
+
     @staticmethod
     def encode_transport(playing, beat, bar):
         """Encodes the main transport state."""
@@ -32,6 +32,7 @@ class MessageCoalescer:
         self._last_send_time = 0
         self._flush_timer = None
         self._frame_timer = None
+        self._batch_depth = 0  # > 0 while a batch holds back flushes
         
         # Message priorities
         self._priority_commands = {
@@ -139,9 +140,26 @@ class MessageCoalescer:
         key = f"{CMD_TRACK_COLOR}_T{track_idx}"
         self.queue_message(CMD_TRACK_COLOR, payload, priority_override=2, state_key=key)
     
+    def begin_batch(self):
+        """Hold back flushes until the matching end_batch() (calls may nest)"""
+        self._batch_depth += 1
+        if self._flush_timer:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+    
+    def end_batch(self):
+        """Close a batch; the outermost close flushes everything queued in one pass"""
+        self._batch_depth = max(0, self._batch_depth - 1)
+        if self._batch_depth == 0 and self._pending_messages:
+            self._schedule_flush()
+    
     def _schedule_flush(self):
         """Schedule message flush based on frame rate"""
         try:
+            # Batch in progress - end_batch() schedules the flush
+            if self._batch_depth:
+                return
+            
             current_time = time.time() * 1000
             
             # Cancel existing timer
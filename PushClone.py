@@ -296,8 +296,19 @@ class PushClone(ControlSurface):
         except Exception as e:
             self.log_message(f"❌ Error while establishing connection ({reason}): {e}")
     
-    def _send_sysex_command(self, command, payload, silent=False, priority=None):
-        """Send SysEx command to hardware"""
+    def update_display(self):
+        """Live display tick: flush coalesced grid updates"""
+        ControlSurface.update_display(self)
+        clip_manager = self._managers.get('clip')
+        if clip_manager and self._is_connected:
+            clip_manager.flush()
+
+    def _send_sysex_command(self, command, payload, silent=False, priority=None, state_key=None):
+        """Send SysEx command to hardware
+
+        state_key separates coalesced LED frames of the same command that target
+        different objects (defaults to the command itself)
+        """
         try:
             message = SysExEncoder.create_sysex(command, payload)
             if message:
@@ -336,7 +347,7 @@ class PushClone(ControlSurface):
                     # Use message coalescer for performance optimization
                     if self._message_coalescer and not priority:
                         # Queue message for coalescing (except high priority)
-                        self._message_coalescer.queue_message(command, payload)
+                        self._message_coalescer.queue_message(command, payload, state_key=state_key)
                     else:
                         # Send immediately for high priority or when coalescer unavailable
                         self._send_midi(tuple(message))
@@ -361,6 +372,16 @@ class PushClone(ControlSurface):
             if not silent:
                 self.log_message(f"❌ Error in SysEx command 0x{command:02X}: {e}")
     
+    def begin_batch(self):
+        """Start batching queued SysEx messages (flushed together on end_batch)"""
+        if self._message_coalescer:
+            self._message_coalescer.begin_batch()
+    
+    def end_batch(self):
+        """Finish batching and flush queued SysEx messages in one pass"""
+        if self._message_coalescer:
+            self._message_coalescer.end_batch()
+    
     def _send_sysex_command_silent(self, command, payload):
         """Send SysEx command silently (no logging)"""
         self._send_sysex_command(command, payload, silent=True)
@@ -584,7 +605,7 @@ class PushClone(ControlSurface):
             self._managers['song'].send_complete_state()
             self._managers['transport'].send_complete_state()
             self._managers['track'].send_complete_state()
-            self._managers['clip'].send_complete_state()
+            self._managers['clip'].send_complete_state(force=True)
             self._managers['device'].send_complete_state()
             self._managers['browser'].send_complete_state()
             self._managers['automation'].send_complete_state()
@@ -969,7 +990,7 @@ class PushClone(ControlSurface):
         """Send view-specific state"""
         try:
             if view_id == 0:  # Clip view
-                self._managers['clip'].send_complete_state()
+                self._managers['clip'].send_complete_state(force=True)
             elif view_id == 1:  # Mixer view
                 self._managers['track'].send_complete_state()
             elif view_id == 2:  # Device view
@@ -139,6 +139,7 @@ CMD_CLIP_LOOP_START = 0x93      # Clip loop start position (bidirectional)
 CMD_CLIP_LOOP_END = 0x94        # Clip loop end position (bidirectional)
 CMD_CLIP_LENGTH = 0x95          # Clip length in beats (Live → Hardware)
 CMD_CLIP_IS_RECORDING = 0x96    # ClipSlot recording state (Live → Hardware)
+CMD_DRUM_PAD_STATES = 0x9D      # First 16 drum pad states in one frame (Live → Hardware)
 
 # ========================================
 # GRID, GROOVE & QUANTIZATION (0x60-0x6F)
@@ -303,6 +304,7 @@ LOG_LISTENER_EVENTS = True # Enable for debugging
 LOG_VIEW_SWITCHES = True
 LOG_PARAMETER_CHANGES = True
 ENABLE_CPU_USAGE_STREAM = False  # Disable CPU usage SysEx until firmware supports it reliably
+ENABLE_DRUM_PAD_STATES_BULK = False  # Send CMD_DRUM_PAD_STATES instead of 16 CMD_DRUM_PAD_STATE frames once firmware parses it
 LOG_SONG_POSITION_UPDATES = False
 
 # ========================================